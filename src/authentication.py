@@ -16,16 +16,30 @@ But then the frontend needs to make sure that the permissions are up-to-date. Ev
 should therefor request a new token every X minutes. This is not needed when the back-end
 performs a separate authorization request. The only downside is the overhead of the additional
 keycloak requests - if that becomes prohibitive in the future, we should reevaluate this design.
+
+To limit this overhead, the backend first verifies the signature, issuer and expiry of the token
+locally, using the (cached) public keys of the realm, so that invalid tokens (including tokens of
+other realms) are rejected without an authorization request. The result of the authorization
+request is then cached per token, for at most `userinfo_cache_ttl_seconds` (see config.toml) and
+never beyond the expiry of the token. This means that a change in permissions can take up to this
+TTL to become effective. Remaining requests to Keycloak are executed in a worker thread, so that
+they do not block the event loop.
 """
 
 
+import hashlib
 import logging
 import os
+import threading
+import time
+from collections import OrderedDict
 
 from dotenv import load_dotenv
 from fastapi import HTTPException, Security, status
 from fastapi.security import OpenIdConnect
+from jose import jwt, JWTError
 from keycloak import KeycloakOpenID, KeycloakError
+from starlette.concurrency import run_in_threadpool
 
 from config import KEYCLOAK_CONFIG
 
@@ -45,6 +59,125 @@ keycloak_openid = KeycloakOpenID(
 )
 
 
+class TokenValidator:
+    """
+    Validates access tokens, returning the userinfo. The userinfo is cached per (hash of the)
+    token, and the public keys of the realm (JWKS) are cached to verify JWTs locally.
+    """
+
+    def __init__(
+        self,
+        issuer: str,
+        ttl_seconds: float = 60,
+        max_size: int = 10000,
+        jwks_refresh_interval_seconds: float = 60,
+    ):
+        self.issuer = issuer
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self.jwks_refresh_interval_seconds = jwks_refresh_interval_seconds
+        self._userinfo: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._jwks: dict | None = None
+        self._jwks_fetched_at = 0.0
+        self._lock = threading.Lock()
+
+    async def userinfo(self, token: str) -> dict:
+        """
+        Return the userinfo of this token. Raises a JWTError if the token is invalid or expired,
+        and a KeycloakError if Keycloak rejects the token.
+        """
+        key = hashlib.sha256(token.encode("utf-8")).hexdigest()
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+        expiry = time.time() + self.ttl_seconds
+        if _is_jwt(token):
+            claims = await self._verify(token)
+            if "exp" in claims:
+                expiry = min(expiry, claims["exp"])
+        # Perform a request to keycloak
+        userinfo = await run_in_threadpool(keycloak_openid.userinfo, token)
+        self._set(key, expiry, userinfo)
+        return userinfo
+
+    async def _verify(self, token: str) -> dict:
+        """Verify the signature, issuer and expiry of the JWT, returning its claims."""
+        kid = jwt.get_unverified_header(token).get("kid")
+        jwks = await self._get_jwks(kid)
+        # The audience is not verified: the token is issued to the frontend client
+        return jwt.decode(
+            token,
+            jwks,
+            algorithms=[k["alg"] for k in jwks["keys"] if "alg" in k] or ["RS256"],
+            issuer=self.issuer,
+            options={"verify_aud": False},
+        )
+
+    async def _get_jwks(self, kid: str | None) -> dict:
+        """
+        Return the cached JWKS of the realm. It is fetched again if the key id of a token is
+        unknown (e.g. after a key rotation), but at most once every refresh interval.
+        """
+        with self._lock:
+            jwks, fetched_at = self._jwks, self._jwks_fetched_at
+        known = jwks is not None and any(k.get("kid") == kid for k in jwks["keys"])
+        may_refresh = time.monotonic() - fetched_at >= self.jwks_refresh_interval_seconds
+        if jwks is None or (not known and may_refresh):
+            jwks = await run_in_threadpool(keycloak_openid.certs)
+            with self._lock:
+                self._jwks, self._jwks_fetched_at = jwks, time.monotonic()
+        return jwks  # type: ignore
+
+    def _get(self, key: str) -> dict | None:
+        with self._lock:
+            entry = self._userinfo.get(key)
+            if entry is None:
+                return None
+            expiry, userinfo = entry
+            if time.time() >= expiry:
+                del self._userinfo[key]
+                return None
+            self._userinfo.move_to_end(key)
+            return userinfo
+
+    def _set(self, key: str, expiry: float, userinfo: dict):
+        with self._lock:
+            self._userinfo[key] = (expiry, userinfo)
+            self._userinfo.move_to_end(key)
+            while len(self._userinfo) > self.max_size:
+                self._userinfo.popitem(last=False)
+
+    def clear(self):
+        """Remove the cached userinfo and JWKS."""
+        with self._lock:
+            self._userinfo.clear()
+            self._jwks = None
+            self._jwks_fetched_at = 0.0
+
+
+def _is_jwt(token: str) -> bool:
+    """Keycloak issues JWTs, but opaque tokens are left to Keycloak to validate."""
+    return token.count(".") == 2
+
+
+def _issuer() -> str:
+    """
+    The issuer (iss claim) of the tokens of the realm. It can be configured if the public url of
+    Keycloak, used by the frontend to obtain tokens, differs from the server_url.
+    """
+    if "issuer" in KEYCLOAK_CONFIG:
+        return KEYCLOAK_CONFIG["issuer"]
+    server_url = KEYCLOAK_CONFIG.get("server_url", "").rstrip("/")
+    return f"{server_url}/realms/{KEYCLOAK_CONFIG.get('realm')}"
+
+
+token_validator = TokenValidator(
+    issuer=_issuer(),
+    ttl_seconds=KEYCLOAK_CONFIG.get("userinfo_cache_ttl_seconds", 60),
+    max_size=KEYCLOAK_CONFIG.get("userinfo_cache_max_size", 10000),
+)
+
+
 async def get_current_user(token=Security(oidc)) -> dict:
     if not client_secret:
         raise HTTPException(
@@ -61,7 +194,13 @@ async def get_current_user(token=Security(oidc)) -> dict:
         )
     try:
         token = token.replace("Bearer ", "")
-        return keycloak_openid.userinfo(token)  # perform a request to keycloak
+        return await token_validator.userinfo(token)
+    except JWTError as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=f"Invalid authentication token: '{e}'",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     except KeycloakError as e:
         logging.error(f"Error while checking the access token: '{e}'")
         error_msg = e.error_message
@@ -3,8 +3,10 @@ from typing import Generic, TypeVar, Iterator
 
 from sqlmodel import SQLModel
 
+from connectors.fetch_failure import FetchFailure
 from connectors.resource_with_relations import ResourceWithRelations
 from database.model.platform.platform_names import PlatformName
+from database.model.sync_state import SyncState
 
 
 RESOURCE = TypeVar("RESOURCE", bound=SQLModel)
@@ -32,3 +34,26 @@ class ResourceConnector(abc.ABC, Generic[RESOURCE]):
     ) -> Iterator[SQLModel | ResourceWithRelations[SQLModel]]:
         """Retrieve information of all resources"""
         pass
+
+    def fetch_since(
+        self, state: SyncState, limit: int | None = None
+    ) -> Iterator[SQLModel | ResourceWithRelations[SQLModel] | FetchFailure]:
+        """
+        Retrieve information of the resources that changed since the last run, as recorded in
+        the state. While fetching, the connector should update the state (e.g. the resumption
+        token), so that an interrupted run can be resumed. The state is persisted after each
+        batch of resources that has been stored.
+
+        A resource that cannot be fetched should be yielded as FetchFailure if the connector
+        would otherwise move past it. It is then added to the failed_identifiers of the state,
+        which the connector should fetch again on the next run.
+
+        On default, all resources are retrieved. Connectors of platforms that support
+        incremental harvesting should override this method.
+        """
+        return self.fetch_all(limit=limit)
+
+    @property
+    def sync_state_key(self) -> str:
+        """The identifier of the SyncState of this connector"""
+        return f"{self.platform_name.value}/{self.resource_class.__tablename__}"
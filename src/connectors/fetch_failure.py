@@ -0,0 +1,13 @@
+import dataclasses
+
+
+@dataclasses.dataclass
+class FetchFailure:
+    """
+    A resource that could not be fetched. Connectors that fetch resources one by one can yield
+    this from `fetch_since` instead of skipping the resource, so that it is counted as failed and
+    recorded in the SyncState, to be fetched again on the next run.
+    """
+
+    platform_identifier: str
+    error: str
@@ -0,0 +1,124 @@
+"""
+HTTP utilities for the connectors, to fetch many resources from a platform efficiently.
+
+The connectors often need one or more requests per resource. To keep the synchronization of
+large platforms fast, the requests are performed concurrently by a bounded number of threads,
+sharing a session with pooled keep-alive connections. To be a good citizen towards the
+platforms, the requests per host are rate limited, and requests that fail because of rate
+limiting (429) or server errors (5xx) are retried with an exponential backoff.
+"""
+import collections
+import concurrent.futures
+import threading
+import time
+from typing import Callable, Iterable, Iterator, TypeVar
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+from config import CONNECTOR_CONFIG
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class RateLimiter:
+    """Allows at most `requests_per_second` calls of `wait` per second, for each key."""
+
+    def __init__(self, requests_per_second: float | None):
+        self.interval = 1 / requests_per_second if requests_per_second else 0.0
+        self._next: dict[str, float] = collections.defaultdict(float)
+        self._lock = threading.Lock()
+
+    def wait(self, key: str):
+        if self.interval == 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            moment = max(now, self._next[key])
+            self._next[key] = moment + self.interval
+        if moment > now:
+            time.sleep(moment - now)
+
+
+class RateLimitedSession(requests.Session):
+    """
+    A requests.Session that can be shared between threads, with a connection pool of
+    `pool_size`, a rate limit per host, and retries with exponential backoff on 429 and 5xx
+    responses (respecting the Retry-After header).
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        requests_per_second: float | None = None,
+        retries: int = 5,
+        backoff_factor: float = 0.5,
+    ):
+        super().__init__()
+        self.rate_limiter = RateLimiter(requests_per_second)
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=["GET", "HEAD"],
+            raise_on_status=False,  # Returning the last response, so that callers can handle it
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+    def request(self, method, url, *args, **kwargs):
+        self.rate_limiter.wait(urlparse(url).netloc)
+        return super().request(method, url, *args, **kwargs)
+
+
+def session_from_config(concurrency: int) -> RateLimitedSession:
+    """A session as configured in the [connectors] section of the config.toml"""
+    return RateLimitedSession(
+        pool_size=concurrency,
+        requests_per_second=CONNECTOR_CONFIG.get("requests_per_second"),
+        retries=CONNECTOR_CONFIG.get("retries", 5),
+        backoff_factor=CONNECTOR_CONFIG.get("backoff_factor", 0.5),
+    )
+
+
+def map_concurrently(
+    func: Callable[[T], R], items: Iterable[T], concurrency: int, ordered: bool = True
+) -> Iterator[tuple[T, "concurrent.futures.Future[R]"]]:
+    """
+    Apply func to the items using `concurrency` threads, yielding the items with their
+    (completed) futures. The items are consumed lazily: at most 2 * concurrency items are in
+    progress, so that the results can be streamed.
+
+    If ordered, the results are yielded in the order of the items. Otherwise, they are yielded
+    as soon as they are completed, so that a single slow item does not hold back the others.
+    """
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=concurrency)
+    in_progress: dict["concurrent.futures.Future[R]", T] = {}  # insertion ordered
+
+    def next_completed() -> tuple[T, "concurrent.futures.Future[R]"]:
+        if ordered:
+            future = next(iter(in_progress))
+            concurrent.futures.wait([future])
+        else:
+            done, _ = concurrent.futures.wait(
+                in_progress, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            future = next(f for f in in_progress if f in done)
+        return in_progress.pop(future), future
+
+    try:
+        for item in items:
+            in_progress[executor.submit(func, item)] = item
+            if len(in_progress) >= 2 * concurrency:
+                yield next_completed()
+        while in_progress:
+            yield next_completed()
+    finally:
+        # If the consumer stops early, the requests that have not started are cancelled
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -1,13 +1,16 @@
 import itertools
 import logging
+import shelve
+import threading
 import typing
 
 import bibtexparser
 import datasets
 import dateutil.parser
-import requests
 
+from config import CONNECTOR_CONFIG
 from connectors import ResourceConnector
+from connectors.http import map_concurrently, session_from_config
 from connectors.resource_with_relations import ResourceWithRelations
 from database.model.dataset.data_download import DataDownload
 from database.model.dataset.dataset import Dataset
@@ -16,7 +19,79 @@ from database.model.resource import resource_create
 from database.model.platform.platform_names import PlatformName
 
 
+class ParquetInfoCache:
+    """
+    The parquet info of the datasets, keyed by the lastModified of the dataset, so that the
+    parquet info of unchanged datasets does not need to be requested again on the next
+    synchronization. Thread-safe.
+
+    By default the cache is kept in memory. If a path is given, it is persisted to disk using
+    shelve, so that it survives restarts. The shelf is opened when it is first used, synced after
+    every write, and closed by `close` or when leaving the cache as context manager. It is
+    opened again when it is used after being closed.
+    """
+
+    def __init__(self, path: str | None = None):
+        self.path = path
+        self._lock = threading.Lock()
+        self._memory: dict[str, tuple[str, list[dict]]] = {}
+        self._shelf: shelve.Shelf | None = None
+
+    def __enter__(self) -> "ParquetInfoCache":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def get(self, dataset_id: str, last_modified: str) -> list[dict] | None:
+        with self._lock:
+            entry = self._entries().get(dataset_id)
+        if entry is not None and entry[0] == last_modified:
+            return entry[1]
+        return None
+
+    def set(self, dataset_id: str, last_modified: str, parquet_info: list[dict]):
+        with self._lock:
+            self._entries()[dataset_id] = (last_modified, parquet_info)
+            if self._shelf is not None:
+                self._shelf.sync()
+
+    def close(self):
+        with self._lock:
+            if self._shelf is not None:
+                self._shelf.close()
+                self._shelf = None
+
+    def _entries(self) -> typing.MutableMapping[str, tuple[str, list[dict]]]:
+        """The entries, opening the shelf if needed. Should be called holding the lock."""
+        if self.path is None:
+            return self._memory
+        if self._shelf is None:
+            self._shelf = shelve.open(self.path)
+        return self._shelf
+
+
 class HuggingFaceDatasetConnector(ResourceConnector[Dataset]):
+    """
+    Fetches the datasets of HuggingFace. The listing of the datasets is pipelined with
+    `concurrency` concurrent requests of the parquet info of the datasets. If `ordered`, the
+    datasets are returned in the order of the listing, otherwise in the order in which their
+    parquet info is retrieved.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = CONNECTOR_CONFIG.get("concurrency", 8),
+        ordered: bool = True,
+        parquet_cache: ParquetInfoCache | None = None,
+    ):
+        self.concurrency = concurrency
+        self.ordered = ordered
+        self.session = session_from_config(concurrency)
+        self.parquet_cache = parquet_cache or ParquetInfoCache(
+            CONNECTOR_CONFIG.get("huggingface_parquet_cache_path")
+        )
+
     @property
     def resource_class(self) -> type[Dataset]:
         return Dataset
@@ -25,12 +100,11 @@ class HuggingFaceDatasetConnector(ResourceConnector[Dataset]):
     def platform_name(self) -> PlatformName:
         return PlatformName.huggingface
 
-    @staticmethod
-    def _get(url: str, dataset_id: str) -> typing.List[typing.Dict[str, typing.Any]]:
+    def _get(self, url: str, dataset_id: str) -> typing.List[typing.Dict[str, typing.Any]]:
         """
         Perform a GET request and raise an exception if the response code is not OK.
         """
-        response = requests.get(url, params={"dataset": dataset_id})
+        response = self.session.get(url, params={"dataset": dataset_id})
         response_json = response.json()
         if not response.ok:
             msg = response_json["error"]
@@ -40,12 +114,34 @@ class HuggingFaceDatasetConnector(ResourceConnector[Dataset]):
             return []
         return response_json["parquet_files"]
 
+    def _parquet_info(self, dataset) -> typing.List[typing.Dict[str, typing.Any]]:
+        parquet_info = self.parquet_cache.get(dataset.id, dataset.lastModified)
+        if parquet_info is None:
+            parquet_info = self._get(
+                url="https://datasets-server.huggingface.co/parquet",
+                dataset_id=dataset.id,
+            )
+            # Errors are not cached, so that they are retried on the next synchronization
+            if len(parquet_info) > 0:
+                self.parquet_cache.set(dataset.id, dataset.lastModified, parquet_info)
+        return parquet_info
+
     def fetch_all(
         self, limit: int | None = None
     ) -> typing.Iterator[ResourceWithRelations[Dataset]]:
+        with self.parquet_cache:
+            yield from self._fetch_all(limit)
+
+    def _fetch_all(self, limit: int | None) -> typing.Iterator[ResourceWithRelations[Dataset]]:
         pydantic_class = resource_create(Dataset)
         pydantic_class_publication = resource_create(Publication)
-        for dataset in itertools.islice(datasets.list_datasets(with_details=True), limit):
+        results = map_concurrently(
+            self._parquet_info,
+            itertools.islice(datasets.list_datasets(with_details=True), limit),
+            concurrency=self.concurrency,
+            ordered=self.ordered,
+        )
+        for dataset, parquet_info_future in results:
             try:
                 citations = []
                 if dataset.citation is not None:
@@ -76,10 +172,7 @@ class HuggingFaceDatasetConnector(ResourceConnector[Dataset]):
                             f"{dataset.id} in {dataset.citation}: {len(parsed_citations)}"
                         )
 
-                parquet_info = HuggingFaceDatasetConnector._get(
-                    url="https://datasets-server.huggingface.co/parquet",
-                    dataset_id=dataset.id,
-                )
+                parquet_info = parquet_info_future.result()
                 distributions = [
                     DataDownload(
                         name=pq_file["filename"],
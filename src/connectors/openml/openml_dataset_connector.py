@@ -2,22 +2,38 @@
 This module knows how to load an OpenML object based on its AIoD implementation,
 and how to convert the OpenML response to some agreed AIoD format.
 """
+import itertools
 import logging
 from typing import Iterator
 
 import dateutil.parser
-import requests
 from fastapi import HTTPException
 from sqlmodel import SQLModel
 
+from config import CONNECTOR_CONFIG
 from connectors.abstract.resource_connector import ResourceConnector
+from connectors.fetch_failure import FetchFailure
+from connectors.http import map_concurrently, session_from_config
 from database.model.dataset.data_download import DataDownload
 from database.model.dataset.dataset import Dataset
 from database.model.resource import resource_create
 from database.model.platform.platform_names import PlatformName
+from database.model.sync_state import SyncState
+
+LIST_PAGE_SIZE = 10000
+NO_RESULTS_CODE = "372"  # The error code of OpenML if a list is empty
 
 
 class OpenMlDatasetConnector(ResourceConnector[Dataset]):
+    """
+    Fetches the datasets of OpenML. Every dataset requires two requests (the description and the
+    qualities), so `concurrency` datasets are fetched concurrently.
+    """
+
+    def __init__(self, concurrency: int = CONNECTOR_CONFIG.get("concurrency", 8)):
+        self.concurrency = concurrency
+        self.session = session_from_config(concurrency)
+
     @property
     def resource_class(self) -> type[Dataset]:
         return Dataset
@@ -28,7 +44,7 @@ class OpenMlDatasetConnector(ResourceConnector[Dataset]):
 
     def fetch(self, platform_identifier: str) -> SQLModel:
         url_data = f"https://www.openml.org/api/v1/json/data/{platform_identifier}"
-        response = requests.get(url_data)
+        response = self.session.get(url_data)
         if not response.ok:
             code = response.status_code
             if code == 412 and response.json()["error"]["message"] == "Unknown dataset":
@@ -43,7 +59,7 @@ class OpenMlDatasetConnector(ResourceConnector[Dataset]):
         # Here we can format the response into some standardized way, maybe this includes some
         # dataset characteristics. These need to be retrieved separately from OpenML:
         url_qual = f"https://www.openml.org/api/v1/json/data/qualities/{platform_identifier}"
-        response = requests.get(url_qual)
+        response = self.session.get(url_qual)
         if not response.ok:
             msg = response.json()["error"]["message"]
             raise HTTPException(
@@ -85,21 +101,64 @@ class OpenMlDatasetConnector(ResourceConnector[Dataset]):
         url = "https://www.openml.org/api/v1/json/data/list"
         if limit is not None:
             url = f"{url}/limit/{limit}"
-        response = requests.get(url)
+        dids = (str(dataset_json["did"]) for dataset_json in self._fetch_list(url))
+        for did, future in map_concurrently(self.fetch, dids, self.concurrency):
+            try:
+                yield future.result()
+            except Exception as e:
+                logging.error(f"Error while fetching openml  dataset {did}: '{str(e)}'")
+
+    def fetch_since(
+        self, state: SyncState, limit: int | None = None
+    ) -> Iterator[SQLModel | FetchFailure]:
+        """
+        OpenML cannot list the datasets changed since a moment, but the identifiers (dids) are
+        increasing. Only the datasets with a did higher than the last fetched did are fetched, so
+        that new datasets are added without fetching the details of all datasets again. The
+        datasets that failed in a previous run are fetched again first.
+        """
+        last_did = max((int(i) for i in state.last_identifiers), default=0)
+        retried = list(state.failed_identifiers or [])
+        dids = itertools.islice(itertools.chain(retried, self._new_dids(last_did)), limit)
+        for did, future in map_concurrently(self.fetch, dids, self.concurrency):
+            if int(did) > last_did:
+                # Updating the state before yielding, so that it is stored together with this
+                # dataset, or with its failure
+                state.last_identifiers = [did]
+            try:
+                dataset = future.result()
+            except Exception as e:
+                logging.error(f"Error while fetching openml dataset {did}: '{str(e)}'")
+                yield FetchFailure(platform_identifier=did, error=str(e))
+                continue
+            yield dataset
+
+    def _new_dids(self, last_did: int) -> Iterator[str]:
+        """The dids higher than last_did, listing the datasets page by page"""
+        url = "https://www.openml.org/api/v1/json/data/list"
+        offset = 0
+        while True:
+            datasets_json = self._fetch_list(f"{url}/limit/{LIST_PAGE_SIZE}/offset/{offset}")
+            for dataset_json in datasets_json:
+                if int(dataset_json["did"]) > last_did:
+                    yield str(dataset_json["did"])
+            if len(datasets_json) < LIST_PAGE_SIZE:
+                return
+            offset += LIST_PAGE_SIZE
+
+    def _fetch_list(self, url: str) -> list[dict]:
+        """Return the datasets of the list url, or an empty list if there are no results"""
+        response = self.session.get(url)
         response_json = response.json()
         if not response.ok:
+            if response_json["error"]["code"] == NO_RESULTS_CODE:
+                return []
             msg = response_json["error"]["message"]
             raise HTTPException(
                 status_code=response.status_code,
                 detail=f"Error while fetching data list from OpenML: '{msg}'.",
             )
-        for dataset_json in response_json["data"]["dataset"]:
-            try:
-                yield self.fetch(dataset_json["did"])
-            except Exception as e:
-                logging.error(
-                    f"Error while fetching openml  dataset {dataset_json['did']}: '{str(e)}'"
-                )
+        return response_json["data"]["dataset"]
 
 
 def _as_int(v: str) -> int:
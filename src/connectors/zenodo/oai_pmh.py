@@ -0,0 +1,129 @@
+"""
+A streaming parser for OAI-PMH ListRecords responses in the oai_datacite format.
+
+The response is parsed incrementally while it is downloaded, using lxml.etree.iterparse. Only
+a single record is kept in memory at the same time, and only the DataCite fields that are used
+by the ZenodoDatasetConnector are extracted. Records of other resource types than the requested
+one are skipped before extracting anything.
+"""
+import dataclasses
+from typing import IO, Iterator
+
+from lxml import etree
+
+OAI_NAMESPACE = "{http://www.openarchives.org/OAI/2.0/}"
+
+
+class OaiPmhError(Exception):
+    """An error returned by the OAI-PMH server, such as badResumptionToken"""
+
+    def __init__(self, code: str, message: str):
+        super().__init__(f"{code}: {message}")
+        self.code = code
+
+
+@dataclasses.dataclass
+class DataciteRecord:
+    identifier: str
+    resource_type: str | None = None
+    creators: list[str] = dataclasses.field(default_factory=list)
+    titles: list[str] = dataclasses.field(default_factory=list)
+    descriptions: list[tuple[str | None, str]] = dataclasses.field(default_factory=list)
+    dates: list[tuple[str | None, str]] = dataclasses.field(default_factory=list)
+    publisher: str | None = None
+    rights_uris: list[str | None] = dataclasses.field(default_factory=list)
+    subjects: list[str] = dataclasses.field(default_factory=list)
+
+
+def _local_name(element: etree._Element) -> str:
+    # The DataCite namespace differs per kernel version (kernel-3, kernel-4), so the namespaces
+    # are ignored within the resource
+    return element.tag.rpartition("}")[2]
+
+
+def _elements(element: etree._Element) -> Iterator[etree._Element]:
+    """The child elements, skipping comments and processing instructions"""
+    return element.iterchildren(etree.Element)
+
+
+def _text(element: etree._Element) -> str:
+    return "".join(element.itertext()).strip()
+
+
+class ListRecordsPage:
+    """
+    A single page of a ListRecords response. Iterating over it yields the DataciteRecords of
+    the given resource_type (or all records, if resource_type is None). After the iteration,
+    the resumption_token holds the token of the next page, or None if this was the last page.
+    Deleted records are skipped.
+    """
+
+    def __init__(self, source: IO[bytes], resource_type: str | None = None):
+        self.source = source
+        self.resource_type = resource_type
+        self.resumption_token: str | None = None
+        self.n_records = 0
+
+    def __iter__(self) -> Iterator[DataciteRecord]:
+        tags = [f"{OAI_NAMESPACE}{tag}" for tag in ("record", "resumptionToken", "error")]
+        for _, element in etree.iterparse(self.source, events=("end",), tag=tags, recover=True):
+            if element.tag == f"{OAI_NAMESPACE}record":
+                self.n_records += 1
+                record = self._parse_record(element)
+                if record is not None:
+                    yield record
+                # Free the memory of the records that have been processed
+                element.clear()
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+            elif element.tag == f"{OAI_NAMESPACE}resumptionToken":
+                self.resumption_token = element.text or None
+            else:
+                raise OaiPmhError(element.get("code"), element.text or "")
+
+    def _parse_record(self, element: etree._Element) -> DataciteRecord | None:
+        header = element.find(f"{OAI_NAMESPACE}header")
+        if header is None or header.get("status") == "deleted":
+            return None
+        identifier = header.findtext(f"{OAI_NAMESPACE}identifier").removeprefix("oai:")
+        resource = element.find(f"{OAI_NAMESPACE}metadata/*/*/*")  # oai_datacite/payload/resource
+        if resource is None:
+            return None
+        resource_type_element = resource.find("{*}resourceType")
+        resource_type = (
+            resource_type_element.get("resourceTypeGeneral")
+            if resource_type_element is not None
+            else None
+        )
+        if self.resource_type is not None and resource_type != self.resource_type:
+            return None
+
+        children = {_local_name(child): child for child in _elements(resource)}
+        record = DataciteRecord(identifier=identifier, resource_type=resource_type)
+        if "creators" in children:
+            record.creators = [_text(name) for name in children["creators"].iter("{*}creatorName")]
+        if "titles" in children:
+            record.titles = [_text(title) for title in _elements(children["titles"])]
+        if "descriptions" in children:
+            record.descriptions = [
+                (description.get("descriptionType"), _text(description))
+                for description in _elements(children["descriptions"])
+            ]
+        if "dates" in children:
+            record.dates = [
+                (date.get("dateType"), _text(date)) for date in _elements(children["dates"])
+            ]
+        if "publisher" in children:
+            record.publisher = _text(children["publisher"])
+        if "rightsList" in children:
+            record.rights_uris = [
+                rights.get("rightsURI") for rights in _elements(children["rightsList"])
+            ]
+        if "subjects" in children:
+            # Subjects with a scheme (e.g. a classification code) are not used as keywords
+            record.subjects = [
+                _text(subject)
+                for subject in _elements(children["subjects"])
+                if len(subject.attrib) == 0
+            ]
+        return record
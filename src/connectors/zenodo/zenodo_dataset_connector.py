@@ -1,19 +1,32 @@
 from datetime import datetime
 import logging
 from typing import Iterator
-from sickle import Sickle
-import xmltodict
 
 from connectors import ResourceConnector
+from connectors.http import session_from_config
+from connectors.zenodo.oai_pmh import DataciteRecord, ListRecordsPage, OaiPmhError
 from database.model.dataset.dataset import Dataset
 from database.model.general.keyword import Keyword
 from database.model.general.license import License
 from database.model.platform.platform_names import PlatformName
+from database.model.sync_state import SyncState
 
 DATE_FORMAT = "%Y-%m-%d"
+OAI_PMH_URL = "https://zenodo.org/oai2d"
+# OAI-PMH accepts only "YYYY-MM-DD" or "YYYY-MM-DDThh:mm:ssZ" (UTC), Zenodo has a granularity of
+# seconds
+OAI_PMH_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
 
 
 class ZenodoDatasetConnector(ResourceConnector[Dataset]):
+    """
+    Harvests the datasets of Zenodo using OAI-PMH. The ListRecords pages are parsed while they
+    are downloaded, see connectors.zenodo.oai_pmh.
+    """
+
+    def __init__(self):
+        self.session = session_from_config(concurrency=1)
+
     @property
     def resource_class(self) -> type[Dataset]:
         return Dataset
@@ -22,85 +35,48 @@ class ZenodoDatasetConnector(ResourceConnector[Dataset]):
     def platform_name(self) -> PlatformName:
         return PlatformName.zenodo
 
-    def _get_record_dictionary(self, record):
-        xml_string = record.raw
-        xml_dict = xmltodict.parse(xml_string)
-        id = xml_dict["record"]["header"]["identifier"]
-        if id.startswith("oai:"):
-            id = id.replace("oai:", "")
-        resource = xml_dict["record"]["metadata"]["oai_datacite"]["payload"]["resource"]
-        return id, resource
-
     def _bad_record_format(self, dataset_id, field):
         logging.error(
             f"Error while fetching record info for dataset {dataset_id}: bad format {field}"
         )
 
-    def _dataset_from_record(self, record_raw) -> Dataset | None:
-        id_, record = self._get_record_dictionary(record_raw)
-        if isinstance(record["creators"]["creator"], list):
-            creators_list = [item["creatorName"] for item in record["creators"]["creator"]]
-            creator = "; ".join(creators_list)  # TODO change field to an array
-        elif isinstance(record["creators"]["creator"]["creatorName"], str):
-            creator = record["creators"]["creator"]["creatorName"]
-        else:
+    def _dataset_from_record(self, record: DataciteRecord) -> Dataset | None:
+        id_ = record.identifier
+        if len(record.creators) == 0:
             self._bad_record_format(id_, "creator")
             return None
+        creator = "; ".join(record.creators)  # TODO change field to an array
 
-        if isinstance(record["titles"]["title"], str):
-            title = record["titles"]["title"]
-        else:
+        if len(record.titles) != 1:
             self._bad_record_format(id_, "title")
             return None
+        (title,) = record.titles
         number_str = id_.rsplit("/", 1)[-1]
         idNumber = "".join(filter(str.isdigit, number_str))
         same_as = f"https://zenodo.org/api/records/{idNumber}"
 
-        description_raw = record["descriptions"]["description"]
-        if isinstance(description_raw, list):
-            (description,) = [
-                e.get("#text") for e in description_raw if e.get("@descriptionType") == "Abstract"
-            ]
-        elif description_raw["@descriptionType"] == "Abstract":
-            description = description_raw["#text"]
-        else:
+        abstracts = [text for type_, text in record.descriptions if type_ == "Abstract"]
+        if len(abstracts) != 1:
             self._bad_record_format(id_, "description")
             return None
+        (description,) = abstracts
 
-        date_published = None
-        date_raw = record["dates"]["date"]
-        if isinstance(date_raw, list):
-            (description,) = [e.get("#text") for e in date_raw if e.get("@dateType") == "Issued"]
-        elif date_raw["@dateType"] == "Issued":
-            date_string = date_raw["#text"]
-            date_published = datetime.strptime(date_string, DATE_FORMAT)
-        else:
+        issued = [text for type_, text in record.dates if type_ == "Issued"]
+        if len(issued) != 1:
             self._bad_record_format(id_, "date_published")
             return None
+        date_published = datetime.strptime(issued[0], DATE_FORMAT)
 
-        if isinstance(record["publisher"], str):
-            publisher = record["publisher"]
-        else:
+        if record.publisher is None:
             self._bad_record_format(id_, "publisher")
             return None
+        publisher = record.publisher
 
-        if isinstance(record["rightsList"]["rights"], list):
-            license_ = record["rightsList"]["rights"][0]["@rightsURI"]
-        elif isinstance(record["rightsList"]["rights"]["@rightsURI"], str):
-            license_ = record["rightsList"]["rights"]["@rightsURI"]
-        else:
+        if len(record.rights_uris) == 0 or record.rights_uris[0] is None:
             self._bad_record_format(id_, "license")
             return None
-
-        keywords = []
-        if "subjects" in record:
-            if isinstance(record["subjects"]["subject"], str):
-                keywords = [record["subjects"]["subject"]]
-            elif isinstance(record["subjects"]["subject"], list):
-                keywords = [item for item in record["subjects"]["subject"] if isinstance(item, str)]
-            else:
-                self._bad_record_format(id_, "keywords")
-                return None
+        license_ = record.rights_uris[0]
+        keywords = record.subjects
 
         dataset = Dataset(
             platform="zenodo",
@@ -118,41 +94,64 @@ class ZenodoDatasetConnector(ResourceConnector[Dataset]):
         )
         return dataset
 
-    def _get_resource_type(self, record):
-        xml_string = record.raw
-        start = xml_string.find('<resourceType resourceTypeGeneral="')
-        if start != -1:
-            start += len('<resourceType resourceTypeGeneral="')
-            end = xml_string.find('"', start)
-            if end != -1:
-                return xml_string[start:end]
-        id_, _ = self._get_record_dictionary(record)
-        logging.error(f"Error while getting the resource type of the record {id_}")
-        return None
+    def _list_records(self, params: dict[str, str]) -> ListRecordsPage:
+        response = self.session.get(OAI_PMH_URL, params=params, stream=True)
+        response.raise_for_status()
+        response.raw.decode_content = True
+        return ListRecordsPage(response.raw, resource_type="Dataset")
 
     def _retrieve_dataset_from_datetime(
         self,
-        sk: Sickle,
         dt: datetime,
         limit: int | None = None,
+        state: SyncState | None = None,
     ) -> Iterator[Dataset]:
-        records = sk.ListRecords(
-            **{
-                "metadataPrefix": "oai_datacite",
-                "from": dt.isoformat(),
-            }
-        )
+        # The resumption token with which the current page is requested
+        token = state.resumption_token if state is not None else None
         counter = 0
-        record = next(records, None)
-        while record and (limit is None or counter < limit):
-            if self._get_resource_type(record) == "Dataset":
-                dataset = self._dataset_from_record(record)
-                if dataset is not None:
-                    counter += 1
-                    yield dataset
-            record = next(records, None)
+        while True:
+            if token is None:
+                params = {
+                    "metadataPrefix": "oai_datacite",
+                    "from": dt.strftime(OAI_PMH_DATETIME_FORMAT),
+                }
+            else:
+                params = {"resumptionToken": token}
+            page = self._list_records(params | {"verb": "ListRecords"})
+            try:
+                for record in page:
+                    if limit is not None and counter >= limit:
+                        return
+                    dataset = self._dataset_from_record(record)
+                    if dataset is not None:
+                        counter += 1
+                        if state is not None:
+                            state.resumption_token = token
+                            state.last_identifiers = [record.identifier]
+                        yield dataset
+            except OaiPmhError as e:
+                if e.code == "badResumptionToken" and token is not None:
+                    logging.warning("The resumption token expired, restarting from the watermark.")
+                    token = None
+                    if state is not None:
+                        state.resumption_token = None
+                    continue
+                if e.code == "noRecordsMatch":
+                    return
+                raise
+            token = page.resumption_token
+            if token is None:
+                return
 
     def fetch_all(self, limit: int | None = None) -> Iterator[Dataset]:
-        sickle = Sickle("https://zenodo.org/oai2d")
-        date = datetime(2000, 1, 1, 12, 0, 0)  # this should be a paramater
-        return self._retrieve_dataset_from_datetime(sickle, date, limit)
+        date = datetime(2000, 1, 1, 12, 0, 0)
+        return self._retrieve_dataset_from_datetime(date, limit)
+
+    def fetch_since(self, state: SyncState, limit: int | None = None) -> Iterator[Dataset]:
+        """
+        Harvest the records changed since the watermark. An interrupted run is resumed from the
+        OAI-PMH resumption token of the last stored page. Because a page is harvested again on
+        resumption, records can be fetched twice; they will be updated.
+        """
+        date = state.watermark or datetime(2000, 1, 1, 12, 0, 0)
+        return self._retrieve_dataset_from_datetime(date, limit, state=state)
@@ -143,6 +143,24 @@ class DcatAPDataset(DcatAPObject):
     version: str | None = Field(alias="owl:versionInfo")
 
 
+class DcatAPCatalog(DcatAPObject):
+    type_: str = Field(default="dcat:Catalog", alias="@type", const=True)
+    title: str = Field(
+        alias="dct:title",
+        description="This property contains a name given to the Catalogue",
+    )
+    description: str | None = Field(
+        alias="dct:description",
+        default=None,
+        description="This property contains a free-text account of the Catalogue",
+    )
+    dataset: list[DcatAPIdentifier] = Field(
+        alias="dcat:dataset",
+        default_factory=list,
+        description="This property links the Catalogue with a Dataset that is part of it",
+    )
+
+
 class DcatApWrapper(BaseModel):
     """The resulting class, containing a dataset and related entities in the graph"""
 
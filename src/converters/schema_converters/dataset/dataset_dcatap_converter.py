@@ -1,5 +1,5 @@
 import re
-from typing import Type
+from typing import Sequence, Type
 
 from converters.schema.dcat import (
     DcatApWrapper,
@@ -15,6 +15,7 @@ from converters.schema.dcat import (
 )
 from converters.schema_converters.schema_converter import SchemaConverter
 from database.model.dataset.dataset import Dataset
+from database.model.resource import load_relationships
 
 
 class DatasetConverterDcatAP(SchemaConverter[Dataset, DcatApWrapper]):
@@ -27,6 +28,15 @@ class DatasetConverterDcatAP(SchemaConverter[Dataset, DcatApWrapper]):
         return DcatApWrapper
 
     def convert(self, aiod: Dataset) -> DcatApWrapper:
+        return self._convert(aiod, individuals={})
+
+    def convert_many(self, aiods: Sequence[Dataset]) -> list[DcatApWrapper]:
+        """Convert the datasets, sharing the VCardIndividual of a person between all graphs."""
+        load_relationships(aiods)
+        individuals: dict[str, VCardIndividual] = {}
+        return [self._convert(aiod, individuals) for aiod in aiods]
+
+    def _convert(self, aiod: Dataset, individuals: dict[str, VCardIndividual]) -> DcatApWrapper:
         release_date = (
             XSDDateTime(value_=aiod.date_published) if aiod.date_published is not None else None
         )
@@ -45,25 +55,21 @@ class DatasetConverterDcatAP(SchemaConverter[Dataset, DcatApWrapper]):
             version=aiod.version,
         )
         graph: list[DcatAPObject] = [dataset]
+        individual_ids: set[str] = set()
         if aiod.contact is not None and len(aiod.contact) > 0:
-            contact = VCardIndividual(
-                id_=_replace_special_chars("individual_{}".format(aiod.contact)), fn=aiod.contact
-            )
+            contact = _individual(aiod.contact, individuals)
             graph.append(contact)
+            individual_ids.add(contact.id_)
             dataset.contact_point = [DcatAPIdentifier(id_=contact.id_)]
         if aiod.creator is not None and len(aiod.creator) > 0:
-            creator = VCardIndividual(
-                id_=_replace_special_chars("individual_{}".format(aiod.creator)), fn=aiod.creator
-            )
-            if creator.id_ not in {obj.id_ for obj in graph}:
+            creator = _individual(aiod.creator, individuals)
+            if creator.id_ not in individual_ids:
                 graph.append(creator)
+                individual_ids.add(creator.id_)
             dataset.creator = [DcatAPIdentifier(id_=creator.id_)]
         if aiod.publisher is not None and len(aiod.publisher) > 0:
-            publisher = VCardIndividual(
-                id_=_replace_special_chars("individual_{}".format(aiod.publisher)),
-                fn=aiod.publisher,
-            )
-            if publisher.id_ not in {obj.id_ for obj in graph}:
+            publisher = _individual(aiod.publisher, individuals)
+            if publisher.id_ not in individual_ids:
                 graph.append(publisher)
             dataset.contact_point = [DcatAPIdentifier(id_=publisher.id_)]
         if aiod.spatial_coverage is not None:
@@ -105,7 +111,17 @@ class DatasetConverterDcatAP(SchemaConverter[Dataset, DcatApWrapper]):
             )
             dataset.distribution.append(DcatAPIdentifier(id_=aiod_distribution.content_url))
             graph.append(distribution)
-        return DcatApWrapper(graph_=graph)
+        # All nodes are validated already. Validating them again against the Union of the graph
+        # would copy every node, and try the node types one by one.
+        return DcatApWrapper.construct(graph_=graph)
+
+
+def _individual(name: str, individuals: dict[str, VCardIndividual]) -> VCardIndividual:
+    """The VCardIndividual of this name, created only once per dict of individuals."""
+    if name not in individuals:
+        individual_id = _replace_special_chars("individual_{}".format(name))
+        individuals[name] = VCardIndividual(id_=individual_id, fn=name)
+    return individuals[name]
 
 
 def _replace_special_chars(name: str) -> str:
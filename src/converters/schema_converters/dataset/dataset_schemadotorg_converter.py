@@ -1,4 +1,4 @@
-from typing import Type, TypeVar
+from typing import Sequence, Type, TypeVar
 
 from converters.schema.schema_dot_org import (
     SchemaDotOrgDataset,
@@ -8,6 +8,7 @@ from converters.schema.schema_dot_org import (
 )
 from converters.schema_converters.schema_converter import SchemaConverter
 from database.model.dataset.dataset import Dataset
+from database.model.resource import load_relationships
 
 
 class DatasetConverterSchemaDotOrg(SchemaConverter[Dataset, SchemaDotOrgDataset]):
@@ -20,6 +21,21 @@ class DatasetConverterSchemaDotOrg(SchemaConverter[Dataset, SchemaDotOrgDataset]
         return SchemaDotOrgDataset
 
     def convert(self, aiod: Dataset) -> SchemaDotOrgDataset:
+        return self._convert(aiod, organizations={}, persons={})
+
+    def convert_many(self, aiods: Sequence[Dataset]) -> list[SchemaDotOrgDataset]:
+        """Convert the datasets, sharing the organizations and persons between the datasets."""
+        load_relationships(aiods)
+        organizations: dict[str | None, SchemaDotOrgOrganization] = {}
+        persons: dict[str, SchemaDotOrgPerson] = {}
+        return [self._convert(aiod, organizations, persons) for aiod in aiods]
+
+    def _convert(
+        self,
+        aiod: Dataset,
+        organizations: dict[str | None, SchemaDotOrgOrganization],
+        persons: dict[str, SchemaDotOrgPerson],
+    ) -> SchemaDotOrgDataset:
         temporal_coverage_parts = [
             d.isoformat()
             for d in [aiod.temporal_coverage_from, aiod.temporal_coverage_to]
@@ -32,10 +48,12 @@ class DatasetConverterSchemaDotOrg(SchemaConverter[Dataset, SchemaDotOrgDataset]
             description=aiod.description,
             identifier=aiod.identifier,
             name=aiod.name,
-            maintainer=SchemaDotOrgOrganization(name=aiod.platform),
+            maintainer=_shared(organizations, aiod.platform, SchemaDotOrgOrganization),
             alternateName=_list_to_one_or_none([a.name for a in aiod.alternate_names]),
             # citation=_list_to_one_or_none(aiod.citations),
-            creator=SchemaDotOrgPerson(name=aiod.creator) if aiod.creator is not None else None,
+            creator=_shared(persons, aiod.creator, SchemaDotOrgPerson)
+            if aiod.creator is not None
+            else None,
             dateModified=aiod.date_modified,
             datePublished=aiod.date_published,
             isAccessibleForFree=aiod.is_accessible_for_free,
@@ -55,7 +73,9 @@ class DatasetConverterSchemaDotOrg(SchemaConverter[Dataset, SchemaDotOrgDataset]
                     for d in aiod.distributions
                 ]
             ),
-            funder=SchemaDotOrgPerson(name=aiod.funder) if aiod.funder is not None else None,
+            funder=_shared(persons, aiod.funder, SchemaDotOrgPerson)
+            if aiod.funder is not None
+            else None,
             hasPart=_list_to_one_or_none(aiod.has_parts),
             isPartOf=_list_to_one_or_none(aiod.is_part),
             issn=aiod.issn,
@@ -69,6 +89,14 @@ class DatasetConverterSchemaDotOrg(SchemaConverter[Dataset, SchemaDotOrgDataset]
 
 
 V = TypeVar("V")
+NODE = TypeVar("NODE", SchemaDotOrgOrganization, SchemaDotOrgPerson)
+
+
+def _shared(nodes: dict, name: str | None, node_class: Type[NODE]) -> NODE:
+    """The node with this name, created only once per dict of nodes."""
+    if name not in nodes:
+        nodes[name] = node_class(name=name)
+    return nodes[name]
 
 
 def _list_to_one_or_none(value: set[V] | list[V]) -> set[V] | list[V] | V | None:
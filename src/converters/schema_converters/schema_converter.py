@@ -1,8 +1,9 @@
 import abc
-from typing import Generic, TypeVar, Type
+from typing import Generic, TypeVar, Type, Sequence
 
 from sqlmodel import SQLModel
 
+from database.model.resource import load_relationships
 
 RESOURCE = TypeVar("RESOURCE", bound=SQLModel)
 SCHEMA_CLASS = TypeVar("SCHEMA_CLASS")
@@ -24,3 +25,13 @@ class SchemaConverter(abc.ABC, Generic[RESOURCE, SCHEMA_CLASS]):
     @abc.abstractmethod
     def convert(self, aiod: RESOURCE) -> SCHEMA_CLASS:
         pass
+
+    def convert_many(self, aiods: Sequence[RESOURCE]) -> list[SCHEMA_CLASS]:
+        """Convert a list of resources, such as a page of results, in the same order.
+
+        The relationships that are not loaded yet are loaded for all resources together, instead
+        of lazily per resource. Converters can override this method to share intermediate
+        results between the resources.
+        """
+        load_relationships(aiods)
+        return [self.convert(aiod) for aiod in aiods]
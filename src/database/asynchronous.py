@@ -0,0 +1,87 @@
+"""
+Asynchronous execution mode.
+
+In the default (synchronous) mode, FastAPI runs every endpoint in a worker thread, which is
+blocked while waiting for the database. In the asynchronous mode, the endpoints are coroutines
+and the database is accessed using an async driver (aiomysql for MySQL, aiosqlite for testing),
+so that a single worker can serve many more concurrent requests.
+
+The query and serialization logic is shared between both modes. In the asynchronous mode, the
+synchronous code is executed on the event loop, inside a greenlet provided by SqlAlchemy (just
+like AsyncSession.run_sync). All database IO, including the lazy loading of relationships, is
+then awaited on the event loop instead of blocking a thread. Other blocking IO (such as the
+requests to a Redis response cache) should be performed using `run_blocking`, which runs it in a
+worker thread in the asynchronous mode.
+"""
+import functools
+from contextvars import ContextVar
+from typing import AsyncIterator, Callable, Iterator, TypeVar
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.util import await_only, greenlet_spawn
+from starlette.concurrency import run_in_threadpool
+
+T = TypeVar("T")
+
+# Whether the current code is executed on the event loop, by async_endpoint or async_iterator
+_on_event_loop: ContextVar[bool] = ContextVar("on_event_loop", default=False)
+
+
+def is_async(engine: Engine | AsyncEngine) -> bool:
+    """Whether this engine (or the sync_engine of an AsyncEngine) uses an async driver."""
+    return isinstance(engine, AsyncEngine) or getattr(engine.dialect, "is_async", False)
+
+
+def sync_engine(engine: Engine | AsyncEngine) -> Engine:
+    """
+    The synchronous facade of the engine. For an AsyncEngine, it can only be used inside
+    `async_endpoint` or `async_iterator`.
+    """
+    return engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+
+
+def async_endpoint(func: Callable[..., T]) -> Callable[..., T]:
+    """
+    Turn a synchronous endpoint function, accessing the database through the sync_engine of an
+    AsyncEngine, into a coroutine function. The signature is preserved, so that FastAPI
+    resolves the same parameters and dependencies.
+
+    The function is executed on the event loop, so other blocking IO (such as HTTP requests)
+    should be performed using `run_blocking`.
+    """
+
+    @functools.wraps(func)
+    async def endpoint(*args, **kwargs):
+        return await greenlet_spawn(_run_on_event_loop, func, *args, **kwargs)
+
+    return endpoint  # type: ignore
+
+
+async def async_iterator(iterator: Iterator[T]) -> AsyncIterator[T]:
+    """Iterate over a synchronous iterator that accesses the database through an AsyncEngine."""
+    done = object()
+    while True:
+        item = await greenlet_spawn(_run_on_event_loop, next, iterator, done)
+        if item is done:
+            return
+        yield item  # type: ignore
+
+
+def run_blocking(func: Callable[..., T], *args) -> T:
+    """
+    Call a function performing blocking IO other than database access, such as a request to
+    Redis. Inside `async_endpoint` or `async_iterator`, the function is executed in a worker
+    thread, so that the event loop can serve other requests in the meantime.
+    """
+    if not _on_event_loop.get():
+        return func(*args)
+    return await_only(run_in_threadpool(func, *args))
+
+
+def _run_on_event_loop(func: Callable[..., T], *args, **kwargs) -> T:
+    token = _on_event_loop.set(True)
+    try:
+        return func(*args, **kwargs)
+    finally:
+        _on_event_loop.reset(token)
@@ -0,0 +1,498 @@
+"""
+Batched insertion of resources, used to populate the database from the connectors.
+
+Inserting resources one by one (as the POST endpoints do) requires several queries and a commit
+per resource, which makes loading large platforms (e.g. all HuggingFace datasets) very slow. The
+BulkInserter buffers the resources into batches, and per batch:
+
+- checks which resources already exist, using a single query per platform;
+- resolves all related named values (e.g. keywords) and identifiers using a single query per
+    related class, creating the missing named values at once;
+- allocates the identifiers of the parents (ai_asset / agent) using a single multi-row insert;
+- inserts the resources and their link-table rows, which SqlAlchemy performs using executemany
+    because all primary keys are known;
+- commits once.
+
+If a batch fails (e.g. because of an IntegrityError), it is retried resource by resource, so that a
+single invalid resource does not prevent the others from being inserted.
+
+Optionally, the existing resources are updated (upserted), which is used to synchronize the
+database with the platforms. Resources that did not change are left untouched. Alternatively,
+existing resources can be replaced by identifier, which is used by the bulk PUT endpoints.
+"""
+import datetime
+import itertools
+import logging
+from typing import Any, Callable, Iterable, Sequence, Type, TYPE_CHECKING, TypeVar
+
+from fastapi import HTTPException, status
+from sqlalchemy import delete, func, insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import SQLModel, Session, select
+
+import routers
+from connectors.resource_with_relations import ResourceWithRelations
+from database import counts
+from database.model.agent import Agent
+from database.model.agent_table import AgentTable
+from database.model.ai_asset import AIAsset
+from database.model.ai_asset_table import AIAssetTable
+from database.model.named_relation import NamedRelation
+from database.model.platform.platform_names import PlatformName
+from database.model.resource import Resource, resource_copy_plan
+from database.named_relation_cache import NamedRelationCache
+from response_cache import response_cache
+from serialization import FindByIdentifierDeserializer, FindByNameDeserializer
+
+if TYPE_CHECKING:  # avoid circular imports; only import while type checking
+    from routers import ResourceRouter
+
+DEFAULT_BATCH_SIZE = 500
+
+RESULT = TypeVar("RESULT")
+
+
+class NonConsecutiveIdentifiersError(Exception):
+    """The batch will be retried resource by resource."""
+
+
+class BulkInserter:
+    """Insert the resources of a single ResourceRouter in batches."""
+
+    def __init__(
+        self,
+        session: Session,
+        router: "ResourceRouter",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        update_existing: bool = False,
+    ):
+        self.session = session
+        self.router = router
+        self.resource_class: Type[SQLModel] = router.resource_class
+        self.batch_size = batch_size
+        self.update_existing = update_existing
+        self.n_updated = 0
+        self._inserted_classes: set[Type[SQLModel]] = set()
+        self._updated: list[tuple[str, int]] = []  # The resource names and identifiers
+        # The errors of the items of the last batch that could not be stored, by their index
+        self.errors: dict[int, Exception] = {}
+
+    def preload_named_relations(self):
+        """Load all names of the NamedRelations of the resource into the NamedRelationCache."""
+        cache = NamedRelationCache.of(self.session)
+        for relationship in resource_copy_plan(self.resource_class).relationships:
+            if isinstance(relationship.deserializer, FindByNameDeserializer):
+                cache.preload(self.session, relationship.deserializer.clazz)
+
+    def insert_all(self, items: Iterable[SQLModel | ResourceWithRelations]) -> int:
+        """
+        Insert all items that do not exist yet, committing per batch. Returns the number of
+        inserted resources.
+        """
+        n_inserted = 0
+        iterator = iter(items)
+        while batch := list(itertools.islice(iterator, self.batch_size)):
+            n_inserted += sum(created for _, created in self.insert_batch(batch))
+        return n_inserted
+
+    def insert_batch(
+        self, items: list[SQLModel | ResourceWithRelations]
+    ) -> list[tuple[int | None, bool]]:
+        """
+        Insert a single batch and commit it. Returns for each item its identifier (None if it
+        could not be inserted) and whether it was newly created.
+        """
+        return self._commit_batch(self._insert, items, failed=(None, False))
+
+    def replace_batch(self, items: list[tuple[int, SQLModel]]) -> list[bool]:
+        """
+        Replace the existing resources, given as (identifier, create instance), in the same way
+        as the PUT endpoint does, and commit. Returns for each item whether it was replaced.
+        """
+        return self._commit_batch(self._replace, items, failed=False)
+
+    def _commit_batch(
+        self,
+        store: Callable[[list, dict[int, Exception]], list[RESULT]],
+        items: list,
+        failed: RESULT,
+    ) -> list[RESULT]:
+        """
+        Store the items and commit. If this fails, the items are stored one by one, so that the
+        other items are still stored. The errors of the items that failed are kept in
+        `self.errors`.
+        """
+        errors: dict[int, Exception] = {}
+        try:
+            results = store(items, errors)
+            self.session.commit()
+        except (SQLAlchemyError, NonConsecutiveIdentifiersError) as e:
+            self.session.rollback()
+            self._inserted_classes.clear()
+            self._updated.clear()
+            if len(items) == 1:
+                logging.warning(f"Error while storing resource. Continuing for now: {e}")
+                self.errors = {0: e}
+                return [failed]
+            results = []
+            for i, item in enumerate(items):
+                results += self._commit_batch(store, [item], failed)
+                if 0 in self.errors:
+                    errors[i] = self.errors[0]
+            self.errors = errors
+            return results
+        for clazz in self._inserted_classes:
+            counts.invalidate(clazz)
+        for resource_name, identifier in self._updated:
+            response_cache.invalidate(resource_name, identifier)
+        self.n_updated += len(self._updated)
+        self._inserted_classes.clear()
+        self._updated.clear()
+        self.errors = errors
+        return results
+
+    def _insert(
+        self,
+        items: Sequence[SQLModel | ResourceWithRelations],
+        errors: dict[int, Exception] | None = None,
+    ) -> list[tuple[int | None, bool]]:
+        """Insert a batch without committing, adding the errors per item index to `errors`."""
+        errors = {} if errors is None else errors
+        self._insert_related([item for item in items if isinstance(item, ResourceWithRelations)])
+        instances = [i.resource if isinstance(i, ResourceWithRelations) else i for i in items]
+
+        results: list[tuple[int | None, bool]] = [(None, False)] * len(instances)
+        existing = self._existing_identifiers(instances)
+        new: dict[tuple[str, str] | int, int] = {}  # Key to the index of the new instance
+        to_update: dict[int, int] = {}  # Identifier to the index of the instance
+        for i, instance in enumerate(instances):
+            key = _key(instance)
+            if key in existing:
+                results[i] = (existing[key], False)
+                to_update.setdefault(existing[key], i)
+            elif key not in new:
+                new[key] = i
+        new_indices = sorted(new.values())
+        if not self.update_existing:
+            to_update = {}
+
+        resolver = _RelationResolver(self.session, self.resource_class)
+        resolver.resolve([instances[i] for i in new_indices + list(to_update.values())])
+        self._update(resolver, to_update, instances, errors)
+        identifiers = self._allocate_identifiers(len(new_indices))
+        resources = {}
+        unused_identifiers = []
+        for i, identifier in zip(new_indices, identifiers):
+            try:
+                resources[i] = resolver.to_resource(instances[i], identifier)
+            except (HTTPException, ValueError) as e:
+                detail = e.detail if isinstance(e, HTTPException) else e
+                logging.warning(f"Error while creating resource. Continuing for now: {detail}")
+                unused_identifiers.append(identifier)
+                errors[i] = e
+        parent_class: Any = self._parent_class()
+        if parent_class is not None and len(unused_identifiers) > 0:
+            self.session.execute(
+                delete(parent_class).where(parent_class.identifier.in_(unused_identifiers))
+            )
+        self.session.add_all(resources.values())
+        self.session.flush()
+        self._inserted_classes.add(self.resource_class)
+
+        for i, resource in resources.items():
+            results[i] = (resource.identifier, True)  # type: ignore[attr-defined]
+        for i, instance in enumerate(instances):
+            if results[i][0] is None and _key(instance) in new:
+                # A duplicate within this batch
+                results[i] = (results[new[_key(instance)]][0], False)
+                if new[_key(instance)] in errors:
+                    errors[i] = errors[new[_key(instance)]]
+        return results
+
+    def _update(
+        self,
+        resolver: "_RelationResolver",
+        indices: dict[int, int],
+        instances: list[SQLModel],
+        errors: dict[int, Exception],
+    ):
+        """Update the existing resources, by identifier, with the new values of the instances"""
+        if len(indices) == 0:
+            return
+        clazz = self.resource_class
+        query = select(clazz).where(clazz.identifier.in_(indices))  # type: ignore[attr-defined]
+        for resource in self.session.scalars(query).all():
+            i = indices[resource.identifier]
+            try:
+                if resolver.update_resource(resource, instances[i]):
+                    self._updated.append((self.router.resource_name, resource.identifier))
+            except (HTTPException, ValueError) as e:
+                self.session.expire(resource)
+                detail = e.detail if isinstance(e, HTTPException) else e
+                logging.warning(f"Error while updating resource. Continuing for now: {detail}")
+                errors[i] = e
+        self.session.flush()
+
+    def _replace(
+        self, items: list[tuple[int, SQLModel]], errors: dict[int, Exception]
+    ) -> list[bool]:
+        """Replace the resources without committing, adding the errors per item index."""
+        clazz = self.resource_class
+        identifiers = {identifier for identifier, _ in items}
+        query = select(clazz).where(clazz.identifier.in_(identifiers))  # type: ignore[attr-defined]
+        resources = {resource.identifier: resource for resource in self.session.scalars(query)}
+        resolver = _RelationResolver(self.session, clazz)
+        resolver.resolve([instance for _, instance in items])
+        results = [False] * len(items)
+        for i, (identifier, instance) in enumerate(items):
+            if identifier not in resources:
+                errors[i] = HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"{self.router.resource_name.capitalize()} '{identifier}' not found "
+                    "in the database.",
+                )
+                continue
+            try:
+                resolver.replace_resource(resources[identifier], instance)
+            except (HTTPException, ValueError) as e:
+                self.session.expire(resources[identifier])
+                errors[i] = e
+                continue
+            self._updated.append((self.router.resource_name, identifier))
+            results[i] = True
+        self.session.flush()
+        self._inserted_classes.add(clazz)
+        return results
+
+    def _insert_related(self, items: list[ResourceWithRelations]):
+        """
+        Insert (or find) the related resources of the items, and put their identifiers into the
+        item.resource.[field_name]. The related resources are inserted in a batch per router.
+        """
+        related: dict[str, list[SQLModel]] = {}  # Related resources per router
+        for item in items:
+            for related_resource_or_list in item.related_resources.values():
+                resources: Sequence[SQLModel]
+                if isinstance(related_resource_or_list, Resource):
+                    resources = [related_resource_or_list]
+                else:
+                    resources = related_resource_or_list
+                for resource in resources:
+                    if _is_external(resource):
+                        related.setdefault(_router(resource).resource_name, []).append(resource)
+
+        identifiers: dict[int, int | None] = {}  # id of related resource to identifier
+        for resources in related.values():
+            # Existing related resources are not updated: they are updated by their own
+            # connector, which would otherwise depend on the order in which the connectors run.
+            inserter = BulkInserter(self.session, _router(resources[0]))
+            results = inserter._insert(resources)
+            identifiers |= {id(r): identifier for r, (identifier, _) in zip(resources, results)}
+            self._inserted_classes |= inserter._inserted_classes
+            self._updated += inserter._updated
+
+        for item in items:
+            for field_name, related_resource_or_list in item.related_resources.items():
+                if isinstance(related_resource_or_list, Resource):
+                    resources = [related_resource_or_list]
+                else:
+                    resources = related_resource_or_list
+                ids = [identifiers[id(r)] for r in resources if _is_external(r)]
+                if isinstance(related_resource_or_list, Resource):
+                    (id_,) = ids
+                    # E.g. Dataset.license_identifier = 1
+                    item.resource.__setattr__(field_name, id_)
+                else:
+                    # The related resources that could not be inserted are left out
+                    ids = [id_ for id_ in ids if id_ is not None]
+                    item.resource.__setattr__(field_name, ids)  # E.g. Dataset.keywords = [1, 4]
+
+    def _existing_identifiers(self, instances: list[SQLModel]) -> dict[tuple[str, str] | int, int]:
+        """
+        The identifiers of the resources that already exist, by (platform, platform_identifier),
+        using a single query per platform.
+        """
+        clazz: Any = self.resource_class  # A Resource with platform and platform_identifier
+        platform_identifiers: dict[str, set[str]] = {}
+        for instance in instances:
+            key = _key(instance)
+            if isinstance(key, tuple):
+                platform, platform_identifier = key
+                platform_identifiers.setdefault(platform, set()).add(platform_identifier)
+        existing: dict[tuple[str, str] | int, int] = {}
+        for platform, identifiers in platform_identifiers.items():
+            query = select(clazz.identifier, clazz.platform_identifier).where(
+                clazz.platform == platform,
+                clazz.platform_identifier.in_(identifiers),
+            )
+            for identifier, platform_identifier in self.session.execute(query):
+                existing[(platform, platform_identifier)] = identifier
+        return existing
+
+    def _parent_class(self) -> Type[SQLModel] | None:
+        if issubclass(self.resource_class, AIAsset):
+            return AIAssetTable
+        if issubclass(self.resource_class, Agent):
+            return AgentTable
+        return None
+
+    def _allocate_identifiers(self, n: int) -> list[int | None]:
+        """
+        Insert n parents (ai_asset or agent rows), returning their identifiers. Resources without
+        parent get their identifier from the database on insert.
+        """
+        parent_class: Any = self._parent_class()
+        if parent_class is None:
+            return [None] * n
+        if n == 0:
+            return []
+        type_ = self.resource_class.__tablename__
+        result = self.session.execute(insert(parent_class).values([{"type": type_}] * n))
+        # A single multi-row insert gets consecutive auto-increment values (on MySQL, for every
+        # innodb_autoinc_lock_mode). The lastrowid is the first of these on MySQL, and the last
+        # one on SQLite. Checked anyway, because identifiers are hard to fix afterwards.
+        first = result.lastrowid  # type: ignore[attr-defined]  # a CursorResult
+        if self.session.get_bind().dialect.name != "mysql":
+            first -= n - 1
+        query = select(func.count(parent_class.identifier)).where(  # type: ignore[call-overload]
+            parent_class.identifier.between(first, first + n - 1),
+            parent_class.type == type_,
+        )
+        if self.session.scalars(query).one() != n:
+            raise NonConsecutiveIdentifiersError(f"Could not allocate {n} {parent_class.__name__}")
+        return list(range(first, first + n))
+
+
+class _RelationResolver:
+    """
+    Deserializes the relationships of a batch of resources. The named values and identifiers are
+    retrieved (or created) using a single query per related class, instead of per resource.
+    """
+
+    def __init__(self, session: Session, resource_class: Type[SQLModel]):
+        self.session = session
+        self.resource_class = resource_class
+        self.copy_plan = resource_copy_plan(resource_class)
+        self.by_name: dict[type, dict[str, NamedRelation]] = {}
+        self.by_identifier: dict[type, dict[int, SQLModel]] = {}
+
+    def resolve(self, instances: list[SQLModel]):
+        names: dict[type, set[str]] = {}
+        identifiers: dict[type, set[int]] = {}
+        for instance in instances:
+            for relationship in self.copy_plan.relationships:
+                value = getattr(instance, relationship.attribute)
+                if value is None:
+                    continue
+                values = value if isinstance(value, list) else [value]
+                if isinstance(relationship.deserializer, FindByNameDeserializer):
+                    names.setdefault(relationship.deserializer.clazz, set()).update(
+                        _name(v) for v in values
+                    )
+                elif isinstance(relationship.deserializer, FindByIdentifierDeserializer):
+                    identifiers.setdefault(relationship.deserializer.clazz, set()).update(values)
+
+        cache = NamedRelationCache.of(self.session)
+        for clazz, names_of_clazz in names.items():
+            self.by_name[clazz] = cache.objects(self.session, clazz, names_of_clazz)
+        for clazz, identifiers_of_clazz in identifiers.items():
+            query = select(clazz).where(clazz.identifier.in_(identifiers_of_clazz))  # type: ignore
+            self.by_identifier[clazz] = {o.identifier: o for o in self.session.scalars(query)}
+
+    def to_resource(self, instance: SQLModel, identifier: int | None) -> SQLModel:
+        """Convert the create instance to a resource, similar to ResourceRouter.create_resource"""
+        if identifier is None:
+            resource = self.resource_class.from_orm(instance)
+        else:
+            resource = self.resource_class.from_orm(instance, update={"identifier": identifier})
+        self._set_relationships(resource, instance)
+        return resource
+
+    def update_resource(self, resource: SQLModel, instance: SQLModel) -> bool:
+        """
+        Update the existing resource with the values of the instance, similar to
+        ResourceRouter.put_resource. Returns whether the resource changed.
+        """
+        date_modified = getattr(instance, "date_modified", None)
+        if date_modified is not None and date_modified == getattr(resource, "date_modified"):
+            return False  # Unchanged according to the platform
+        self.copy_plan.copy_attributes(resource, instance)
+        # Connectors leave the relationships that are unknown on their platform empty (such as
+        # the datasets of a publication), so empty relationships do not overwrite existing ones.
+        self._set_relationships(resource, instance, skip_empty=True)
+        if not self.session.is_modified(resource):
+            return False
+        if hasattr(resource, "aiod_date_modified"):
+            resource.aiod_date_modified = datetime.datetime.utcnow()
+        return True
+
+    def replace_resource(self, resource: SQLModel, instance: SQLModel):
+        """Overwrite the resource with the values of the instance, as ResourceRouter.put_resource"""
+        self.copy_plan.copy_attributes(resource, instance)
+        self._set_relationships(resource, instance)
+        if hasattr(resource, "aiod_date_modified"):
+            resource.aiod_date_modified = datetime.datetime.utcnow()
+
+    def _set_relationships(self, resource: SQLModel, instance: SQLModel, skip_empty=False):
+        for relationship in self.copy_plan.relationships:
+            new_value = getattr(instance, relationship.attribute)
+            if new_value is None or (skip_empty and new_value == []):
+                continue
+            deserializer = relationship.deserializer
+            if isinstance(deserializer, FindByNameDeserializer):
+                named = self.by_name[deserializer.clazz]
+                if isinstance(new_value, list):
+                    objects = {o.identifier: o for o in (named[_name(v)] for v in new_value)}
+                    new_value = [objects[identifier] for identifier in sorted(objects)]
+                else:
+                    new_value = named[_name(new_value)].identifier
+            elif isinstance(deserializer, FindByIdentifierDeserializer):
+                found = self.by_identifier[deserializer.clazz]
+                ids_not_found = set(new_value) - found.keys()
+                if any(ids_not_found):
+                    raise ValueError(
+                        f"Nested object with identifiers "
+                        f"{', '.join([str(i) for i in ids_not_found])} not found"
+                    )
+                new_value = [found[identifier] for identifier in sorted(set(new_value))]
+            elif deserializer is not None:
+                new_value = deserializer.deserialize(self.session, new_value)
+            setattr(resource, relationship.target, new_value)
+
+
+def _name(value: str | NamedRelation) -> str:
+    """Some connectors provide NamedRelations instead of names"""
+    return value.name if isinstance(value, NamedRelation) else value
+
+
+def _is_external(resource: SQLModel) -> bool:
+    """Only resources of external platforms can be related, because they can be identified."""
+    platform = getattr(resource, "platform", None)
+    return (
+        platform is not None
+        and platform != PlatformName.aiod
+        and getattr(resource, "platform_identifier", None) is not None
+    )
+
+
+def _key(instance: SQLModel) -> tuple[str, str] | int:
+    """Resources of the same platform are the same resource. Others are always distinct."""
+    if getattr(instance, "platform", None) is not None:
+        return instance.platform, instance.platform_identifier  # type: ignore[attr-defined]
+    return id(instance)
+
+
+def _router(resource: SQLModel) -> "ResourceRouter":
+    """
+    Get the router of this resource. The difficulty is, that the resource will be a ResourceRead
+    or ResourceCreate (e.g. a DatasetRead). So we search for the router for which the resource
+    name starts with the resource-read-name
+    """
+    resource_read_str = type(resource).__name__  # E.g. DatasetRead
+    (router,) = [
+        router
+        for router in routers.resource_routers
+        if resource_read_str.startswith(router.resource_class.__name__)
+        # E.g. "DatasetRead".startswith("Dataset")
+    ]
+    return router
@@ -0,0 +1,56 @@
+"""
+Counting the number of resources in the database, using an in-process cache.
+
+The counts are requested often (for instance by the frontend, on every load of its landing page),
+while they only change when resources are created or deleted. The cache is invalidated by the
+ResourceRouter on every change. Because other processes (such as other uvicorn workers) can change
+the database as well, the cached counts also expire after EXPIRY_SECONDS.
+"""
+import threading
+import time
+from typing import Any, Type
+
+from sqlalchemy import func
+from sqlalchemy.engine import Engine
+from sqlmodel import SQLModel, Session, select
+
+EXPIRY_SECONDS = 60
+
+_cache: dict[tuple[str, str, str | None], tuple[float, int]] = {}
+_lock = threading.Lock()
+
+
+def count_resources(
+    engine: Engine, resource_class: Type[SQLModel], platform: str | None = None
+) -> int:
+    """Return the number of resources, optionally only the resources of given platform."""
+    key = (str(engine.url), str(resource_class.__tablename__), platform)
+    with _lock:
+        cached = _cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < EXPIRY_SECONDS:
+        return cached[1]
+
+    # Counting a single (indexed) column, instead of session.query(...).count(), which counts
+    # the rows of a subquery selecting all columns.
+    clazz: Any = resource_class  # A Resource table class, with identifier and platform
+    query = select(func.count(clazz.identifier))  # type: ignore[call-overload]
+    if platform is not None:
+        query = query.where(clazz.platform == platform)
+    with Session(engine) as session:
+        count = session.scalars(query).one()
+    with _lock:
+        _cache[key] = (time.monotonic(), count)
+    return count
+
+
+def invalidate(resource_class: Type[SQLModel]):
+    """Remove all cached counts of this resource, so that they will be recounted."""
+    with _lock:
+        for key in [k for k in _cache if k[1] == resource_class.__tablename__]:
+            del _cache[key]
+
+
+def clear():
+    """Remove all cached counts."""
+    with _lock:
+        _cache.clear()
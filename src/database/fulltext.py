@@ -0,0 +1,80 @@
+"""
+Full-text search on resources.
+
+On MySQL, a FULLTEXT index is used. Sqlite (used for testing) does not support FULLTEXT indexes,
+so on Sqlite a FTS5 virtual table is created instead, which is kept up-to-date using triggers.
+The indexes are only created when the table is created; existing MySQL databases need to be
+migrated manually.
+"""
+from typing import Type, Any, TypeVar
+
+from sqlalchemy import DDL, event, func, literal_column, table, column
+from sqlalchemy.dialects.mysql import match  # type: ignore[attr-defined]
+from sqlalchemy.sql import Select
+from sqlmodel import SQLModel
+
+_fulltext_columns: dict[str, tuple[str, ...]] = {}
+
+SELECT = TypeVar("SELECT", bound=Select)
+
+
+def add_fulltext_index(resource_class: Type[SQLModel], *column_names: str):
+    """Create a full-text index on the given (string) columns of the table of this resource."""
+    table_name = str(resource_class.__tablename__)
+    _fulltext_columns[table_name] = column_names
+    columns = ", ".join(column_names)
+    fts_table = f"{table_name}_fts"
+    new_values = ", ".join(f"new.{c}" for c in column_names)
+    old_values = ", ".join(f"old.{c}" for c in column_names)
+    delete_old = (
+        f"INSERT INTO {fts_table}({fts_table}, rowid, {columns}) "
+        f"VALUES ('delete', old.identifier, {old_values});"
+    )
+    insert_new = f"INSERT INTO {fts_table}(rowid, {columns}) VALUES (new.identifier, {new_values});"
+
+    mysql_statements = [
+        f"ALTER TABLE {table_name} ADD FULLTEXT INDEX {table_name}_fulltext ({columns})"
+    ]
+    sqlite_statements = [
+        f"CREATE VIRTUAL TABLE {fts_table} USING fts5({columns}, content='{table_name}', "
+        f"content_rowid='identifier')",
+        f"CREATE TRIGGER {fts_table}_insert AFTER INSERT ON {table_name} BEGIN {insert_new} END",
+        f"CREATE TRIGGER {fts_table}_delete AFTER DELETE ON {table_name} BEGIN {delete_old} END",
+        f"CREATE TRIGGER {fts_table}_update AFTER UPDATE ON {table_name} BEGIN {delete_old} "
+        f"{insert_new} END",
+    ]
+    table_ = resource_class.__table__  # type: ignore[attr-defined]
+    for statement in mysql_statements:
+        event.listen(table_, "after_create", DDL(statement).execute_if(dialect="mysql"))
+    for statement in sqlite_statements:
+        event.listen(table_, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+    event.listen(
+        table_, "before_drop", DDL(f"DROP TABLE IF EXISTS {fts_table}").execute_if(dialect="sqlite")
+    )
+
+
+def fulltext_columns(resource_class: Type[SQLModel]) -> tuple[str, ...]:
+    """The columns with a full-text index, or an empty tuple if there is no such index."""
+    return _fulltext_columns.get(getattr(resource_class, "__tablename__", ""), ())
+
+
+def fulltext_search(query: SELECT, resource_class: Type[SQLModel], q: str, dialect: str) -> SELECT:
+    """Filter the query on the search terms, ordering the results by relevance."""
+    columns = [getattr(resource_class, c) for c in fulltext_columns(resource_class)]
+    if dialect == "mysql":
+        relevance = match(*columns, against=q).in_natural_language_mode()
+        return query.where(relevance).order_by(relevance.desc())
+
+    fts_table_name = f"{resource_class.__tablename__}_fts"
+    fts_table = table(fts_table_name, column("rowid"))
+    return (
+        query.join(fts_table, fts_table.c.rowid == resource_class.identifier)  # type: ignore
+        .where(literal_column(fts_table_name).op("MATCH")(_fts5_query(q)))
+        .order_by(func.bm25(literal_column(fts_table_name)))
+    )
+
+
+def _fts5_query(q: str) -> Any:
+    """Quote every search term, so that characters in q are not interpreted as FTS5 syntax."""
+    terms = ['"' + term.replace('"', '""') + '"' for term in q.split()]
+    return " OR ".join(terms)
@@ -0,0 +1,324 @@
+"""
+Concurrent ingestion of the resources of multiple connectors into the database.
+
+Fetching the resources of a platform is mostly waiting for the platform, so the connectors are
+run concurrently: every connector gets its own fetch worker. The fetch workers put batches of
+resources into bounded queues, which are emptied by one or more writer workers that insert the
+batches using a BulkInserter. If the writers cannot keep up, the fetch workers block on the full
+queue (backpressure), so that the memory usage stays bounded.
+
+The batches of a single connector are always written by the same writer, in order. This way the
+SyncState of a connector, which is persisted after each written batch, never runs ahead of the
+resources that have been stored.
+"""
+import dataclasses
+import datetime
+import logging
+import queue
+import threading
+import time
+from typing import Sequence
+
+from sqlalchemy.engine import Engine
+from sqlmodel import SQLModel, Session
+
+import routers
+from connectors import ResourceConnector
+from connectors.fetch_failure import FetchFailure
+from connectors.resource_with_relations import ResourceWithRelations
+from database.bulk_insert import BulkInserter, DEFAULT_BATCH_SIZE
+from database.model.sync_state import SyncState
+from routers import ResourceRouter
+
+DEFAULT_QUEUE_SIZE = 4  # The number of batches per writer
+
+
+@dataclasses.dataclass
+class IngestionReport:
+    """The progress of a single connector"""
+
+    connector: str
+    n_fetched: int = 0
+    n_inserted: int = 0
+    n_updated: int = 0
+    n_failed: int = 0  # The number of resources that could not be stored
+    n_fetch_failed: int = 0  # The number of resources that could not be fetched
+    fetch_error: str | None = None
+    cancelled: bool = False
+    started: float = dataclasses.field(default_factory=time.monotonic)
+    finished: float | None = None
+
+    @property
+    def duration_seconds(self) -> float:
+        return (self.finished or time.monotonic()) - self.started
+
+    @property
+    def resources_per_second(self) -> float:
+        return self.n_fetched / self.duration_seconds if self.duration_seconds > 0 else 0.0
+
+    def __str__(self) -> str:
+        summary = (
+            f"{self.connector}: fetched {self.n_fetched} resources in "
+            f"{self.duration_seconds:.1f}s ({self.resources_per_second:.1f}/s), inserted "
+            f"{self.n_inserted}, updated {self.n_updated}, failed {self.n_failed}"
+        )
+        if self.n_fetch_failed > 0:
+            summary += f", could not fetch {self.n_fetch_failed}"
+        if self.fetch_error is not None:
+            summary += f", fetching failed: {self.fetch_error}"
+        if self.cancelled:
+            summary += ", cancelled"
+        return summary
+
+
+@dataclasses.dataclass
+class _Batch:
+    task: "_ConnectorTask"
+    items: list[SQLModel | ResourceWithRelations]
+    resumption_token: str | None  # The SyncState after fetching the items
+    last_identifiers: list[str]
+    failed_identifiers: list[str]
+
+
+@dataclasses.dataclass
+class _Done:
+    task: "_ConnectorTask"
+
+
+@dataclasses.dataclass
+class _ConnectorTask:
+    connector: ResourceConnector
+    router: ResourceRouter
+    state: SyncState  # Detached from any session, only used by the fetch worker
+    report: IngestionReport
+    writer_queue: queue.Queue
+    # The platform identifiers of the resources that could not be stored, only used by the writer
+    failed_stored: list[str] = dataclasses.field(default_factory=list)
+    started: datetime.datetime = dataclasses.field(default_factory=datetime.datetime.utcnow)
+
+
+class IngestionScheduler:
+    """
+    Run the connectors concurrently, storing their resources using `n_writers` writers.
+
+    If a limit is given, at most `limit` resources are fetched per connector, and the
+    watermarks of the connectors are not moved forward (because not all changes have been
+    fetched). The same holds if the run is cancelled by setting the `cancel` event: the fetch
+    workers stop, after which the resources that have already been fetched are stored. Finally,
+    the watermark of a connector is not moved forward if any of its resources could not be
+    fetched or stored, so that the next run starts from the previous watermark and fetches them
+    again. These resources are also recorded in the failed_identifiers of the SyncState, for
+    connectors that do not use a watermark.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        connectors: Sequence[ResourceConnector],
+        limit: int | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        n_writers: int = 1,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        cancel: threading.Event | None = None,
+    ):
+        self.engine = engine
+        self.connectors = connectors
+        self.limit = limit
+        self.batch_size = batch_size
+        self.queues: list[queue.Queue] = [queue.Queue(maxsize=queue_size) for _ in range(n_writers)]
+        self.cancel = cancel or threading.Event()
+        self.reports: list[IngestionReport] = []
+
+    def run(self) -> list[IngestionReport]:
+        tasks = [
+            _ConnectorTask(
+                connector=connector,
+                router=_router(connector),
+                state=self._sync_state(connector),
+                report=IngestionReport(connector=connector.sync_state_key),
+                writer_queue=self.queues[i % len(self.queues)],
+            )
+            for i, connector in enumerate(self.connectors)
+        ]
+        self.reports = [task.report for task in tasks]
+        writers = [
+            threading.Thread(target=self._write, args=(writer_queue,), name=f"writer-{i}")
+            for i, writer_queue in enumerate(self.queues)
+        ]
+        fetchers = [
+            threading.Thread(
+                target=self._fetch, args=(task,), name=f"fetch-{task.report.connector}"
+            )
+            for task in tasks
+        ]
+        for thread in writers + fetchers:
+            thread.start()
+        for thread in fetchers:
+            thread.join()
+        for writer_queue in self.queues:
+            writer_queue.put(None)
+        for thread in writers:
+            thread.join()
+        for task in tasks:
+            logging.info(f"Ingestion of {task.report}")
+        return self.reports
+
+    def _sync_state(self, connector: ResourceConnector) -> SyncState:
+        with Session(self.engine, expire_on_commit=False) as session:
+            state = session.get(SyncState, connector.sync_state_key)
+            if state is None:
+                state = SyncState(
+                    connector=connector.sync_state_key, platform=connector.platform_name.value
+                )
+                session.add(state)
+                session.commit()
+            session.expunge(state)
+        return state
+
+    def _fetch(self, task: _ConnectorTask):
+        batch: list[SQLModel | ResourceWithRelations] = []
+        try:
+            for item in task.connector.fetch_since(task.state, self.limit):
+                if isinstance(item, FetchFailure):
+                    task.report.n_fetch_failed += 1
+                    _add_failed(task.state, [item.platform_identifier])
+                else:
+                    _remove_failed(task.state, _platform_identifier(item))
+                    batch.append(item)
+                if len(batch) == self.batch_size:
+                    self._put(task, batch)
+                    batch = []
+                if self.cancel.is_set():
+                    # Checked after the item has been added to the batch, because the state of
+                    # the connector already includes the item
+                    task.report.cancelled = True
+                    break
+        except Exception as e:
+            logging.error(f"Error while fetching {task.report.connector}", exc_info=e)
+            task.report.fetch_error = str(e)
+        finally:
+            if len(batch) > 0:
+                self._put(task, batch)
+            task.writer_queue.put(_Done(task=task))
+
+    def _put(self, task: _ConnectorTask, batch: list[SQLModel | ResourceWithRelations]):
+        """Queue the batch, blocking while the queue is full."""
+        task.report.n_fetched += len(batch)
+        task.writer_queue.put(
+            _Batch(
+                task=task,
+                items=batch,
+                resumption_token=task.state.resumption_token,
+                last_identifiers=list(task.state.last_identifiers or []),
+                failed_identifiers=list(task.state.failed_identifiers or []),
+            )
+        )
+
+    def _write(self, writer_queue: queue.Queue):
+        with Session(self.engine) as session:
+            inserters: dict[str, BulkInserter] = {}
+            while (message := writer_queue.get()) is not None:
+                task = message.task
+                if task.report.connector not in inserters:
+                    inserters[task.report.connector] = BulkInserter(
+                        session, task.router, batch_size=self.batch_size, update_existing=True
+                    )
+                    inserters[task.report.connector].preload_named_relations()
+                inserter = inserters[task.report.connector]
+                try:
+                    if isinstance(message, _Batch):
+                        self._write_batch(session, inserter, message)
+                    else:
+                        self._finish(session, task)
+                except Exception as e:
+                    logging.error(f"Error while storing {task.report.connector}", exc_info=e)
+                    session.rollback()
+                    if isinstance(message, _Batch):
+                        task.report.n_failed += len(message.items)
+                        task.failed_stored += _platform_identifiers(message.items)
+                task.report.n_updated = inserter.n_updated
+                if isinstance(message, _Done):
+                    task.report.finished = time.monotonic()
+
+    def _write_batch(self, session: Session, inserter: BulkInserter, batch: _Batch):
+        """
+        Store the batch and the SyncState after the batch in a single transaction. Only if the
+        batch has to be retried resource by resource (because some of them failed), the state is
+        committed separately, after the resources.
+        """
+        task = batch.task
+        state = _get_state(session, task.report.connector)
+        _update_state(state, batch)
+        results = inserter.insert_batch(batch.items)
+        task.report.n_inserted += sum(created for _, created in results)
+        failed = [item for item, (identifier, _) in zip(batch.items, results) if identifier is None]
+        task.report.n_failed += len(failed)
+        task.failed_stored += _platform_identifiers(failed)
+        # A no-op if the state was committed together with the batch
+        _update_state(state, batch)
+        session.commit()
+
+    def _finish(self, session: Session, task: _ConnectorTask):
+        state = _get_state(session, task.report.connector)
+        state.date_last_run = task.started
+        if task.report.fetch_error is None:
+            # The fetch worker has finished, so its state can be used. It may have moved forward
+            # since the last batch, e.g. if the last resources could not be fetched.
+            state.resumption_token = task.state.resumption_token
+            state.last_identifiers = task.state.last_identifiers
+            state.failed_identifiers = list(task.state.failed_identifiers or [])
+            if self.limit is None and not task.report.cancelled:
+                # All changes have been fetched. The watermark is only moved forward if all of
+                # them have been fetched and stored, so that the failed resources are fetched
+                # again.
+                state.resumption_token = None
+                if task.report.n_failed == 0 and task.report.n_fetch_failed == 0:
+                    state.watermark = task.started
+                    state.failed_identifiers = []
+        _add_failed(state, task.failed_stored)
+        session.commit()
+
+
+def _update_state(state: SyncState, batch: _Batch):
+    """Set the state to the state of the fetch worker after fetching the batch"""
+    state.resumption_token = batch.resumption_token
+    state.last_identifiers = batch.last_identifiers
+    state.failed_identifiers = batch.failed_identifiers
+    _add_failed(state, batch.task.failed_stored)
+
+
+def _add_failed(state: SyncState, platform_identifiers: list[str]):
+    failed = list(state.failed_identifiers or [])
+    state.failed_identifiers = failed + [i for i in platform_identifiers if i not in failed]
+
+
+def _remove_failed(state: SyncState, platform_identifier: str | None):
+    if platform_identifier in (state.failed_identifiers or []):
+        state.failed_identifiers = [i for i in state.failed_identifiers if i != platform_identifier]
+
+
+def _platform_identifier(item: SQLModel | ResourceWithRelations) -> str | None:
+    resource = item.resource if isinstance(item, ResourceWithRelations) else item
+    return getattr(resource, "platform_identifier", None)
+
+
+def _platform_identifiers(items: Sequence[SQLModel | ResourceWithRelations]) -> list[str]:
+    identifiers = (_platform_identifier(item) for item in items)
+    return [identifier for identifier in identifiers if identifier is not None]
+
+
+def _get_state(session: Session, connector: str) -> SyncState:
+    """The SyncState of the connector, which has been created before ingesting"""
+    state = session.get(SyncState, connector)
+    if state is None:
+        raise ValueError(f"The SyncState of {connector} does not exist.")
+    return state
+
+
+def _router(connector: ResourceConnector) -> ResourceRouter:
+    (router,) = [
+        router
+        for router in routers.resource_routers
+        if router.resource_class == connector.resource_class
+    ]
+    return router
@@ -0,0 +1,196 @@
+"""
+Running the synchronization jobs (see database.sync_jobs) in the background.
+
+The JobRunner is a background thread that claims the queued jobs one by one and runs them using
+the IngestionScheduler, so that the API can serve requests while a (possibly hours long) harvest
+is running.
+
+While a job is running, its progress and heartbeat are persisted regularly, and it is checked
+whether the job has been cancelled. Jobs are claimed using a conditional update, so that
+multiple instances of the API can share the same database. A running job whose heartbeat stopped
+(e.g. because its instance was restarted) is queued again. Because the connectors keep their
+SyncState, the job then resumes where it was interrupted.
+"""
+import datetime
+import logging
+import threading
+
+from sqlalchemy import update
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, select
+
+from database import sync_jobs
+from database.ingestion import IngestionReport, IngestionScheduler
+from database.model.sync_job import SyncJob, SyncJobStatus
+from database.setup import add_platforms
+from response_cache import response_cache
+
+DEFAULT_POLL_INTERVAL_SECONDS = 2.0
+DEFAULT_STALE_AFTER_SECONDS = 300.0
+
+
+class JobRunner:
+    """Runs the queued SyncJobs, one at a time, in a background thread."""
+
+    def __init__(
+        self,
+        engine: Engine,
+        poll_interval_seconds: float = DEFAULT_POLL_INTERVAL_SECONDS,
+        stale_after_seconds: float = DEFAULT_STALE_AFTER_SECONDS,
+    ):
+        self.engine = engine
+        self.poll_interval_seconds = poll_interval_seconds
+        self.stale_after_seconds = stale_after_seconds
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="sync-job-runner", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the runner. A running job is cancelled, so that it can be resumed later."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _loop(self):
+        while not self._stop.is_set():
+            try:
+                self._requeue_stale_jobs()
+                job_id = self._claim_next_job()
+                if job_id is not None:
+                    self._run_claimed_job(job_id)
+                    continue
+            except Exception as e:
+                logging.error("Error in the synchronization job runner", exc_info=e)
+            self._stop.wait(self.poll_interval_seconds)
+
+    def _claim_next_job(self) -> int | None:
+        with Session(self.engine) as session:
+            query = (
+                select(SyncJob.identifier)
+                .where(SyncJob.status == SyncJobStatus.queued)
+                .order_by(SyncJob.identifier)
+            )
+            for job_id in session.scalars(query).all():
+                if self._claim(session, job_id):
+                    return job_id
+        return None
+
+    def _claim(self, session: Session, job_id: int) -> bool:
+        """Set the job to running, if no other runner claimed it in the meantime"""
+        now = datetime.datetime.utcnow()
+        result = session.execute(
+            update(SyncJob)
+            .where(SyncJob.identifier == job_id, SyncJob.status == SyncJobStatus.queued)
+            .values(status=SyncJobStatus.running, date_started=now, date_heartbeat=now)
+        )
+        session.commit()
+        return result.rowcount == 1  # type: ignore[attr-defined]  # a CursorResult
+
+    def _requeue_stale_jobs(self):
+        stale = datetime.datetime.utcnow() - datetime.timedelta(seconds=self.stale_after_seconds)
+        with Session(self.engine) as session:
+            result = session.execute(
+                update(SyncJob)
+                .where(SyncJob.status == SyncJobStatus.running, SyncJob.date_heartbeat < stale)
+                .values(status=SyncJobStatus.queued)
+            )
+            session.commit()
+            if result.rowcount > 0:
+                logging.warning(f"Queued {result.rowcount} interrupted synchronization job(s).")
+
+    def run_job(self, job_id: int) -> SyncJobStatus | None:
+        """
+        Claim a queued job and run it in the foreground, blocking until it has finished, without
+        starting the runner. Returns the final status, or None if the job could not be claimed
+        because another runner (e.g. the one of the API) claimed it first.
+        """
+        with Session(self.engine) as session:
+            if not self._claim(session, job_id):
+                logging.warning(f"Synchronization job {job_id} was claimed by another runner.")
+                return None
+        return self._run_claimed_job(job_id)
+
+    def _run_claimed_job(self, job_id: int) -> SyncJobStatus:
+        """Run a job that has been claimed, blocking until it has finished."""
+        with Session(self.engine) as session:
+            job = _get_job(session, job_id)
+            connectors_ = [sync_jobs.available_connectors()[name] for name in job.connectors]
+            limit = job.limit
+        add_platforms(self.engine)
+
+        cancel = threading.Event()
+        scheduler = IngestionScheduler(self.engine, connectors_, limit=limit, cancel=cancel)
+        errors: list[Exception] = []
+
+        def run():
+            try:
+                scheduler.run()
+            except Exception as e:
+                logging.error(f"Error while running synchronization job {job_id}", exc_info=e)
+                errors.append(e)
+
+        thread = threading.Thread(target=run, name=f"sync-job-{job_id}")
+        thread.start()
+        while thread.is_alive():
+            thread.join(self.poll_interval_seconds)
+            if self._stop.is_set():
+                cancel.set()
+            if self._update(job_id, scheduler):
+                cancel.set()
+        response_cache.clear()
+
+        with Session(self.engine) as session:
+            job = _get_job(session, job_id)
+            job.progress = [_progress(report) for report in scheduler.reports]
+            job.date_finished = datetime.datetime.utcnow()
+            fetch_errors = [r.fetch_error for r in scheduler.reports if r.fetch_error is not None]
+            if errors or fetch_errors:
+                status = SyncJobStatus.failed
+                job.error = "; ".join([str(e) for e in errors] + fetch_errors)
+            elif cancel.is_set() and self._stop.is_set() and not job.cancel_requested:
+                status = SyncJobStatus.queued  # Interrupted by a shutdown, to be resumed
+                job.date_finished = None
+            elif cancel.is_set():
+                status = SyncJobStatus.cancelled
+            else:
+                status = SyncJobStatus.succeeded
+            job.status = status
+            if status != SyncJobStatus.queued:
+                job.active_key = None
+            session.commit()
+        logging.info(f"Synchronization job {job_id} {status.value}.")
+        return status
+
+    def _update(self, job_id: int, scheduler: IngestionScheduler) -> bool:
+        """Persist the progress and heartbeat. Returns whether the job should be cancelled."""
+        with Session(self.engine) as session:
+            job = _get_job(session, job_id)
+            job.progress = [_progress(report) for report in scheduler.reports]
+            job.date_heartbeat = datetime.datetime.utcnow()
+            session.commit()
+            return job.cancel_requested
+
+
+def _get_job(session: Session, job_id: int) -> SyncJob:
+    job = session.get(SyncJob, job_id)
+    if job is None:
+        raise ValueError(f"Synchronization job {job_id} does not exist.")
+    return job
+
+
+def _progress(report: IngestionReport) -> dict:
+    return {
+        "connector": report.connector,
+        "fetched": report.n_fetched,
+        "inserted": report.n_inserted,
+        "updated": report.n_updated,
+        "failed": report.n_failed,
+        "fetch_failed": report.n_fetch_failed,
+        "resources_per_second": round(report.resources_per_second, 2),
+        "finished": report.finished is not None,
+    }
@@ -19,7 +19,7 @@ class CaseStudyAlternateNameLink(SQLModel, table=True):  # type: ignore [call-ar
         )
     )
     alternate_name_identifier: int = Field(
-        foreign_key="case_study_alternate_name.identifier", primary_key=True
+        foreign_key="case_study_alternate_name.identifier", primary_key=True, index=True
     )
 
 
@@ -10,5 +10,5 @@ class CaseStudyBusinessCategoryLink(SQLModel, table=True):  # type: ignore [call
         )
     )
     business_category_identifier: int = Field(
-        foreign_key="business_category.identifier", primary_key=True
+        foreign_key="business_category.identifier", primary_key=True, index=True
     )
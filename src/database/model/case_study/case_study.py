@@ -2,6 +2,7 @@ from datetime import datetime
 from typing import List
 
 from sqlmodel import Field, Relationship
+from database.fulltext import add_fulltext_index
 from database.model.case_study.alternate_name import (
     CaseStudyAlternateName,
     CaseStudyAlternateNameLink,
@@ -22,6 +23,7 @@ from database.model.case_study.business_category_link import CaseStudyBusinessCa
 
 from database.model.general.technical_category import TechnicalCategory
 from database.model.case_study.technical_category_link import CaseStudyTechnicalCategoryLink
+from database.model.row_version import RowVersion
 
 
 class CaseStudyBase(Resource):
@@ -35,10 +37,10 @@ class CaseStudyBase(Resource):
         max_length=150, default=None, schema_extra={"example": "John Doe"}
     )
     date_modified: datetime | None = Field(
-        default=None, schema_extra={"example": "2023-01-01T15:15:00.000Z"}
+        default=None, index=True, schema_extra={"example": "2023-01-01T15:15:00.000Z"}
     )
     date_published: datetime | None = Field(
-        default=None, schema_extra={"example": "2022-01-01T15:15:00.000Z"}
+        default=None, index=True, schema_extra={"example": "2022-01-01T15:15:00.000Z"}
     )
     same_as: str | None = Field(
         max_length=150,
@@ -49,7 +51,7 @@ class CaseStudyBase(Resource):
     is_accessible_for_free: bool = Field(default=True)
 
 
-class CaseStudy(CaseStudyBase, table=True):  # type: ignore [call-arg]
+class CaseStudy(CaseStudyBase, RowVersion, table=True):  # type: ignore [call-arg]
     __tablename__ = "case_study"
 
     identifier: int = Field(default=None, primary_key=True)
@@ -87,3 +89,6 @@ class CaseStudy(CaseStudyBase, table=True):  # type: ignore [call-arg]
             serializer=AttributeSerializer("name"),
             deserializer=FindByNameDeserializer(TechnicalCategory),
         )
+
+
+add_fulltext_index(CaseStudy, "name", "description")
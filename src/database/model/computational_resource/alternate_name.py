@@ -19,7 +19,7 @@ class ComputationalResourceAlternateNameLink(SQLModel, table=True):  # type: ign
         )
     )
     alternate_name_identifier: int = Field(
-        foreign_key="computational_resource_alternate_name.identifier", primary_key=True
+        foreign_key="computational_resource_alternate_name.identifier", primary_key=True, index=True
     )
 
 
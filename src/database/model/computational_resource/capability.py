@@ -19,7 +19,7 @@ class ComputationalResourceCapabilityLink(SQLModel, table=True):  # type: ignore
         )
     )
     capability_identifier: int = Field(
-        foreign_key="computational_resource_capability.identifier", primary_key=True
+        foreign_key="computational_resource_capability.identifier", primary_key=True, index=True
     )
 
 
@@ -19,7 +19,7 @@ class ComputationalResourceCitationLink(SQLModel, table=True):  # type: ignore [
         )
     )
     citation_identifier: int = Field(
-        foreign_key="computational_resource_citation.identifier", primary_key=True
+        foreign_key="computational_resource_citation.identifier", primary_key=True, index=True
     )
 
 
@@ -54,6 +54,7 @@ from database.model.general.application_areas import ApplicationArea
 from database.model.general.keyword import Keyword
 from database.model.general.research_areas import ResearchArea
 from database.model.relationships import ResourceRelationshipList
+from database.model.row_version import RowVersion
 from serialization import (
     CastDeserializer,
     FindByIdentifierDeserializer,
@@ -81,7 +82,7 @@ class ComputationalResourceBase(AIAsset):
         schema_extra={"example": "https://www.example.com/computational_resource/example"},
     )
     creationTime: datetime | None = Field(
-        default=None, schema_extra={"example": "2022-01-01T15:15:00.000Z"}
+        default=None, index=True, schema_extra={"example": "2022-01-01T15:15:00.000Z"}
     )
     validity: int | None = Field(
         schema_extra={"example": 22},
@@ -104,7 +105,7 @@ class ComputationalResourceBase(AIAsset):
     qualityLevel: str | None = Field(max_length=500, schema_extra={"example": "test"})
 
 
-class ComputationalResource(ComputationalResourceBase, table=True):  # type: ignore [call-arg]
+class ComputationalResource(ComputationalResourceBase, RowVersion, table=True):  # type: ignore [call-arg]  # noqa E501
     __tablename__ = "computational_resource"
 
     identifier: int = Field(primary_key=True, foreign_key="ai_asset.identifier")
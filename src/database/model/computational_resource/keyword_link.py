@@ -16,4 +16,4 @@ class ComputationalResourceKeywordLink(SQLModel, table=True):  # type: ignore [c
             primary_key=True,
         )
     )
-    keyword_identifier: int = Field(foreign_key="keyword.identifier", primary_key=True)
+    keyword_identifier: int = Field(foreign_key="keyword.identifier", primary_key=True, index=True)
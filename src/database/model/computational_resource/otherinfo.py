@@ -19,7 +19,7 @@ class ComputationalResourceOtherInfoLink(SQLModel, table=True):  # type: ignore
         )
     )
     other_info_identifier: int = Field(
-        foreign_key="computational_resource_other_info.identifier", primary_key=True
+        foreign_key="computational_resource_other_info.identifier", primary_key=True, index=True
     )
 
 
@@ -19,7 +19,7 @@ class DatasetAlternateNameLink(SQLModel, table=True):  # type: ignore [call-arg]
         )
     )
     alternate_name_identifier: int | None = Field(
-        foreign_key="dataset_alternate_name.identifier", primary_key=True
+        foreign_key="dataset_alternate_name.identifier", primary_key=True, index=True
     )
 
 
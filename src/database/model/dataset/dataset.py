@@ -4,6 +4,7 @@ from typing import Optional, List
 from sqlalchemy import UniqueConstraint, Column, Integer, ForeignKey
 from sqlmodel import Field, Relationship, SQLModel
 
+from database.fulltext import add_fulltext_index
 from database.model.ai_asset import AIAsset
 from database.model.dataset.alternate_name import DatasetAlternateNameLink, DatasetAlternateName
 from database.model.dataset.data_download import DataDownloadORM, DataDownload
@@ -19,6 +20,7 @@ from database.model.general.license import License
 from database.model.publication.publication import Publication
 from database.model.relationships import ResourceRelationshipList, ResourceRelationshipSingle
 from database.model.resource import Resource
+from database.model.row_version import RowVersion
 from serialization import (
     AttributeSerializer,
     FindByNameDeserializer,
@@ -59,10 +61,10 @@ class DatasetBase(AIAsset):
     )
     # TODO(issue 9): contact + creator + publisher repeated organization/person
     date_modified: datetime | None = Field(
-        default=None, schema_extra={"example": "2023-01-01T15:15:00.000Z"}
+        default=None, index=True, schema_extra={"example": "2023-01-01T15:15:00.000Z"}
     )
     date_published: datetime | None = Field(
-        default=None, schema_extra={"example": "2022-01-01T15:15:00.000Z"}
+        default=None, index=True, schema_extra={"example": "2022-01-01T15:15:00.000Z"}
     )
     funder: str | None = Field(max_length=150, default=None, schema_extra={"example": "John Doe"})
     # TODO(issue 9): funder repeated organization/person
@@ -73,15 +75,15 @@ class DatasetBase(AIAsset):
         max_length=500, default=None, schema_extra={"example": "New York"}
     )
     temporal_coverage_from: datetime | None = Field(
-        default=None, schema_extra={"example": "2020-01-01T00:00:00.000Z"}
+        default=None, index=True, schema_extra={"example": "2020-01-01T00:00:00.000Z"}
     )
     temporal_coverage_to: datetime | None = Field(
-        default=None, schema_extra={"example": "2021-01-01T00:00:00.000Z"}
+        default=None, index=True, schema_extra={"example": "2021-01-01T00:00:00.000Z"}
     )
     version: str | None = Field(max_length=150, default=None, schema_extra={"example": "1.1.0"})
 
 
-class Dataset(DatasetBase, table=True):  # type: ignore [call-arg]
+class Dataset(DatasetBase, RowVersion, table=True):  # type: ignore [call-arg]
     __tablename__ = "dataset"
 
     __table_args__ = Resource.__table_args__ + (
@@ -94,7 +96,7 @@ class Dataset(DatasetBase, table=True):  # type: ignore [call-arg]
 
     identifier: int = Field(primary_key=True, foreign_key="ai_asset.identifier")
 
-    license_identifier: int | None = Field(foreign_key="license.identifier")
+    license_identifier: int | None = Field(foreign_key="license.identifier", index=True)
     license: Optional[License] = Relationship(back_populates="datasets")
     alternate_names: List[DatasetAlternateName] = Relationship(
         back_populates="datasets", link_model=DatasetAlternateNameLink
@@ -172,3 +174,6 @@ deserializer = FindByIdentifierDeserializer(Dataset)
 Dataset.RelationshipConfig.is_part.deserializer = deserializer  # type: ignore[attr-defined]
 Dataset.RelationshipConfig.has_parts.deserializer = deserializer  # type: ignore[attr-defined]
 Publication.RelationshipConfig.datasets.deserializer = deserializer  # type: ignore[attr-defined]
+
+
+add_fulltext_index(Dataset, "name", "description")
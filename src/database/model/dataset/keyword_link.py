@@ -9,4 +9,4 @@ class DatasetKeywordLink(SQLModel, table=True):  # type: ignore [call-arg]
             Integer, ForeignKey("dataset.identifier", ondelete="CASCADE"), primary_key=True
         )
     )
-    keyword_identifier: int = Field(foreign_key="keyword.identifier", primary_key=True)
+    keyword_identifier: int = Field(foreign_key="keyword.identifier", primary_key=True, index=True)
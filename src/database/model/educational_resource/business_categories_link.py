@@ -12,5 +12,5 @@ class EducationalResourceBusinessCategoryLink(SQLModel, table=True):  # type: ig
         )
     )
     business_category_identifier: int = Field(
-        foreign_key="business_category.identifier", primary_key=True
+        foreign_key="business_category.identifier", primary_key=True, index=True
     )
@@ -1,6 +1,7 @@
 from datetime import datetime
 from sqlmodel import Field, Relationship
 from typing import List
+from database.fulltext import add_fulltext_index
 from database.model.educational_resource.business_categories_link import (
     EducationalResourceBusinessCategoryLink,
 )
@@ -21,13 +22,14 @@ from database.model.relationships import ResourceRelationshipList
 from serialization import AttributeSerializer, FindByNameDeserializer
 
 from database.model.ai_asset import AIAsset
+from database.model.row_version import RowVersion
 
 
 class EducationalResourceBase(AIAsset):
     # Required fields
     title: str = Field(max_length=150, schema_extra={"example": "Example News"})
     date_modified: datetime | None = Field(
-        default=None, schema_extra={"example": "2022-01-01T15:15:00.000Z"}
+        default=None, index=True, schema_extra={"example": "2022-01-01T15:15:00.000Z"}
     )
     body: str = Field(max_length=500, schema_extra={"example": "Example news body"})
     website_url: str = Field(
@@ -90,7 +92,7 @@ class EducationalResourceBase(AIAsset):
     duration_in_years: int | None = Field(default=None, schema_extra={"example": 0})
 
 
-class EducationalResource(EducationalResourceBase, table=True):  # type: ignore [call-arg]
+class EducationalResource(EducationalResourceBase, RowVersion, table=True):  # type: ignore [call-arg]  # noqa E501
     __tablename__ = "educational_resource"
     identifier: int = Field(primary_key=True, foreign_key="ai_asset.identifier")
     languages: List[Language] = Relationship(
@@ -136,3 +138,6 @@ class EducationalResource(EducationalResourceBase, table=True):  # type: ignore
             serializer=AttributeSerializer("name"),
             deserializer=FindByNameDeserializer(TechnicalCategory),
         )
+
+
+add_fulltext_index(EducationalResource, "title", "body")
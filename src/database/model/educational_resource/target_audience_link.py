@@ -11,4 +11,6 @@ class EducationalResourceTargetAudienceLink(SQLModel, table=True):  # type: igno
             primary_key=True,
         )
     )
-    keyword_identifier: int = Field(foreign_key="target_audience.identifier", primary_key=True)
+    keyword_identifier: int = Field(
+        foreign_key="target_audience.identifier", primary_key=True, index=True
+    )
@@ -12,5 +12,5 @@ class EducationalResourceTechnicalCategoryLink(SQLModel, table=True):  # type: i
         )
     )
     technical_category_identifier: int = Field(
-        foreign_key="technical_category.identifier", primary_key=True
+        foreign_key="technical_category.identifier", primary_key=True, index=True
     )
@@ -10,5 +10,5 @@ class EventApplicationAreaLink(SQLModel, table=True):  # type: ignore [call-arg]
         )
     )
     application_area_identifier: int = Field(
-        foreign_key="application_area.identifier", primary_key=True
+        foreign_key="application_area.identifier", primary_key=True, index=True
     )
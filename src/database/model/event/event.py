@@ -1,6 +1,7 @@
 from datetime import datetime
 from sqlmodel import Field, Relationship, SQLModel
 from typing import List
+from database.fulltext import add_fulltext_index
 from database.model.ai_asset_table import AIAssetTable
 from database.model.event.application_area_link import EventApplicationAreaLink
 from database.model.event.business_category_link import EventBusinessCategoriesLink
@@ -12,6 +13,7 @@ from database.model.general.business_category import BusinessCategory
 from database.model.general.research_areas import ResearchArea
 from database.model.relationships import ResourceRelationshipList
 from database.model.resource import Resource
+from database.model.row_version import RowVersion
 from serialization import AttributeSerializer, FindByIdentifierDeserializer, FindByNameDeserializer
 
 
@@ -31,9 +33,11 @@ class EventBase(Resource):
     location: str = Field(max_length=500, schema_extra={"example": "Example location Event"})
     # Recommended fields
     start_date: datetime | None = Field(
-        default=None, schema_extra={"example": "2021-02-03T15:15:00"}
+        default=None, index=True, schema_extra={"example": "2021-02-03T15:15:00"}
+    )
+    end_date: datetime | None = Field(
+        default=None, index=True, schema_extra={"example": "2022-01-01T15:15:00"}
     )
-    end_date: datetime | None = Field(default=None, schema_extra={"example": "2022-01-01T15:15:00"})
     duration: str | None = Field(
         default=None, max_length=500, schema_extra={"example": "Example duration Event"}
     )
@@ -48,7 +52,7 @@ class EventBase(Resource):
     )
 
 
-class Event(EventBase, table=True):  # type: ignore [call-arg]
+class Event(EventBase, RowVersion, table=True):  # type: ignore [call-arg]
     __tablename__ = "event"
 
     identifier: int = Field(default=None, primary_key=True)
@@ -123,3 +127,6 @@ class Event(EventBase, table=True):  # type: ignore [call-arg]
 deserializer = FindByIdentifierDeserializer(Event)
 Event.RelationshipConfig.super_events.deserializer = deserializer  # type: ignore[attr-defined]
 Event.RelationshipConfig.sub_events.deserializer = deserializer  # type: ignore[attr-defined]
+
+
+add_fulltext_index(Event, "name", "description")
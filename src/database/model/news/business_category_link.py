@@ -10,5 +10,5 @@ class NewsBusinessCategoryLink(SQLModel, table=True):  # type: ignore [call-arg]
         )
     )
     business_category_identifier: int = Field(
-        foreign_key="business_category.identifier", primary_key=True
+        foreign_key="business_category.identifier", primary_key=True, index=True
     )
@@ -9,4 +9,4 @@ class NewsMediaLink(SQLModel, table=True):  # type: ignore [call-arg]
             Integer, ForeignKey("news.identifier", ondelete="CASCADE"), primary_key=True
         )
     )
-    media_identifier: int = Field(foreign_key="media.identifier", primary_key=True)
+    media_identifier: int = Field(foreign_key="media.identifier", primary_key=True, index=True)
@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import List
 from sqlmodel import Field, Relationship
+from database.fulltext import add_fulltext_index
 from database.model.general.keyword import Keyword
 from database.model.general.business_category import BusinessCategory
 from database.model.general.media import Media
@@ -15,13 +16,14 @@ from serialization import (
     FindByNameDeserializer,
 )
 from database.model.resource import Resource
+from database.model.row_version import RowVersion
 
 
 class NewsBase(Resource):
     # Required fields
     title: str = Field(max_length=150, schema_extra={"example": "Example News"})
     date_modified: datetime | None = Field(
-        default=None, schema_extra={"example": "2022-01-01T15:15:00.000Z"}
+        default=None, index=True, schema_extra={"example": "2022-01-01T15:15:00.000Z"}
     )
     body: str = Field(max_length=2000, schema_extra={"example": "Example news body"})
     section: str = Field(max_length=500, schema_extra={"example": "Example news section"})
@@ -36,7 +38,7 @@ class NewsBase(Resource):
     )
 
 
-class News(NewsBase, table=True):  # type: ignore [call-arg]
+class News(NewsBase, RowVersion, table=True):  # type: ignore [call-arg]
     __tablename__ = "news"
     identifier: int = Field(default=None, primary_key=True)
     news_categories: List[NewsCategory] = Relationship(
@@ -69,3 +71,6 @@ class News(NewsBase, table=True):  # type: ignore [call-arg]
             serializer=AttributeSerializer("name"),
             deserializer=FindByNameDeserializer(BusinessCategory),
         )
+
+
+add_fulltext_index(News, "title", "headline", "body")
@@ -10,5 +10,5 @@ class NewsCategoryNewsLink(SQLModel, table=True):  # type: ignore [call-arg]
         )
     )
     news_categories_identifier: int = Field(
-        foreign_key="news_category.identifier", primary_key=True
+        foreign_key="news_category.identifier", primary_key=True, index=True
     )
@@ -10,5 +10,5 @@ class OrganisationBusinessCategoryLink(SQLModel, table=True):  # type: ignore [c
         )
     )
     business_category_identifier: int = Field(
-        foreign_key="business_category.identifier", primary_key=True
+        foreign_key="business_category.identifier", primary_key=True, index=True
     )
@@ -18,7 +18,9 @@ class OrganisationEmailLink(SQLModel, table=True):  # type: ignore [call-arg]
             Integer, ForeignKey("organisation.identifier", ondelete="CASCADE"), primary_key=True
         )
     )
-    email_identifier: int = Field(foreign_key="organisation_email.identifier", primary_key=True)
+    email_identifier: int = Field(
+        foreign_key="organisation_email.identifier", primary_key=True, index=True
+    )
 
 
 class OrganisationEmail(NamedRelation, table=True):  # type: ignore [call-arg]
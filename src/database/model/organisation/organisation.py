@@ -15,6 +15,7 @@ from database.model.organisation.email import (
 from database.model.organisation.member_link import OrganisationMemberLink
 from database.model.organisation.technical_category_link import OrganisationTechnicalCategoryLink
 from database.model.relationships import ResourceRelationshipList, ResourceRelationshipSingle
+from database.model.row_version import RowVersion
 from serialization import AttributeSerializer, FindByNameDeserializer, FindByIdentifierDeserializer
 
 
@@ -38,10 +39,10 @@ class OrganisationBase(Agent):
         schema_extra={"example": "https://www.example.com/organisation/example"},
     )
     founding_date: datetime | None = Field(
-        default=None, schema_extra={"example": "2022-01-01T15:15:00.000Z"}
+        default=None, index=True, schema_extra={"example": "2022-01-01T15:15:00.000Z"}
     )
     dissolution_date: datetime | None = Field(
-        default=None, schema_extra={"example": "2023-01-01T15:15:00.000Z"}
+        default=None, index=True, schema_extra={"example": "2023-01-01T15:15:00.000Z"}
     )
     legal_name: str | None = Field(
         max_length=500, default=None, schema_extra={"example": "Example official name"}
@@ -60,7 +61,7 @@ class OrganisationBase(Agent):
     # the relationship with organisation is nor clear, and is similar to departments.
 
 
-class Organisation(OrganisationBase, table=True):  # type: ignore
+class Organisation(OrganisationBase, RowVersion, table=True):  # type: ignore
     __tablename__ = "organisation"
 
     identifier: int = Field(primary_key=True, foreign_key="agent.identifier")
@@ -10,5 +10,5 @@ class OrganisationTechnicalCategoryLink(SQLModel, table=True):  # type: ignore [
         )
     )
     technical_category_identifier: int = Field(
-        foreign_key="technical_category.identifier", primary_key=True
+        foreign_key="technical_category.identifier", primary_key=True, index=True
     )
@@ -1,5 +1,7 @@
 from sqlmodel import Field, SQLModel
 
+from database.model.row_version import RowVersion
+
 
 class PlatformBase(SQLModel):
     name: str = Field(
@@ -11,7 +13,7 @@ class PlatformBase(SQLModel):
     )
 
 
-class Platform(PlatformBase, table=True):  # type: ignore [call-arg]
+class Platform(PlatformBase, RowVersion, table=True):  # type: ignore [call-arg]
     """The external platforms such as HuggingFace, OpenML and Zenodo that have connectors to
     AIoD. This table is partly filled with the enum PlatformName"""
 
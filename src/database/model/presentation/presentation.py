@@ -2,6 +2,7 @@ from sqlmodel import Field
 from datetime import datetime
 
 from database.model.ai_asset import AIAsset
+from database.model.row_version import RowVersion
 
 
 class PresentationBase(AIAsset):
@@ -16,7 +17,7 @@ class PresentationBase(AIAsset):
         schema_extra={"example": "https://example.com/presentation/example/description"},
     )
     datePublished: datetime | None = Field(
-        default=None, schema_extra={"example": "2022-01-01T15:15:00.000Z"}
+        default=None, index=True, schema_extra={"example": "2022-01-01T15:15:00.000Z"}
     )
     publisher: str | None = Field(
         max_length=150, default=None, schema_extra={"example": "John Doe"}
@@ -30,7 +31,7 @@ class PresentationBase(AIAsset):
     is_accessible_for_free: bool = Field(default=True)
 
 
-class Presentation(PresentationBase, table=True):  # type: ignore [call-arg]
+class Presentation(PresentationBase, RowVersion, table=True):  # type: ignore [call-arg]
     __tablename__ = "presentations"
 
     identifier: int = Field(primary_key=True, foreign_key="ai_asset.identifier")
@@ -3,6 +3,7 @@ from typing import List
 from pydantic import condecimal
 
 from sqlmodel import Field, Relationship
+from database.fulltext import add_fulltext_index
 from database.model.relationships import ResourceRelationshipList
 from serialization import (
     AttributeSerializer,
@@ -13,6 +14,7 @@ from database.model.general.keyword import Keyword
 from database.model.project.keyword_link import ProjectKeywordLink
 
 from database.model.resource import Resource
+from database.model.row_version import RowVersion
 
 MONEY_TYPE = condecimal(max_digits=12, decimal_places=2)
 
@@ -25,10 +27,10 @@ class ProjectBase(Resource):
     # Recommended fields
     doi: str | None = Field(max_length=150, schema_extra={"example": "0000000/000000000000"})
     start_date: datetime | None = Field(
-        default=None, schema_extra={"example": "2022-01-01T15:15:00.000Z"}
+        default=None, index=True, schema_extra={"example": "2022-01-01T15:15:00.000Z"}
     )
     end_date: datetime | None = Field(
-        default=None, schema_extra={"example": "2023-01-01T15:15:00.000Z"}
+        default=None, index=True, schema_extra={"example": "2023-01-01T15:15:00.000Z"}
     )
     founded_under: str | None = Field(
         max_length=250, default=None, schema_extra={"example": "John Doe"}
@@ -63,7 +65,7 @@ class ProjectBase(Resource):
     url: str | None = Field(max_length=250, schema_extra={"example": "aiod.eu/project/0"})
 
 
-class Project(ProjectBase, table=True):  # type: ignore [call-arg]
+class Project(ProjectBase, RowVersion, table=True):  # type: ignore [call-arg]
     __tablename__ = "project"
 
     identifier: int = Field(default=None, primary_key=True)
@@ -75,3 +77,6 @@ class Project(ProjectBase, table=True):  # type: ignore [call-arg]
             deserializer=FindByNameDeserializer(Keyword),
             example=["keyword1", "keyword2"],
         )
+
+
+add_fulltext_index(Project, "name", "project_description_title", "project_description_text")
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 
 from sqlmodel import Field, Relationship
 
+from database.fulltext import add_fulltext_index
 from database.model.dataset.publication_link import DatasetPublicationLink
 from database.model.general.license import License
 from database.model.general.resource_type import ResourceType
@@ -17,6 +18,7 @@ if TYPE_CHECKING:
     from database.model.dataset.dataset import Dataset
 
 from database.model.ai_asset import AIAsset
+from database.model.row_version import RowVersion
 
 
 class PublicationBase(AIAsset):
@@ -28,28 +30,28 @@ class PublicationBase(AIAsset):
     creators: str | None = Field(max_length=450, schema_extra={"example": "John Doe"})
     access_right: str | None = Field(max_length=150, schema_extra={"example": "open access"})
     date_created: datetime | None = Field(
-        default=None, schema_extra={"example": "2022-01-01T15:15:00.000Z"}
+        default=None, index=True, schema_extra={"example": "2022-01-01T15:15:00.000Z"}
     )
     date_published: datetime | None = Field(
-        default=None, schema_extra={"example": "2023-01-01T15:15:00.000Z"}
+        default=None, index=True, schema_extra={"example": "2023-01-01T15:15:00.000Z"}
     )
     url: str | None = Field(
         max_length=250, schema_extra={"example": "https://www.example.com/publication/example"}
     )
 
 
-class Publication(PublicationBase, table=True):  # type: ignore [call-arg]
+class Publication(PublicationBase, RowVersion, table=True):  # type: ignore [call-arg]
     __tablename__ = "publication"
 
     identifier: int = Field(primary_key=True, foreign_key="ai_asset.identifier")
 
-    license_identifier: int | None = Field(foreign_key="license.identifier")
+    license_identifier: int | None = Field(foreign_key="license.identifier", index=True)
     license: Optional[License] = Relationship(back_populates="publications")
 
     datasets: List["Dataset"] = Relationship(
         back_populates="citations", link_model=DatasetPublicationLink
     )
-    resource_type_identifier: int | None = Field(foreign_key="resource_type.identifier")
+    resource_type_identifier: int | None = Field(foreign_key="resource_type.identifier", index=True)
     resource_type: Optional[ResourceType] = Relationship(back_populates="publications")
 
     class RelationshipConfig:
@@ -68,3 +70,6 @@ class Publication(PublicationBase, table=True):  # type: ignore [call-arg]
             deserializer=FindByNameDeserializer(ResourceType),
             example="journal article",
         )
+
+
+add_fulltext_index(Publication, "title")
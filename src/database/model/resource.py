@@ -1,13 +1,22 @@
-from typing import Type, Tuple
+import dataclasses
+import datetime
+import functools
+from typing import Type, Tuple, Any, Callable, ClassVar, Collection, Optional, Sequence
 
-from pydantic import create_model
-from sqlalchemy import CheckConstraint
+from pydantic import BaseModel, create_model
+from sqlalchemy import CheckConstraint, Column, Table, inspect
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.strategy_options import Load
 from sqlalchemy.util import classproperty
-from sqlmodel import SQLModel, Field, UniqueConstraint
+from sqlmodel import SQLModel, Field, Session, UniqueConstraint, select
 from sqlmodel.main import FieldInfo
 
-from database.model.relationships import ResourceRelationshipInfo
-from serialization import create_getter_dict
+from database.model.relationships import (
+    ResourceRelationshipInfo,
+    ResourceRelationshipSingleInfo,
+)
+from database.model.named_relation import NamedRelation
+from serialization import AttributeSerializer, DeSerializer, create_getter_dict
 from database.model.platform.platform_names import PlatformName
 
 
@@ -95,6 +104,27 @@ def resource_create(resource_class: Type[Resource]) -> Type[SQLModel]:
     return model
 
 
+def resource_patch(resource_class: Type[Resource]) -> Type[SQLModel]:
+    """
+    Create a SQLModel for a Patch class of a resource: the Create class, but with all attributes
+    optional, so that it can be used for PATCH requests. Only the attributes that are explicitly
+    given (the `__fields_set__`) should be updated.
+    """
+    resource_class_create = resource_create(resource_class)
+    field_definitions = {
+        name: (Optional[field.outer_type_], Field(default=None, **_field_kwargs(field)))
+        for name, field in resource_class_create.__fields__.items()
+    }
+    return create_model(  # type: ignore[call-overload]
+        resource_class.__name__ + "Patch", __base__=resource_class_create, **field_definitions
+    )
+
+
+def _field_kwargs(field) -> dict[str, Any]:
+    info = field.field_info
+    return {"description": info.description, "schema_extra": info.extra}
+
+
 def resource_read(resource_class: Type[Resource]) -> Type[SQLModel]:
     """
     Create a SQLModel for a Read class of a resource. This Read class is a Pydantic class
@@ -118,6 +148,247 @@ def resource_read(resource_class: Type[Resource]) -> Type[SQLModel]:
     return resource_class_read
 
 
+def resource_loader_options(resource_class: Type[SQLModel]) -> list[Load]:
+    """
+    Create the SqlAlchemy loader options that eagerly load all relationships of a resource that
+    are defined in its RelationshipConfig. Without these options, the relationships are lazily
+    loaded one by one during serialization, resulting in one query per relationship per resource.
+
+    Many-to-one relationships are loaded using a join, lists are loaded using a separate
+    "SELECT ... WHERE IN" query per relationship. If a related object is serialized completely
+    (i.e., it has no Serializer, such as Dataset.distributions), the relationships in its own
+    RelationshipConfig are loaded as well.
+    """
+    relationships_orm = inspect(resource_class).relationships
+    options: list[Load] = []
+    for attribute_name, relationship in _get_relationships(resource_class).items():
+        if attribute_name not in relationships_orm:
+            continue
+        attribute = getattr(resource_class, attribute_name)
+        if isinstance(relationship, ResourceRelationshipSingleInfo):
+            option = joinedload(attribute)
+        else:
+            option = selectinload(attribute)
+        if relationship.serializer is None:
+            related_class = relationships_orm[attribute_name].mapper.class_
+            nested_options = resource_loader_options(related_class)
+            if len(nested_options) > 0:
+                option = option.options(*nested_options)
+        options.append(option)
+    return options
+
+
+def load_relationships(resources: Sequence[SQLModel]) -> None:
+    """
+    Load the relationships of resources that were retrieved without the resource_loader_options,
+    using a single query for all resources (plus one "SELECT ... WHERE IN" per relationship),
+    instead of lazily loading them one resource at a time. Does nothing if the relationships
+    are loaded already.
+    """
+    if len(resources) == 0:
+        return
+    resource_class = type(resources[0])
+    mapper = inspect(resource_class)
+    names = _get_relationships(resource_class).keys() & mapper.relationships.keys()
+    unloaded = [
+        state
+        for state in (
+            inspect(resource)
+            for resource in resources
+            if any(name not in resource.__dict__ for name in names)
+        )
+        if state.session is not None
+    ]
+    if len(unloaded) == 0:
+        return
+    (primary_key,) = mapper.primary_key
+    query = (
+        select(resource_class)
+        .where(primary_key.in_([state.identity[0] for state in unloaded]))
+        .options(*resource_loader_options(resource_class))
+    )
+    unloaded[0].session.scalars(query).all()
+
+
+@dataclasses.dataclass(frozen=True)
+class RelationshipCopy:
+    attribute: str  # The attribute of the Create instance, e.g. "license"
+    target: str  # The attribute of the ORM resource, e.g. "license_identifier"
+    deserializer: DeSerializer | None
+
+
+@dataclasses.dataclass(frozen=True)
+class ResourceCopyPlan:
+    """
+    How to copy the values of a Create instance (e.g. DatasetCreate) onto the ORM resource, when
+    creating or updating a resource: the attributes that are copied as-is, and the relationships
+    that need to be deserialized. See `resource_copy_plan`.
+    """
+
+    attributes: tuple[str, ...]
+    relationships: tuple[RelationshipCopy, ...]
+
+    def copy_attributes(
+        self, resource: SQLModel, instance: SQLModel, fields: Collection[str] | None = None
+    ):
+        """Copy the attributes (or only the given fields) that changed."""
+        for attribute in self.attributes:
+            if fields is None or attribute in fields:
+                new_value = getattr(instance, attribute)
+                if getattr(resource, attribute) != new_value:
+                    setattr(resource, attribute, new_value)
+
+    def copy_relationships(
+        self,
+        session: Session,
+        resource: SQLModel,
+        instance: SQLModel,
+        fields: Collection[str] | None = None,
+    ):
+        """
+        Deserialize and set the relationships (or only the given fields). Relationships that are
+        None are left untouched. When a list is assigned, SqlAlchemy only inserts and deletes the
+        rows of the link table that changed.
+        """
+        for relationship in self.relationships:
+            if fields is not None and relationship.attribute not in fields:
+                continue
+            new_value = getattr(instance, relationship.attribute)
+            if new_value is None:
+                continue
+            if relationship.deserializer is not None:
+                new_value = relationship.deserializer.deserialize(session, new_value)
+            setattr(resource, relationship.target, new_value)
+
+
+@functools.cache
+def resource_copy_plan(resource_class: Type[Resource]) -> ResourceCopyPlan:
+    """
+    Create the ResourceCopyPlan of a resource. It is computed once per resource class, so that
+    updating a resource does not require introspection of the (JSON schema of the) model.
+    """
+    relationships = _get_relationships(resource_class)
+    resource_class_create = resource_create(resource_class)
+    return ResourceCopyPlan(
+        attributes=tuple(
+            name
+            for name in resource_class.__fields__
+            if name in resource_class_create.__fields__ and name not in relationships
+        ),
+        relationships=tuple(
+            RelationshipCopy(
+                attribute=name,
+                target=getattr(relationship, "identifier_name", None) or name,
+                deserializer=relationship.deserializer,
+            )
+            for name, relationship in relationships.items()
+        ),
+    )
+
+
+class ResourceFilter(BaseModel):
+    """
+    Base class for the filters on a list of resources. The fields are created by
+    `resource_filter`.
+    """
+
+    sort: str | None = None
+
+    conditions: ClassVar[dict[str, Callable[[Any], Any]]] = {}
+    sortable: ClassVar[dict[str, Any]] = {}
+
+    def where_clauses(self) -> list:
+        """The SqlAlchemy where-clauses of all filters that have a value."""
+        return [
+            condition(getattr(self, name))
+            for name, condition in self.conditions.items()
+            if getattr(self, name) is not None
+        ]
+
+
+def resource_filter(resource_class: Type[SQLModel]) -> Type[ResourceFilter]:
+    """
+    Create a Pydantic class containing the filters on the list of resources. It can be used as
+    FastAPI dependency, resulting in a query parameter per filter.
+
+    Only indexed columns can be filtered and sorted on, so that filtering never results in a
+    full table scan. For each indexed column there is an equality filter, and for each indexed
+    datetime column a range filter `[column]_after` (inclusive) and `[column]_before`
+    (exclusive). For each relationship to a NamedRelation (such as keywords and licenses) that
+    is serialized by its name, there is a filter on this name.
+    """
+    table = resource_class.__table__  # type: ignore[attr-defined]
+    fields: dict[str, Any] = {}
+    conditions: dict[str, Callable[[Any], Any]] = {}
+    sortable: dict[str, Any] = {"identifier": resource_class.identifier}  # type: ignore
+
+    for column in table.columns:
+        if (
+            column.primary_key
+            or column.name == "platform"
+            or len(column.foreign_keys) > 0
+            or not _is_indexed(table, column)
+        ):
+            continue
+        attribute = getattr(resource_class, column.name)
+        type_ = resource_class.__fields__[column.name].type_
+        sortable[column.name] = attribute
+        if type_ == datetime.datetime:
+            fields[f"{column.name}_after"] = (datetime.datetime | None, None)
+            fields[f"{column.name}_before"] = (datetime.datetime | None, None)
+            conditions[f"{column.name}_after"] = attribute.__ge__
+            conditions[f"{column.name}_before"] = attribute.__lt__
+        else:
+            fields[column.name] = (type_ | None, None)
+            conditions[column.name] = attribute.__eq__
+
+    relationships_orm = inspect(resource_class).relationships
+    for attribute_name, relationship in _get_relationships(resource_class).items():
+        serializer = relationship.serializer
+        if (
+            attribute_name not in relationships_orm
+            or not isinstance(serializer, AttributeSerializer)
+            or serializer.attribute_name != "name"
+        ):
+            continue
+        related_class = relationships_orm[attribute_name].mapper.class_
+        if not issubclass(related_class, NamedRelation):
+            continue
+        attribute = getattr(resource_class, attribute_name)
+        fields[attribute_name] = (str | None, None)
+        if isinstance(relationship, ResourceRelationshipSingleInfo):
+            conditions[attribute_name] = _has_name(attribute, related_class)
+        else:
+            conditions[attribute_name] = _any_name(attribute, related_class)
+
+    model = create_model(
+        resource_class.__name__ + "Filter", __base__=ResourceFilter, **fields  # type: ignore
+    )
+    model.conditions = conditions
+    model.sortable = sortable
+    return model
+
+
+def _is_indexed(table: Table, column: Column) -> bool:
+    """Whether this column is the first column of any index (or unique constraint)."""
+    if column.index or column.unique:
+        return True
+    leading_columns = [list(index.columns)[0] for index in table.indexes] + [
+        list(constraint.columns)[0]
+        for constraint in table.constraints
+        if isinstance(constraint, UniqueConstraint) and len(constraint.columns) > 0
+    ]
+    return any(leading is column for leading in leading_columns)
+
+
+def _has_name(attribute, related_class: Type[NamedRelation]) -> Callable[[str], Any]:
+    return lambda name: attribute.has(related_class.name == name)
+
+
+def _any_name(attribute, related_class: Type[NamedRelation]) -> Callable[[str], Any]:
+    return lambda name: attribute.any(related_class.name == name)
+
+
 def _update_model_serialization(resource_class: Type[SQLModel], resource_class_read):
     """
     For every Serializer defined on the RelationshipConfig of the resource, use this Serializer in
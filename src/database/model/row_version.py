@@ -0,0 +1,111 @@
+import itertools
+from datetime import datetime
+from typing import Iterable
+
+from sqlalchemy import Column, DateTime, event, inspect, update
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import MANYTOONE, Mapper, RelationshipProperty, Session as OrmSession
+from sqlmodel import SQLModel, Field
+
+
+class MicrosecondDateTime(DateTime):
+    """
+    A DateTime with microsecond precision. MySQL truncates a DATETIME to whole seconds unless
+    its fractional seconds precision is given, other databases use their generic DateTime.
+
+    This is not `DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql")`: a variant cannot be
+    deep-copied, which Pydantic does with the fields of a mixin such as RowVersion.
+    """
+
+    cache_ok = True
+
+
+@compiles(MicrosecondDateTime, "mysql")
+def _compile_microsecond_datetime_mysql(type_, compiler, **kwargs) -> str:
+    return "DATETIME(6)"
+
+
+class RowVersion(SQLModel):
+    """
+    Mixin for the table classes of resources, keeping track of the moment the row was last
+    created or updated in AIoD, including changes to the resources on the other side of its
+    back-populated relationships (see `_before_flush`). It is used as validator for conditional
+    requests (ETag and Last-Modified headers).
+
+    It should only be added to the table class (e.g. `Dataset`), not the base class (e.g.
+    `DatasetBase`), so that it is not part of the Create and Read classes.
+    """
+
+    # Using microsecond precision, so that two updates within the same second still result in
+    # different ETags.
+    aiod_date_modified: datetime | None = Field(
+        default_factory=datetime.utcnow,
+        sa_column=Column(MicrosecondDateTime()),
+        description="The moment this item was last created or updated in AIoD.",
+    )
+
+
+def touch_related(session: OrmSession, resource: SQLModel):
+    """
+    Update the row version of the resources on the other side of the back-populated
+    relationships of this resource. Call this before deleting the resource using a statement,
+    which bypasses the flush (see `_before_flush`).
+    """
+    related: dict[type, set[int]] = {}
+    for relationship in _back_populated(inspect(resource).mapper):
+        value = getattr(resource, relationship.key)
+        values = value if isinstance(value, list) else [value]
+        _add(related, relationship, (v.identifier for v in values if v is not None))
+    _update_row_versions(session, related)
+
+
+@event.listens_for(OrmSession, "before_flush")
+def _before_flush(session: OrmSession, flush_context, instances):
+    """
+    The representation of a resource contains the identifiers of the resources on the other side
+    of its back-populated relationships (e.g. the datasets of a publication are the datasets
+    citing it). If such a relationship changes, the row version of the resources on the other
+    side is updated as well, otherwise their ETag and cached representations would be stale.
+    """
+    related: dict[type, set[int]] = {}
+    for instance in itertools.chain(session.new, session.dirty):
+        state = inspect(instance)
+        for relationship in _back_populated(state.mapper):
+            changed = _changed(state.attrs[relationship.key].history)
+            _add(related, relationship, (o.identifier for o in changed if o is not None))
+            if relationship.direction is MANYTOONE:
+                # Many-to-one relationships are often set using their foreign key
+                for column in relationship.local_columns:
+                    key = state.mapper.get_property_by_column(column).key
+                    _add(related, relationship, _changed(state.attrs[key].history))
+    _update_row_versions(session, related)
+
+
+def _back_populated(mapper: Mapper) -> Iterable[RelationshipProperty]:
+    return (
+        relationship
+        for relationship in mapper.relationships
+        if relationship.back_populates and issubclass(relationship.mapper.class_, RowVersion)
+    )
+
+
+def _changed(history) -> Iterable:
+    """The added and deleted values, which are None if the attribute was not loaded"""
+    return itertools.chain(history.added or (), history.deleted or ())
+
+
+def _add(related: dict[type, set[int]], relationship: RelationshipProperty, identifiers):
+    identifiers = {identifier for identifier in identifiers if identifier is not None}
+    if identifiers:
+        related.setdefault(relationship.mapper.class_, set()).update(identifiers)
+
+
+def _update_row_versions(session: OrmSession, related: dict[type, set[int]]):
+    now = datetime.utcnow()
+    for clazz, identifiers in related.items():
+        statement = (
+            update(clazz)
+            .where(clazz.identifier.in_(identifiers))  # type: ignore[attr-defined]
+            .values(aiod_date_modified=now)
+        )
+        session.execute(statement, execution_options={"synchronize_session": False})
@@ -0,0 +1,36 @@
+from datetime import datetime
+
+from sqlalchemy import Column, Text
+from sqlmodel import Field, SQLModel
+
+from database.model.row_version import MicrosecondDateTime
+
+
+class SchemaDocument(SQLModel, table=True):  # type: ignore [call-arg]
+    """
+    The rendered JSON(-LD) document of a resource in another schema than "aiod", such as the
+    schema.org or dcat-ap representation of a dataset.
+
+    The documents are rendered when they are first read, and rendered again when the resource
+    has been updated since (its row version differs from the version of the document). See
+    database/schema_documents.py.
+    """
+
+    __tablename__ = "schema_document"
+
+    resource_type: str = Field(
+        primary_key=True, max_length=64, description="The resource name, e.g. 'dataset'."
+    )
+    schema_name: str = Field(
+        primary_key=True, max_length=64, description="The schema, e.g. 'dcat-ap'."
+    )
+    identifier: int = Field(primary_key=True, description="The identifier of the resource.")
+    version: datetime | None = Field(
+        default=None,
+        sa_column=Column(MicrosecondDateTime()),
+        description="The row version (aiod_date_modified) of the resource that was rendered.",
+    )
+    content: str = Field(
+        sa_column=Column(Text(length=2**32 - 1), nullable=False),  # LONGTEXT on MySQL
+        description="The encoded JSON document.",
+    )
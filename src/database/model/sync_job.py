@@ -0,0 +1,59 @@
+import enum
+from datetime import datetime
+
+from sqlalchemy import Column, JSON, Text
+from sqlmodel import Field, SQLModel
+
+
+class SyncJobStatus(str, enum.Enum):
+    queued = "queued"
+    running = "running"
+    succeeded = "succeeded"
+    failed = "failed"
+    cancelled = "cancelled"
+
+
+class SyncJobCreate(SQLModel):
+    connectors: list[str] = Field(
+        description="The connectors to synchronize, identified as {platform}/{resource table}, "
+        "e.g. 'zenodo/dataset'.",
+        schema_extra={"example": ["openml/dataset", "zenodo/dataset"]},
+        sa_column=Column(JSON),
+    )
+    limit: int | None = Field(
+        default=None,
+        description="The maximum number of resources to fetch per connector.",
+    )
+
+
+class SyncJob(SyncJobCreate, table=True):  # type: ignore [call-arg]
+    """
+    A synchronization of one or more connectors, run in the background by the JobRunner (see
+    database.sync_jobs).
+    """
+
+    __tablename__ = "sync_job"
+
+    identifier: int | None = Field(default=None, primary_key=True)
+    status: SyncJobStatus = Field(default=SyncJobStatus.queued, max_length=16, index=True)
+    progress: list[dict] = Field(
+        default_factory=list,
+        sa_column=Column(JSON),
+        description="The progress per connector.",
+    )
+    error: str | None = Field(default=None, sa_column=Column(Text))
+    active_key: str | None = Field(
+        default=None,
+        max_length=64,
+        unique=True,
+        description="Only one queued or running job can have the same key, see "
+        "database.sync_jobs.create_job_once. Cleared when the job finishes.",
+    )
+    cancel_requested: bool = Field(default=False)
+    date_created: datetime = Field(default_factory=datetime.utcnow)
+    date_started: datetime | None = Field(default=None)
+    date_finished: datetime | None = Field(default=None)
+    date_heartbeat: datetime | None = Field(
+        default=None,
+        description="Updated regularly while the job is running, to detect interrupted jobs.",
+    )
@@ -0,0 +1,46 @@
+from datetime import datetime
+
+from sqlalchemy import Column, JSON, Text
+from sqlmodel import Field, SQLModel
+
+
+class SyncState(SQLModel, table=True):  # type: ignore [call-arg]
+    """
+    The synchronization state of a connector, so that a connector only needs to fetch the
+    records that changed since its last run, and can resume after an interrupted run.
+
+    The state is updated by the connector while fetching (see ResourceConnector.fetch_since), and
+    committed together with each batch of resources.
+    """
+
+    __tablename__ = "sync_state"
+
+    connector: str = Field(
+        primary_key=True,
+        max_length=64,
+        description="The connector, identified as {platform}/{resource table}, e.g. "
+        "'zenodo/dataset'.",
+    )
+    platform: str = Field(max_length=64, foreign_key="platform.name")
+    watermark: datetime | None = Field(
+        default=None,
+        description="The start of the last successful run. The next run only needs to fetch the "
+        "records that changed since this moment.",
+    )
+    resumption_token: str | None = Field(
+        default=None,
+        sa_column=Column(Text),
+        description="The position within an unfinished run, such as an OAI-PMH resumption token.",
+    )
+    last_identifiers: list[str] = Field(
+        default_factory=list,
+        sa_column=Column(JSON),
+        description="The platform identifiers of the last fetched records.",
+    )
+    failed_identifiers: list[str] = Field(
+        default_factory=list,
+        sa_column=Column(JSON),
+        description="The platform identifiers of the records that could not be fetched or "
+        "stored, which should be fetched again on the next run.",
+    )
+    date_last_run: datetime | None = Field(default=None)
@@ -0,0 +1,123 @@
+"""
+A cache of the identifiers of NamedRelations (such as Keyword and License), per Session.
+
+The same few hundred keywords and licenses are used by many resources, so looking them up for
+every resource is wasteful. The NamedRelationCache of a session maps the names to identifiers,
+looks up the unknown names in a single query per class, and inserts the missing names in a
+single statement. The inserts are upserts (INSERT ... ON CONFLICT DO NOTHING on SQLite,
+INSERT ... ON DUPLICATE KEY UPDATE on MySQL), so that concurrent writers inserting the same name
+do not fail on the unique constraint. The identifiers of the inserted names are then read using a
+locking read: on MySQL (REPEATABLE READ), a plain read would use the snapshot of the first read of
+the transaction, which does not contain the names that another transaction committed since.
+
+The identifiers of names that were inserted in the current transaction are forgotten on a
+rollback.
+"""
+from typing import Iterable, Type
+
+from sqlalchemy import event, insert
+from sqlalchemy.dialects import mysql, sqlite
+from sqlalchemy.orm import Session as OrmSession, make_transient_to_detached
+from sqlmodel import Session, select
+
+from database.model.named_relation import NamedRelation
+
+_SESSION_INFO_KEY = "named_relation_cache"
+
+
+class NamedRelationCache:
+    def __init__(self):
+        self._identifiers: dict[Type[NamedRelation], dict[str, int]] = {}
+        self._uncommitted: dict[Type[NamedRelation], set[str]] = {}
+
+    @staticmethod
+    def of(session: Session) -> "NamedRelationCache":
+        """The cache of this session"""
+        if _SESSION_INFO_KEY not in session.info:
+            session.info[_SESSION_INFO_KEY] = NamedRelationCache()
+        return session.info[_SESSION_INFO_KEY]
+
+    def preload(self, session: Session, clazz: Type[NamedRelation]):
+        """Load all names of this class, e.g. before inserting many resources."""
+        query = select(clazz.name, clazz.identifier)
+        self._identifiers.setdefault(clazz, {}).update(session.execute(query).all())
+
+    def identifiers(
+        self, session: Session, clazz: Type[NamedRelation], names: Iterable[str]
+    ) -> dict[str, int]:
+        """The identifiers of the names, inserting the names that do not exist yet."""
+        cached = self._identifiers.setdefault(clazz, {})
+        missing = set(names) - cached.keys()
+        if missing:
+            cached.update(self._select(session, clazz, missing))
+            new = missing - cached.keys()
+            if new:
+                session.execute(_upsert(session, clazz, sorted(new)))
+                cached.update(self._select(session, clazz, new, lock=True))
+                self._uncommitted.setdefault(clazz, set()).update(new)
+                unresolved = new - cached.keys()
+                if unresolved:
+                    raise ValueError(
+                        f"Could not find or insert the {clazz.__name__} names "
+                        f"{', '.join(sorted(unresolved))}."
+                    )
+        return {name: cached[name] for name in names}
+
+    def objects(
+        self, session: Session, clazz: Type[NamedRelation], names: Iterable[str]
+    ) -> dict[str, NamedRelation]:
+        """
+        The instances of the names, inserting the names that do not exist yet. The instances
+        are attached to the session without querying the database.
+        """
+        objects = {}
+        for name, identifier in self.identifiers(session, clazz, names).items():
+            instance = clazz(identifier=identifier, name=name)
+            make_transient_to_detached(instance)
+            objects[name] = session.merge(instance, load=False)
+        return objects
+
+    def clear(self):
+        self._identifiers.clear()
+        self._uncommitted.clear()
+
+    def _select(
+        self, session: Session, clazz: Type[NamedRelation], names: set[str], lock: bool = False
+    ) -> dict:
+        query = select(clazz.name, clazz.identifier).where(clazz.name.in_(names))  # type: ignore
+        if lock:
+            # A locking read (LOCK IN SHARE MODE on MySQL) reads the latest committed rows
+            query = query.with_for_update(read=True)
+        return dict(session.execute(query).all())
+
+    def _commit(self):
+        self._uncommitted.clear()
+
+    def _rollback(self):
+        for clazz, names in self._uncommitted.items():
+            for name in names:
+                self._identifiers[clazz].pop(name, None)
+        self._uncommitted.clear()
+
+
+def _upsert(session: Session, clazz: Type[NamedRelation], names: list[str]):
+    values = [{"name": name} for name in names]
+    dialect = session.get_bind().dialect.name
+    if dialect == "sqlite":
+        return sqlite.insert(clazz).values(values).on_conflict_do_nothing()
+    if dialect == "mysql":
+        statement = mysql.insert(clazz).values(values)
+        return statement.on_duplicate_key_update(name=statement.inserted.name)
+    return insert(clazz).values(values)
+
+
+@event.listens_for(OrmSession, "after_commit")
+def _after_commit(session: Session):
+    if _SESSION_INFO_KEY in session.info:
+        session.info[_SESSION_INFO_KEY]._commit()
+
+
+@event.listens_for(OrmSession, "after_soft_rollback")
+def _after_rollback(session: Session, previous_transaction):
+    if _SESSION_INFO_KEY in session.info:
+        session.info[_SESSION_INFO_KEY]._rollback()
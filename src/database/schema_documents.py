@@ -0,0 +1,191 @@
+"""
+Materialized documents of resources in the other schemas than "aiod", such as the schema.org and
+dcat-ap representations of datasets.
+
+Converting a resource into such a schema builds a deep graph of Pydantic objects, for every
+resource on every request. Instead, the encoded document is stored in the schema_document
+table, together with the row version (aiod_date_modified) of the resource it was rendered from.
+Retrieving the documents of a page of resources is then a single query on the primary key.
+
+The documents are rendered lazily: when a document is missing, or was rendered from another
+version of the resource, it is rendered and stored when it is read. This covers every way in
+which resources are created and updated (the endpoints, the bulk endpoints and the connectors)
+without extra work while writing. If the converters themselves change, the stored documents are
+outdated while the resources are not. They should then be rebuilt using
+
+    python rebuild_documents.py datasets
+"""
+import logging
+from typing import Sequence, TYPE_CHECKING
+
+from sqlalchemy import delete
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlmodel import SQLModel, Session, select
+
+from converters.schema_converters.schema_converter import SchemaConverter
+from database.model.schema_document import SchemaDocument
+from routers.json_response import dumps
+
+if TYPE_CHECKING:
+    from routers import ResourceRouter
+
+
+def documents(
+    session: Session,
+    resource_type: str,
+    schema: str,
+    converter: SchemaConverter,
+    resources: Sequence[SQLModel],
+) -> list[bytes]:
+    """
+    The encoded documents of the resources (which should have a row version) in given schema,
+    in the same order. The documents that are missing or outdated are rendered and stored.
+
+    A resource without row version (aiod_date_modified is NULL, e.g. a row from before the row
+    version was introduced) is treated as a version of its own: its document is rendered once,
+    and only rendered again after the resource is updated or by a rebuild.
+    """
+    if len(resources) == 0:
+        return []
+    # The resources are table classes with a RowVersion, which the type of SQLModel cannot express
+    identifiers = [resource.identifier for resource in resources]  # type: ignore[attr-defined]
+    versions = {
+        identifier: resource.aiod_date_modified  # type: ignore[attr-defined]
+        for identifier, resource in zip(identifiers, resources)
+    }
+    query = select(SchemaDocument.identifier, SchemaDocument.version, SchemaDocument.content)
+    query = query.where(
+        SchemaDocument.resource_type == resource_type,
+        SchemaDocument.schema_name == schema,
+        SchemaDocument.identifier.in_(identifiers),  # type: ignore[attr-defined]
+    )
+    stored = {
+        identifier: content.encode("utf-8")
+        for identifier, version, content in session.execute(query)
+        if version == versions[identifier]
+    }
+    outdated = [r for identifier, r in zip(identifiers, resources) if identifier not in stored]
+    if len(outdated) > 0:
+        rendered = _render(resource_type, schema, converter, outdated)
+        stored.update(
+            {document.identifier: document.content.encode("utf-8") for document in rendered}
+        )
+        _store(session, resource_type, schema, rendered)
+    return [stored[identifier] for identifier in identifiers]
+
+
+def delete_documents(session: Session, resource_type: str, identifier: int):
+    """Delete the documents of a resource, in all schemas. The session is not committed."""
+    session.execute(
+        delete(SchemaDocument).where(
+            SchemaDocument.resource_type == resource_type,
+            SchemaDocument.identifier == identifier,
+        )
+    )
+
+
+def rebuild(
+    engine: Engine,
+    router: "ResourceRouter",
+    schemas: Sequence[str] | None = None,
+    batch_size: int = 500,
+) -> int:
+    """
+    Render and store the documents of all resources of this router again, for the given schemas
+    (by default all schemas of the router), and delete the documents of resources that no
+    longer exist. The resources are processed in batches, each in its own session.
+
+    Returns:
+        the number of resources.
+    """
+    resource_class = router.resource_class
+    resource_type = router.resource_name
+    schemas = list(router.schema_converters.keys()) if schemas is None else schemas
+    with Session(engine) as session:
+        session.execute(
+            delete(SchemaDocument).where(
+                SchemaDocument.resource_type == resource_type,
+                SchemaDocument.identifier.not_in(  # type: ignore[attr-defined]
+                    select(resource_class.identifier)
+                ),
+            ),
+            execution_options={"synchronize_session": False},
+        )
+        session.commit()
+    query = (
+        select(resource_class)
+        .options(*router.resource_loader_options)
+        .order_by(resource_class.identifier)
+        .limit(batch_size)
+    )
+    n_resources = 0
+    last_identifier = None
+    while True:
+        with Session(engine) as session:
+            batch_query = query
+            if last_identifier is not None:
+                batch_query = query.where(resource_class.identifier > last_identifier)
+            resources = session.scalars(batch_query).all()
+            for schema in schemas:
+                converter = router.schema_converters[schema]
+                rendered = _render(resource_type, schema, converter, resources)
+                _store(session, resource_type, schema, rendered)
+            if len(resources) > 0:
+                last_identifier = resources[-1].identifier
+        n_resources += len(resources)
+        logging.info(f"Rebuilt the documents of {n_resources} {router.resource_name_plural}.")
+        if len(resources) < batch_size:
+            return n_resources
+
+
+def _render(
+    resource_type: str, schema: str, converter: SchemaConverter, resources: Sequence[SQLModel]
+) -> list[SchemaDocument]:
+    return [
+        SchemaDocument(
+            resource_type=resource_type,
+            schema_name=schema,
+            identifier=resource.identifier,  # type: ignore[attr-defined]
+            version=resource.aiod_date_modified,  # type: ignore[attr-defined]
+            content=dumps(converted).decode("utf-8"),
+        )
+        for resource, converted in zip(resources, converter.convert_many(resources))
+    ]
+
+
+def _store(session: Session, resource_type: str, schema: str, rendered: list[SchemaDocument]):
+    """
+    Replace the stored documents by the rendered ones, and commit. The session of the caller is
+    used, instead of a separate session which would need a second connection from the pool while
+    the first is held. Its resources are not expired by the commit, so that the caller can still
+    use them without reloading them.
+
+    Storing is best-effort, because it happens while serving a read request: if it fails (e.g.
+    because another request stored one of these documents in the meantime, or the database is
+    read-only), nothing is stored and the documents are rendered again on a next read.
+    """
+    if len(rendered) == 0:
+        return
+    expire_on_commit = session.expire_on_commit
+    session.expire_on_commit = False
+    try:
+        session.execute(
+            delete(SchemaDocument).where(
+                SchemaDocument.resource_type == resource_type,
+                SchemaDocument.schema_name == schema,
+                SchemaDocument.identifier.in_(  # type: ignore[attr-defined]
+                    [document.identifier for document in rendered]
+                ),
+            )
+        )
+        session.add_all(rendered)
+        session.commit()
+    except IntegrityError:
+        session.rollback()
+        logging.debug(f"The {schema} documents of {resource_type} were stored concurrently.")
+    except SQLAlchemyError as e:
+        session.rollback()
+        logging.warning(f"Could not store the {schema} documents of {resource_type}: {e}")
+    finally:
+        session.expire_on_commit = expire_on_commit
@@ -1,22 +1,50 @@
 """
 Utility functions for initializing the database and tables through SQLAlchemy.
 """
-import logging
 from typing import List
 
-from sqlalchemy import text, and_
+from sqlalchemy import text
 from sqlalchemy.engine import Engine
-from sqlalchemy.exc import IntegrityError
-from sqlmodel import create_engine, Session, select, SQLModel
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import create_engine, Session, select
 
-import routers
+from config import CONNECTOR_CONFIG, DB_CONFIG
 from connectors import ResourceConnector
-from connectors.resource_with_relations import ResourceWithRelations
+from database.bulk_insert import DEFAULT_BATCH_SIZE
+from database.ingestion import IngestionReport, IngestionScheduler
 from database.model.dataset.dataset import Dataset
 from database.model.platform.platform import Platform
 from database.model.publication.publication import Publication
 from database.model.resource import Resource
 from database.model.platform.platform_names import PlatformName
+from response_cache import response_cache
+
+
+def db_url(driver: str = "mysql") -> str:
+    """Return the url of the MySql database as configured in the configuration file."""
+    username = DB_CONFIG.get("name", "root")
+    password = DB_CONFIG.get("password", "ok")
+    host = DB_CONFIG.get("host", "demodb")
+    port = DB_CONFIG.get("port", 3306)
+    database = DB_CONFIG.get("database", "aiod")
+    return f"{driver}://{username}:{password}@{host}:{port}/{database}"
+
+
+def configured_engine(rebuild_db: str) -> Engine:
+    """
+    Return a SqlAlchemy engine, backed by the MySql connection as configured in the configuration
+    file. The database is recreated if rebuild_db is "always".
+    """
+    delete_before_create = rebuild_db == "always"
+    return connect_to_database(db_url(), delete_first=delete_before_create)
+
+
+def configured_async_engine() -> AsyncEngine:
+    """
+    Return an async SqlAlchemy engine, backed by the same MySql database, using the aiomysql
+    driver. The database should already have been created using `configured_engine`.
+    """
+    return create_async_engine(db_url("mysql+aiomysql"), pool_recycle=3600)
 
 
 def connect_to_database(
@@ -60,105 +88,45 @@ def drop_or_create_database(url: str, delete_first: bool):
     engine.dispose()
 
 
-def populate_database(
-    engine: Engine,
-    connectors: List[ResourceConnector],
-    only_if_empty: bool = True,
-    limit: int | None = None,
-):
-    """Add some data to the Dataset and Publication tables."""
-
+def add_platforms(engine: Engine):
+    """Add the PlatformNames that are not in the database yet."""
     with Session(engine) as session:
-        session.add_all([Platform(name=name) for name in PlatformName])
-        data_exists = (
-            session.scalars(select(Publication)).first() or session.scalars(select(Dataset)).first()
+        existing_platforms = set(session.scalars(select(Platform.name)).all())
+        session.add_all(
+            [Platform(name=name) for name in PlatformName if name not in existing_platforms]
         )
-        if only_if_empty and data_exists:
-            return
-
-        for connector in connectors:
-            (router,) = [
-                router
-                for router in routers.resource_routers
-                if router.resource_class == connector.resource_class
-            ]
-            # We use the create_resource function for this router.
-            # This is a temporary solution. After finishing the Connectors (so that they're
-            # synchronizing), we will probably just perform a HTTP POST instead.
-
-            for item in connector.fetch_all(limit=limit):
-                if isinstance(item, ResourceWithRelations):
-                    resource_create_instance = item.resource
-                    _create_or_fetch_related_objects(session, item)
-                else:
-                    resource_create_instance = item
-                if (
-                    _get_existing_resource(
-                        session, resource_create_instance, connector.resource_class
-                    )
-                    is None
-                ):
-                    try:
-                        router.create_resource(session, resource_create_instance)
-                    except IntegrityError as e:
-                        logging.warning(
-                            f"Error while creating resource. Continuing for now: " f" {e}"
-                        )
-                session.flush()
         session.commit()
 
 
-def _get_existing_resource(
-    session: Session, resource: Resource, clazz: type[SQLModel]
-) -> Resource | None:
-    """Selecting a resource based on platform and platform_identifier"""
-    query = select(clazz).where(
-        and_(
-            clazz.platform == resource.platform,
-            clazz.platform_identifier == resource.platform_identifier,
+def data_exists(engine: Engine) -> bool:
+    with Session(engine) as session:
+        return bool(
+            session.scalars(select(Publication)).first() or session.scalars(select(Dataset)).first()
         )
-    )
-    return session.scalars(query).first()
 
 
-def _create_or_fetch_related_objects(session: Session, item: ResourceWithRelations):
+def populate_database(
+    engine: Engine,
+    connectors: List[ResourceConnector],
+    only_if_empty: bool = True,
+    limit: int | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    n_writers: int = CONNECTOR_CONFIG.get("writers", 1),
+) -> list[IngestionReport]:
     """
-    For all resources in the `related_resources`, get the identifier, by either
-    inserting them in the database, or retrieving the existing values, and put the identifiers
-    into the item.resource.[field_name]
+    Add data of the connectors to the database. The connectors are synchronized incrementally:
+    only the resources that changed since the last run are fetched (if the connector supports
+    it), new resources are inserted and existing resources are updated.
+
+    The connectors run concurrently, see database.ingestion. To run the synchronization in the
+    background, use a SyncJob instead (see database.sync_jobs).
     """
-    for field_name, related_resource_or_list in item.related_resources.items():
-        if isinstance(related_resource_or_list, Resource):
-            resources = [related_resource_or_list]
-        else:
-            resources = related_resource_or_list
-        identifiers = []
-        for resource in resources:
-            if (
-                resource.platform is not None
-                and resource.platform != PlatformName.aiod
-                and resource.platform_identifier is not None
-            ):
-                # Get the router of this resource. The difficulty is, that the resource will be a
-                # ResourceRead (e.g. a DatasetRead). So we search for the router for which the
-                # resource name starts with the research-read-name
-
-                resource_read_str = type(resource).__name__  # E.g. DatasetRead
-                (router,) = [
-                    router
-                    for router in routers.resource_routers
-                    if resource_read_str.startswith(router.resource_class.__name__)
-                    # E.g. "DatasetRead".startswith("Dataset")
-                ]
-                existing = _get_existing_resource(session, resource, router.resource_class)
-                if existing is None:
-                    created_resource = router.create_resource(session, resource)
-                    identifiers.append(created_resource.identifier)
-                else:
-                    identifiers.append(existing.identifier)
-
-        if isinstance(related_resource_or_list, Resource):
-            (id_,) = identifiers
-            item.resource.__setattr__(field_name, id_)  # E.g. Dataset.license_identifier = 1
-        else:
-            item.resource.__setattr__(field_name, identifiers)  # E.g. Dataset.keywords = [1, 4]
+    add_platforms(engine)
+    if only_if_empty and data_exists(engine):
+        return []
+    scheduler = IngestionScheduler(
+        engine, connectors, limit=limit, batch_size=batch_size, n_writers=n_writers
+    )
+    reports = scheduler.run()
+    response_cache.clear()
+    return reports
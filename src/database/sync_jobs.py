@@ -0,0 +1,71 @@
+"""
+The synchronization jobs of the connectors. A SyncJob is a persisted record of a synchronization
+of one or more connectors. Jobs are created through the /sync/jobs endpoints, on startup of the
+API (--populate-datasets and --fill-with-examples) or from the command line (see
+synchronize.py), and run by the JobRunner (see database.job_runner).
+"""
+from typing import Sequence
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select
+
+import connectors
+from connectors import ResourceConnector
+from database.model.sync_job import SyncJob, SyncJobStatus
+
+# The active_key of the job that populates the database on startup
+POPULATE_JOB_KEY = "populate"
+
+
+def available_connectors() -> dict[str, ResourceConnector]:
+    """The connectors that can be synchronized, by their name as used in the SyncJob"""
+    return {
+        connector.sync_state_key: connector
+        for connector in (
+            *connectors.dataset_connectors.values(),
+            *connectors.example_connectors.values(),
+        )
+    }
+
+
+def create_job(
+    engine: Engine,
+    connector_names: Sequence[str],
+    limit: int | None = None,
+    active_key: str | None = None,
+) -> SyncJob:
+    unknown = set(connector_names) - set(available_connectors())
+    if unknown:
+        possibilities = ", ".join(f"`{c}`" for c in available_connectors())
+        raise ValueError(
+            f"Unknown connector(s) {', '.join(sorted(unknown))}. Choose one of: {possibilities}."
+        )
+    with Session(engine, expire_on_commit=False) as session:
+        job = SyncJob(connectors=list(connector_names), limit=limit, active_key=active_key)
+        session.add(job)
+        session.commit()
+    return job
+
+
+def create_job_once(
+    engine: Engine, active_key: str, connector_names: Sequence[str], limit: int | None = None
+) -> SyncJob | None:
+    """
+    Create a job, unless a queued or running job with the same active_key exists, in which case
+    None is returned. This is a conditional insert on the unique active_key, so that concurrent
+    processes (such as the uvicorn workers on startup) create the job only once.
+    """
+    try:
+        return create_job(engine, connector_names, limit=limit, active_key=active_key)
+    except IntegrityError:
+        return None
+
+
+def has_active_jobs(engine: Engine) -> bool:
+    """Whether any job is queued or running"""
+    with Session(engine) as session:
+        query = select(SyncJob.identifier).where(
+            SyncJob.status.in_([SyncJobStatus.queued, SyncJobStatus.running])  # type: ignore
+        )
+        return session.scalars(query).first() is not None
@@ -13,14 +13,22 @@ from fastapi import Depends, FastAPI, HTTPException
 from fastapi.responses import HTMLResponse
 from pydantic import Json
 from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
 from starlette.status import HTTP_400_BAD_REQUEST, HTTP_501_NOT_IMPLEMENTED
 
 import connectors
 import routers
 from authentication import get_current_user
-from config import DB_CONFIG, KEYCLOAK_CONFIG
+from config import KEYCLOAK_CONFIG
 from database.model.platform.platform_names import PlatformName
-from database.setup import connect_to_database, populate_database
+from database.setup import (
+    add_platforms,
+    configured_async_engine,
+    configured_engine,
+    data_exists,
+)
+from database.job_runner import JobRunner
+from database.sync_jobs import POPULATE_JOB_KEY, create_job_once, has_active_jobs
 
 
 def _parse_args() -> argparse.Namespace:
@@ -54,6 +62,12 @@ def _parse_args() -> argparse.Namespace:
         help="Limit the number of initial resources with which the database is populated, "
         "per resource and per platform.",
     )
+    parser.add_argument(
+        "--async-db",
+        action="store_true",
+        help="Serve the resource endpoints asynchronously, using the aiomysql driver. Requires "
+        "the `async` optional dependencies.",
+    )
     parser.add_argument(
         "--reload",
         action="store_true",
@@ -62,23 +76,6 @@ def _parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def _engine(rebuild_db: str) -> Engine:
-    """
-    Return a SqlAlchemy engine, backed by the MySql connection as configured in the configuration
-    file.
-    """
-    username = DB_CONFIG.get("name", "root")
-    password = DB_CONFIG.get("password", "ok")
-    host = DB_CONFIG.get("host", "demodb")
-    port = DB_CONFIG.get("port", 3306)
-    database = DB_CONFIG.get("database", "aiod")
-
-    db_url = f"mysql://{username}:{password}@{host}:{port}/{database}"
-
-    delete_before_create = rebuild_db == "always"
-    return connect_to_database(db_url, delete_first=delete_before_create)
-
-
 def _connector_from_platform_name(connector_type: str, connector_dict: Dict, platform_name: str):
     """Get the connector from the connector_dict, identified by its platform name."""
     try:
@@ -113,8 +110,13 @@ def _connector_example_from_resource(resource):
     return connector
 
 
-def add_routes(app: FastAPI, engine: Engine, url_prefix=""):
-    """Add routes to the FastAPI application"""
+def add_routes(
+    app: FastAPI, engine: Engine, url_prefix="", async_engine: AsyncEngine | None = None
+):
+    """
+    Add routes to the FastAPI application. If an async_engine is given, the resource endpoints
+    are served asynchronously using this engine.
+    """
 
     @app.get(url_prefix + "/", response_class=HTMLResponse)
     def home() -> str:
@@ -138,7 +140,13 @@ def add_routes(app: FastAPI, engine: Engine, url_prefix=""):
         """
         return {"msg": "success", "user": user}
 
-    for router in routers.resource_routers + routers.other_routers:
+    for router in routers.resource_routers:
+        app.include_router(router.create(async_engine or engine, url_prefix))
+    app.include_router(routers.counts_router.create(async_engine or engine, url_prefix))
+    app.include_router(routers.catalog_router.create(async_engine or engine, url_prefix))
+    for router in routers.other_routers:
+        # The other routers perform blocking IO other than database access (e.g. the upload to
+        # HuggingFace), so they always use the synchronous engine.
         app.include_router(router.create(engine, url_prefix))
 
 
@@ -167,16 +175,19 @@ def create_app() -> FastAPI:
         _connector_example_from_resource(resource) for resource in args.fill_with_examples
     ]
     connectors_ = dataset_connectors + examples_connectors
-    engine = _engine(args.rebuild_db)
-    if len(connectors_) > 0:
-        populate_database(
-            engine,
-            connectors=connectors_,
-            only_if_empty=True,
-            limit=args.limit,
-        )
-
-    add_routes(app, engine, url_prefix=args.url_prefix)
+    engine = configured_engine(args.rebuild_db)
+    add_platforms(engine)
+    if len(connectors_) > 0 and not data_exists(engine) and not has_active_jobs(engine):
+        # The database is populated in the background, so that the API is ready immediately. All
+        # uvicorn workers get here, so the job is created using a conditional insert.
+        connector_names = [c.sync_state_key for c in connectors_]
+        create_job_once(engine, POPULATE_JOB_KEY, connector_names, limit=args.limit)
+
+    async_engine = configured_async_engine() if args.async_db else None
+    add_routes(app, engine, url_prefix=args.url_prefix, async_engine=async_engine)
+    job_runner = JobRunner(engine)
+    app.add_event_handler("startup", job_runner.start)
+    app.add_event_handler("shutdown", job_runner.stop)
     return app
 
 
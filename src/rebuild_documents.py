@@ -0,0 +1,59 @@
+"""
+Rebuild the materialized documents of resources in the other schemas than "aiod" (such as the
+schema.org and dcat-ap documents of datasets), for instance after a change of the converters.
+See database/schema_documents.py.
+
+Example, from the src directory:
+
+    python rebuild_documents.py datasets --schema dcat-ap
+"""
+import argparse
+import logging
+
+import routers
+from database import schema_documents
+from database.setup import configured_engine
+
+ROUTERS = {r.resource_name_plural: r for r in routers.resource_routers if r.schema_converters}
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "resources",
+        nargs="+",
+        choices=ROUTERS.keys(),
+        help="The resources of which the documents should be rebuilt.",
+    )
+    parser.add_argument(
+        "--schema",
+        dest="schemas",
+        action="append",
+        default=None,
+        help="The schema to rebuild. Can be given multiple times. By default, all schemas are "
+        "rebuilt.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=500,
+        help="The number of resources that are rendered per transaction.",
+    )
+    return parser.parse_args()
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    args = _parse_args()
+    engine = configured_engine("no")
+    for name in args.resources:
+        router = ROUTERS[name]
+        schemas = args.schemas or list(router.schema_converters.keys())
+        invalid = set(schemas) - router.schema_converters.keys()
+        if len(invalid) > 0:
+            raise SystemExit(f"The {name} cannot be served in schema(s) {', '.join(invalid)}.")
+        schema_documents.rebuild(engine, router, schemas, batch_size=args.batch_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+Caching the serialized (JSON) representation of resources.
+
+Converting a resource to its Read class or to another schema (such as schema.org or dcat-ap) is
+relatively expensive, while the metadata rarely changes. The ResourceRouter therefore caches the
+final JSON bytes of a resource, keyed by (resource type, identifier, schema, version). The
+version (the API version and the row version of the resource) is part of the key, so that an
+outdated representation will never be served, even if it has not been invalidated yet.
+
+All representations of a single resource are stored together, so that they can be invalidated
+at once. Two backends are available: an in-process LRU cache, and a Redis(-compatible) backend
+that can be shared between processes. The backend is configured in the [cache] section of the
+config.toml.
+"""
+import abc
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from config import CACHE_CONFIG
+from database.asynchronous import run_blocking
+
+
+class CacheBackend(abc.ABC):
+    """Storage of the representations (variants) of resources."""
+
+    @abc.abstractmethod
+    def get(self, key: str, variant: str) -> bytes | None:
+        pass
+
+    @abc.abstractmethod
+    def set(self, key: str, variant: str, value: bytes):
+        pass
+
+    @abc.abstractmethod
+    def delete(self, key: str):
+        """Delete all variants of this key"""
+
+    @abc.abstractmethod
+    def clear(self):
+        pass
+
+
+class LRUCacheBackend(CacheBackend):
+    """
+    In-process cache, containing at most max_size resources. If it is full, the least recently
+    used resource is removed. The entries expire after ttl_seconds.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl_seconds: float = 3600):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, dict[str, bytes]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, variant: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expiry, variants = entry
+            if time.monotonic() >= expiry:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return variants.get(variant)
+
+    def set(self, key: str, variant: str, value: bytes):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() >= entry[0]:
+                entry = (time.monotonic() + self.ttl_seconds, {})
+                self._entries[key] = entry
+            entry[1][variant] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Cache backed by Redis, or any client with the same interface. Every resource is stored as a
+    hash, containing a field per variant, expiring ttl_seconds after its first variant was set.
+    Redis should be configured with an eviction policy (such as allkeys-lru) to bound its size.
+
+    The requests are blocking. In the asynchronous mode they are therefore performed in a worker
+    thread (see database.asynchronous.run_blocking).
+    """
+
+    def __init__(self, client: Any, ttl_seconds: float = 3600, namespace: str = "aiod:response:"):
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.namespace = namespace
+
+    def get(self, key: str, variant: str) -> bytes | None:
+        return run_blocking(self.client.hget, self.namespace + key, variant)
+
+    def set(self, key: str, variant: str, value: bytes):
+        run_blocking(self._set, self.namespace + key, variant, value)
+
+    def delete(self, key: str):
+        run_blocking(self.client.delete, self.namespace + key)
+
+    def clear(self):
+        run_blocking(self._clear)
+
+    def _set(self, name: str, variant: str, value: bytes):
+        self.client.hset(name, variant, value)
+        # Adding a variant does not extend the expiry, as it does not in the LRUCacheBackend:
+        # otherwise the hash of a resource that is requested often would never expire.
+        if self.client.ttl(name) < 0:
+            self.client.expire(name, int(self.ttl_seconds))
+
+    def _clear(self):
+        keys = list(self.client.scan_iter(match=self.namespace + "*"))
+        if len(keys) > 0:
+            self.client.delete(*keys)
+
+
+class ResponseCache:
+    """Cache of serialized resources, keeping track of the number of hits and misses."""
+
+    def __init__(self, backend: CacheBackend):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, resource_type: str, identifier: int, schema: str, version: str) -> bytes | None:
+        value = self.backend.get(_key(resource_type, identifier), f"{schema}/{version}")
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, resource_type: str, identifier: int, schema: str, version: str, value: bytes):
+        self.backend.set(_key(resource_type, identifier), f"{schema}/{version}", value)
+
+    def invalidate(self, resource_type: str, identifier: int):
+        """Remove all cached representations of this resource."""
+        self.backend.delete(_key(resource_type, identifier))
+
+    def clear(self):
+        """Remove all cached representations, and reset the counters."""
+        self.backend.clear()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def statistics(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "backend": type(self.backend).__name__,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+def _key(resource_type: str, identifier: int) -> str:
+    return f"{resource_type}/{identifier}"
+
+
+def _backend_from_config(config: dict) -> CacheBackend:
+    ttl_seconds = config.get("ttl_seconds", 3600)
+    if config.get("backend", "memory") == "redis":
+        import redis  # type: ignore[import]  # only a dependency if the redis backend is used
+
+        client = redis.Redis.from_url(config.get("redis_url", "redis://localhost:6379/0"))
+        return RedisCacheBackend(client, ttl_seconds=ttl_seconds)
+    return LRUCacheBackend(max_size=config.get("max_size", 10000), ttl_seconds=ttl_seconds)
+
+
+response_cache = ResponseCache(_backend_from_config(CACHE_CONFIG))
@@ -2,16 +2,20 @@ import typing  # noqa:F401
 
 from .resource_router import ResourceRouter  # noqa:F401
 from .case_study_router import CaseStudyRouter
+from .catalog_router import CatalogRouter
 from .computational_resource_router import ComputationalResourceRouter
+from .counts_router import CountsRouter
 from .dataset_router import DatasetRouter
 from .educational_resource_router import EducationalResourceRouter
 from .event_router import EventRouter
+from .monitoring_router import MonitoringRouter
 from .news_router import NewsRouter
 from .organisation_router import OrganisationRouter
 from .platform_router import PlatformRouter
 from .presentation_router import PresentationRouter
 from .project_router import ProjectRouter
 from .publication_router import PublicationRouter
+from .sync_router import SyncRouter
 from .upload_router_huggingface import UploadRouterHuggingface
 
 resource_routers = [
@@ -28,4 +32,11 @@ resource_routers = [
     PresentationRouter(),
 ]  # type: typing.List[ResourceRouter]
 
-other_routers = [UploadRouterHuggingface()]
+counts_router = CountsRouter(resource_routers)
+catalog_router = CatalogRouter(next(r for r in resource_routers if isinstance(r, DatasetRouter)))
+
+other_routers = [
+    UploadRouterHuggingface(),
+    MonitoringRouter(),
+    SyncRouter(),
+]  # type: typing.List[typing.Any]
@@ -0,0 +1,146 @@
+from collections import OrderedDict
+from typing import Any, Iterator
+
+import orjson
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlmodel import Session, select
+from sqlmodel.sql.expression import Select, SelectOfScalar
+
+from converters.schema.dcat import DcatAPCatalog, DcatAPContext
+from database import schema_documents
+from database.asynchronous import async_endpoint, async_iterator, is_async, sync_engine
+from database.model.platform.platform_names import PlatformName
+from routers.json_response import dumps
+from routers.resource_router import ResourceRouter
+
+CATALOG_ID = "catalog"
+CATALOG_TITLE = "AIoD Metadata Catalogue"
+# The nodes that are typically shared by many datasets. Other nodes (such as distributions and
+# checksums) are specific to a single dataset, so they are not deduplicated, which keeps the
+# memory needed for deduplication small.
+SHARED_NODE_TYPES = {"vcard:Individual", "vcard:Organisation", "dct:Location", "dct:PeriodOfTime"}
+# The number of identifiers of shared nodes that are remembered for deduplication
+MAX_SHARED_IDS = 100_000
+
+
+class CatalogRouter:
+    """
+    Router serving the complete catalogue of datasets as a single DCAT-AP JSON-LD document,
+    consisting of a dcat:Catalog and all datasets and their related nodes in a single graph.
+    """
+
+    def __init__(self, dataset_router: ResourceRouter):
+        self.dataset_router = dataset_router
+
+    def create(self, engine: Engine | AsyncEngine, url_prefix: str) -> APIRouter:
+        router = APIRouter()
+        endpoint = async_endpoint if is_async(engine) else lambda func: func
+        stream_async = is_async(engine)
+        engine_sync = sync_engine(engine)
+
+        @router.get(
+            url_prefix + "/catalog/dcat-ap", tags=["catalog"], response_class=StreamingResponse
+        )
+        @endpoint
+        def get_catalog_dcat_ap(platform: str | None = None):
+            """
+            Retrieve all datasets as a single DCAT-AP catalogue: a JSON-LD document with a single
+            @context and @graph, containing the dcat:Catalog, the datasets, and the nodes related
+            to the datasets. The nodes shared between datasets, such as persons and locations, are
+            included only once. The document is streamed.
+            """
+            if platform is not None and platform not in {n.name for n in PlatformName}:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"platform '{platform}' not recognized.",
+                )
+            content = self.catalog_dcat_ap(engine_sync, platform=platform)
+            if stream_async:
+                return StreamingResponse(async_iterator(content), media_type="application/ld+json")
+            return StreamingResponse(content, media_type="application/ld+json")
+
+        return router
+
+    def catalog_dcat_ap(
+        self,
+        engine: Engine,
+        platform: str | None = None,
+        batch_size: int = 500,
+        max_shared_ids: int = MAX_SHARED_IDS,
+    ) -> Iterator[bytes]:
+        """
+        Generate the DCAT-AP catalogue, in chunks of a batch of datasets each.
+
+        The datasets are retrieved in batches, seeking on the identifier, each batch in its own
+        short-lived session. The dcat:Catalog node is written first, listing the datasets by
+        streaming only their identifiers. Then the materialized dcat-ap document of every dataset
+        is written (see database/schema_documents.py). A dataset created in between these two
+        passes may be missing from either one.
+
+        The shared nodes are deduplicated using the identifiers of the last max_shared_ids shared
+        nodes that were written, so that the memory usage does not depend on the number of
+        datasets. A shared node that was written longer ago may therefore be written again. This
+        is valid JSON-LD: processors merge the nodes with the same @id.
+        """
+        dataset_router = self.dataset_router
+        dataset_class = dataset_router.resource_class
+        converter = dataset_router.schema_converters["dcat-ap"]
+        conditions = [] if platform is None else [dataset_class.platform == platform]
+        catalog = DcatAPCatalog(id_=CATALOG_ID, title=CATALOG_TITLE)
+        catalog_head = dumps(catalog.dict(by_alias=True, exclude_none=True, exclude={"dataset"}))
+
+        yield b'{"@context":' + dumps(DcatAPContext()) + b',"@graph":['
+        yield catalog_head[:-1] + b',"dcat:dataset":['
+        query = select(dataset_class.identifier).where(*conditions)
+        batches = _batches(engine, query, dataset_class.identifier, batch_size)
+        for i, (_, identifiers) in enumerate(batches):
+            separator = b"" if i == 0 else b","
+            yield separator + b",".join(orjson.dumps({"@id": str(id_)}) for id_ in identifiers)
+        yield b"]}"
+
+        shared_ids: OrderedDict[str, None] = OrderedDict()
+        query = select(dataset_class).where(*conditions)
+        for session, datasets in _batches(engine, query, dataset_class.identifier, batch_size):
+            documents = schema_documents.documents(
+                session, dataset_router.resource_name, "dcat-ap", converter, datasets
+            )
+            nodes = []
+            for document in documents:
+                for node in orjson.loads(document)["@graph"]:
+                    if node.get("@type") in SHARED_NODE_TYPES:
+                        if node["@id"] in shared_ids:
+                            shared_ids.move_to_end(node["@id"])
+                            continue
+                        shared_ids[node["@id"]] = None
+                        if len(shared_ids) > max_shared_ids:
+                            shared_ids.popitem(last=False)
+                    nodes.append(orjson.dumps(node))
+            yield b"," + b",".join(nodes)
+        yield b"]}"
+
+
+def _batches(
+    engine: Engine, query: Select | SelectOfScalar, identifier: Any, batch_size: int
+) -> Iterator[tuple[Session, list]]:
+    """
+    Execute the query in batches, seeking on the identifier column, each batch in its own
+    session. The query should select either the dataset class or its identifier. Empty batches
+    are not yielded.
+    """
+    query = query.order_by(identifier).limit(batch_size)
+    last_identifier = None
+    while True:
+        with Session(engine) as session:
+            batch_query = query
+            if last_identifier is not None:
+                batch_query = query.where(identifier > last_identifier)
+            rows = session.scalars(batch_query).all()
+            if len(rows) > 0:
+                yield session, rows
+        if len(rows) < batch_size:
+            return
+        last = rows[-1]
+        last_identifier = last if isinstance(last, int) else last.identifier
@@ -0,0 +1,33 @@
+from fastapi import APIRouter
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from database.asynchronous import async_endpoint, is_async, sync_engine
+from database.model.resource import Resource
+from routers.resource_router import ResourceRouter
+
+
+class CountsRouter:
+    """Router with a single endpoint returning the number of resources of every resource type."""
+
+    def __init__(self, resource_routers: list[ResourceRouter]):
+        self.resource_routers = resource_routers
+
+    def create(self, engine: Engine | AsyncEngine, url_prefix: str) -> APIRouter:
+        router = APIRouter()
+        endpoint = async_endpoint if is_async(engine) else lambda func: func
+        engine_sync = sync_engine(engine)
+
+        @router.get(url_prefix + "/counts/v0", tags=["counts"])
+        @endpoint
+        def get_resource_counts(platform: str | None = None) -> dict[str, int]:
+            """Retrieve the number of resources of every type, in a single request."""
+            return {
+                resource_router.resource_name_plural: resource_router.count_resources(
+                    engine_sync, platform=platform
+                )
+                for resource_router in self.resource_routers
+                if platform is None or issubclass(resource_router.resource_class, Resource)
+            }
+
+        return router
@@ -0,0 +1,67 @@
+"""
+Fast encoding of JSON responses.
+
+FastAPI first converts the response content into json-compatible values using its
+`jsonable_encoder` (which recursively copies every dict, list and Pydantic model), after which
+the standard library encodes these values as string. The ORJSONResponse encodes the content
+into bytes at once using orjson, which serializes dicts, lists, datetimes, enums, dataclasses
+and UUIDs natively. Only the values orjson does not know, such as Pydantic models, are
+converted using `_default`.
+"""
+import decimal
+import functools
+from typing import Any, Callable, Mapping
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from pydantic.json import decimal_encoder
+from starlette.background import BackgroundTask
+from starlette.responses import Response
+
+from config import RESPONSE_CONFIG
+
+EXCLUDE_NONE: bool = RESPONSE_CONFIG.get("exclude_none", True)
+
+
+def dumps(content: Any, exclude_none: bool = EXCLUDE_NONE) -> bytes:
+    """
+    Encode the content as JSON. If exclude_none, the attributes of Pydantic models without
+    value are left out (the keys of dicts with value None are always included).
+    """
+    default: Callable[[Any], Any] = _default
+    if exclude_none:
+        default = _default_exclude_none
+    return orjson.dumps(content, default=default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _default(value: Any, exclude_none: bool = False) -> Any:
+    if isinstance(value, BaseModel):
+        return value.dict(by_alias=True, exclude_none=exclude_none)
+    if isinstance(value, decimal.Decimal):
+        return decimal_encoder(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return jsonable_encoder(value, exclude_none=exclude_none)
+
+
+_default_exclude_none = functools.partial(_default, exclude_none=True)
+
+
+class ORJSONResponse(Response):
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        media_type: str | None = None,
+        background: BackgroundTask | None = None,
+        exclude_none: bool = EXCLUDE_NONE,
+    ):
+        self.exclude_none = exclude_none
+        super().__init__(content, status_code, headers, media_type, background)
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content, exclude_none=self.exclude_none)
@@ -0,0 +1,21 @@
+from fastapi import APIRouter
+from sqlalchemy.engine import Engine
+
+from response_cache import response_cache
+
+
+class MonitoringRouter:
+    """Router exposing statistics for monitoring the application."""
+
+    def create(self, engine: Engine, url_prefix: str) -> APIRouter:
+        router = APIRouter()
+
+        @router.get(url_prefix + "/monitoring/cache/v0", tags=["monitoring"])
+        def get_cache_statistics() -> dict:
+            """
+            Retrieve the number of hits and misses of the response cache of this process, since
+            the last time the cache was cleared.
+            """
+            return response_cache.statistics()
+
+        return router
@@ -1,38 +1,69 @@
 import abc
+import base64
+import binascii
+import calendar
 import datetime
+import email.utils
+import hashlib
+import itertools
+import json
 import traceback
-from typing import Literal, Union, Any
+from typing import Literal, Union, Any, Iterator
 from typing import TypeVar, Type
 from wsgiref.handlers import format_date_time
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.encoders import jsonable_encoder
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
+from fastapi.utils import create_cloned_field, create_response_field
+from pydantic import BaseModel, ValidationError
 from sqlalchemy import and_, delete
 from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlmodel import SQLModel, Session, select
-from starlette.responses import JSONResponse
+from starlette.responses import Response, StreamingResponse
 
 from authentication import get_current_user
 from config import KEYCLOAK_CONFIG
 from converters.schema_converters.schema_converter import SchemaConverter
+from database import counts, schema_documents
+from database.asynchronous import async_endpoint, async_iterator, is_async, sync_engine
+from database.bulk_insert import BulkInserter
+from database.fulltext import fulltext_columns, fulltext_search
 from database.model.agent import Agent
 from database.model.agent_table import AgentTable
 from database.model.ai_asset import AIAsset
 from database.model.ai_asset_table import AIAssetTable
+from database.model.general.keyword import Keyword
 from database.model.platform.platform import Platform
 from database.model.platform.platform_names import PlatformName
 from database.model.resource import (
     Resource,
+    ResourceFilter,
+    resource_copy_plan,
     resource_create,
+    resource_filter,
+    resource_patch,
     resource_read,
+    resource_loader_options,
 )
-from serialization import deserialize_resource_relationships
+from database.model.row_version import touch_related
+from response_cache import response_cache
+from routers.json_response import EXCLUDE_NONE, ORJSONResponse, dumps
+from serialization import compile_serializer
 
 
 class Pagination(BaseModel):
+    """
+    Offset-based or cursor-based (keyset) pagination.
+
+    Offset-based pagination is simple, but the database needs to scan and discard all the
+    preceding rows, which makes deep pages slow. For cursor-based pagination, the `Next-Cursor`
+    response header of a full page should be passed as `cursor` to retrieve the next page. The
+    database can then seek directly to the first row of the next page.
+    """
+
     offset: int = 0
     limit: int = 100
+    cursor: str | None = None
 
 
 RESOURCE = TypeVar("RESOURCE", bound=Resource)
@@ -49,14 +80,35 @@ class ResourceRouter(abc.ABC):
     - GET /[resource]s/{identifier}
     - GET /platforms/{platform_name}/[resource]s/
     - GET /platforms/{platform_name}/[resource]s/{identifier}
+    - GET /[resource]s/export
+    - GET /search/[resource]s/v0 (only for resources with a full-text index)
     - POST /[resource]s
+    - POST /[resource]s/bulk
+    - PUT /[resource]s/bulk
     - PUT /[resource]s/{identifier}
+    - PATCH /[resource]s/{identifier}
     - DELETE /[resource]s/{identifier}
     """
 
     def __init__(self):
         self.resource_class_create = resource_create(self.resource_class)
+        self.resource_class_patch = resource_patch(self.resource_class)
+        self.resource_copy_plan = resource_copy_plan(self.resource_class)
         self.resource_class_read = resource_read(self.resource_class)
+        # Serializes an ORM resource directly into the json-compatible "aiod" schema
+        self.resource_serializer = compile_serializer(
+            self.resource_class_read, exclude_none=EXCLUDE_NONE
+        )
+        self.resource_loader_options = resource_loader_options(self.resource_class)
+        self.resource_class_filter = resource_filter(self.resource_class)
+        # Used to serialize a single resource in the same way as FastAPI would, for caching
+        self._response_fields = {
+            schema: create_cloned_field(
+                create_response_field(name=f"{self.resource_name}_{schema}", type_=clz)
+            )
+            for schema, clz in [("aiod", self.resource_class_read)]
+            + [(name, c.to_class) for name, c in self.schema_converters.items()]
+        }
 
     @property
     @abc.abstractmethod
@@ -105,11 +157,17 @@ class ResourceRouter(abc.ABC):
         """
         return {}
 
-    def create(self, engine: Engine, url_prefix: str) -> APIRouter:
-        router = APIRouter()
+    def create(self, engine: Engine | AsyncEngine, url_prefix: str) -> APIRouter:
+        """
+        Create the router. If an AsyncEngine is given, the endpoints are coroutines, using the
+        async driver of this engine (see database.asynchronous).
+        """
+        router = APIRouter(default_response_class=ORJSONResponse)
+        endpoint = async_endpoint if is_async(engine) else lambda func: func
+        engine = sync_engine(engine)
         version = f"v{self.version}"
-        default_kwargs = {
-            "response_model_exclude_none": True,
+        default_kwargs: dict[str, Any] = {
+            "response_model_exclude_none": EXCLUDE_NONE,
             "deprecated": self.deprecated_from is not None,
             "tags": [self.resource_name_plural],
         }
@@ -121,28 +179,65 @@ class ResourceRouter(abc.ABC):
 
         router.add_api_route(
             path=f"{url_prefix}/{self.resource_name_plural}/{version}",
-            endpoint=self.get_resources_func(engine),
+            endpoint=endpoint(self.get_resources_func(engine)),
             response_model=response_model_plural,  # type: ignore
             name=f"List {self.resource_name_plural}",
             **default_kwargs,
         )
         router.add_api_route(
             path=f"{url_prefix}/counts/{self.resource_name_plural}/v0",
-            endpoint=self.get_resource_count_func(engine),
+            endpoint=endpoint(self.get_resource_count_func(engine)),
             response_model=int,  # type: ignore
             name=f"Count of {self.resource_name_plural}",
             **default_kwargs,
         )
+        if len(fulltext_columns(self.resource_class)) > 0:
+            router.add_api_route(
+                path=f"{url_prefix}/search/{self.resource_name_plural}/v0",
+                endpoint=endpoint(self.search_resources_func(engine)),
+                response_model=response_model_plural,  # type: ignore
+                name=f"Search {self.resource_name_plural}",
+                **default_kwargs,
+            )
+        if issubclass(self.resource_class, Resource):
+            # Should be added before the "/{identifier}" route, otherwise "export" is interpreted
+            # as identifier
+            router.add_api_route(
+                path=f"{url_prefix}/{self.resource_name_plural}/{version}/export",
+                endpoint=endpoint(self.export_resources_func(engine)),
+                response_class=StreamingResponse,
+                name=f"Export {self.resource_name_plural}",
+                **default_kwargs,
+            )
         router.add_api_route(
             path=f"{url_prefix}/{self.resource_name_plural}/{version}",
             methods={"POST"},
-            endpoint=self.register_resource_func(engine),
+            endpoint=endpoint(self.register_resource_func(engine)),
             name=self.resource_name,
             **default_kwargs,
         )
+        # Should be added before the "/{identifier}" routes, otherwise "bulk" is interpreted as
+        # identifier
+        bulk_body = self._bulk_request_body()
+        router.add_api_route(
+            path=f"{url_prefix}/{self.resource_name_plural}/{version}/bulk",
+            methods={"POST"},
+            endpoint=endpoint(self.register_resources_bulk_func(engine)),
+            name=f"Register {self.resource_name_plural}",
+            openapi_extra=bulk_body,
+            **default_kwargs,
+        )
+        router.add_api_route(
+            path=f"{url_prefix}/{self.resource_name_plural}/{version}/bulk",
+            methods={"PUT"},
+            endpoint=endpoint(self.put_resources_bulk_func(engine)),
+            name=f"Update {self.resource_name_plural}",
+            openapi_extra=bulk_body,
+            **default_kwargs,
+        )
         router.add_api_route(
             path=url_prefix + f"/{self.resource_name_plural}/{version}/{{identifier}}",
-            endpoint=self.get_resource_func(engine),
+            endpoint=endpoint(self.get_resource_func(engine)),
             response_model=response_model,  # type: ignore
             name=self.resource_name,
             **default_kwargs,
@@ -150,21 +245,28 @@ class ResourceRouter(abc.ABC):
         router.add_api_route(
             path=f"{url_prefix}/{self.resource_name_plural}/{version}/{{identifier}}",
             methods={"PUT"},
-            endpoint=self.put_resource_func(engine),
+            endpoint=endpoint(self.put_resource_func(engine)),
+            name=self.resource_name,
+            **default_kwargs,
+        )
+        router.add_api_route(
+            path=f"{url_prefix}/{self.resource_name_plural}/{version}/{{identifier}}",
+            methods={"PATCH"},
+            endpoint=endpoint(self.patch_resource_func(engine)),
             name=self.resource_name,
             **default_kwargs,
         )
         router.add_api_route(
             path=f"{url_prefix}/{self.resource_name_plural}/{version}/{{identifier}}",
             methods={"DELETE"},
-            endpoint=self.delete_resource_func(engine),
+            endpoint=endpoint(self.delete_resource_func(engine)),
             name=self.resource_name,
             **default_kwargs,
         )
         if issubclass(self.resource_class, Resource):
             router.add_api_route(
                 path=f"{url_prefix}/platforms/{{platform}}/{self.resource_name_plural}/{version}",
-                endpoint=self.get_platform_resources_func(engine),
+                endpoint=endpoint(self.get_platform_resources_func(engine)),
                 response_model=response_model_plural,  # type: ignore
                 name=f"List {self.resource_name_plural}",
                 **default_kwargs,
@@ -172,7 +274,7 @@ class ResourceRouter(abc.ABC):
             router.add_api_route(
                 path=f"{url_prefix}/platforms/{{platform}}/{self.resource_name_plural}/{version}"
                 f"/{{identifier}}",
-                endpoint=self.get_platform_resource_func(engine),
+                endpoint=endpoint(self.get_platform_resource_func(engine)),
                 response_model=response_model,  # type: ignore
                 name=self.resource_name,
                 **default_kwargs,
@@ -180,50 +282,302 @@ class ResourceRouter(abc.ABC):
         return router
 
     def get_resources(
-        self, engine: Engine, schema: str, pagination: Pagination, platform: str | None = None
+        self,
+        engine: Engine,
+        schema: str,
+        pagination: Pagination,
+        platform: str | None = None,
+        filters: ResourceFilter | None = None,
+        if_none_match: str | None = None,
     ):
-        """Fetch all resources of this platform in given schema, using pagination"""
+        """
+        Fetch all resources of this platform in given schema, using pagination and filters.
+
+        If the If-None-Match header matches the (weak) ETag of the page, a 304 Not Modified
+        response is returned instead.
+        """
         _raise_error_on_invalid_schema(self._possible_schemas, schema)
-        convert_schema = (
-            self.schema_converters[schema].convert
-            if schema != "aiod"
-            else self.resource_class_read.from_orm
-        )
-        try:
-            with Session(engine) as session:
-                where_clause = (
-                    (self.resource_class.platform == platform) if platform is not None else True
+        if platform is not None:
+            _raise_error_on_invalid_platform(platform)
+        if pagination.cursor is not None and pagination.offset != 0:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Use either an offset or a cursor, not both.",
+            )
+        sort = filters.sort if filters is not None else None
+        if sort is not None:
+            if pagination.cursor is not None:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Sorting is not supported in combination with a cursor.",
                 )
-                query = (
-                    select(self.resource_class)
-                    .where(where_clause)
-                    .offset(pagination.offset)
-                    .limit(pagination.limit)
+            if sort.removeprefix("-") not in self.resource_class_filter.sortable:
+                sortable = ", ".join(self.resource_class_filter.sortable)
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Invalid sort '{sort}'. The {self.resource_name_plural} can be "
+                    f"sorted on {sortable}, optionally prefixed by '-' for descending order.",
                 )
+        try:
+            with Session(engine) as session:
+                query = select(self.resource_class).options(*self._loader_options(schema))
+                if filters is not None:
+                    query = query.where(*filters.where_clauses())
+                if platform is None:
+                    seek_attributes = ["identifier"]
+                else:
+                    query = query.where(self.resource_class.platform == platform)
+                    seek_attributes = ["platform", "platform_identifier"]
+                if pagination.cursor is None:
+                    query = query.offset(pagination.offset)
+                else:
+                    after = _decode_cursor(
+                        pagination.cursor,
+                        {a: self.resource_class.__fields__[a].type_ for a in seek_attributes},
+                    )
+                    if platform is not None and after["platform"] != platform:
+                        raise HTTPException(
+                            status_code=status.HTTP_400_BAD_REQUEST,
+                            detail="This cursor belongs to a different platform.",
+                        )
+                    seek_attribute = seek_attributes[-1]
+                    query = query.where(
+                        getattr(self.resource_class, seek_attribute) > after[seek_attribute]
+                    )
+                if sort is not None:
+                    attribute = self.resource_class_filter.sortable[sort.removeprefix("-")]
+                    query = query.order_by(
+                        attribute.desc() if sort.startswith("-") else attribute,
+                        self.resource_class.identifier,
+                    )
+                else:
+                    query = query.order_by(getattr(self.resource_class, seek_attributes[-1]))
+                query = query.limit(pagination.limit)
+                resources = session.scalars(query).all()
 
-                return self._wrap_with_headers(
-                    [convert_schema(resource) for resource in session.scalars(query).all()]
-                )
+                headers: dict[str, str] = {}
+                etag = _weak_etag(resources, schema)
+                if etag is not None:
+                    headers["ETag"] = etag
+                    if _is_not_modified(if_none_match, None, etag=etag):
+                        return self._not_modified_response(headers)
+                if sort is None and len(resources) > 0 and len(resources) == pagination.limit:
+                    last = resources[-1]
+                    headers["Next-Cursor"] = _encode_cursor(
+                        {attribute: getattr(last, attribute) for attribute in seek_attributes}
+                    )
+                return self._list_response(session, resources, schema, headers)
+        except Exception as e:
+            raise _wrap_as_http_exception(e)
+
+    def export_resources(
+        self,
+        engine: Engine,
+        schema: str,
+        platform: str | None = None,
+        modified_since: datetime.datetime | None = None,
+        batch_size: int = 500,
+    ) -> Iterator[bytes]:
+        """
+        Stream all resources as newline-delimited json, in given schema.
+
+        The resources are retrieved in batches, seeking on the identifier, and each batch uses
+        its own short-lived session. This keeps the memory usage constant and makes sure that no
+        database connection is kept open while waiting for a slow client.
+        """
+        _raise_error_on_invalid_schema(self._possible_schemas, schema)
+        if platform is not None:
+            _raise_error_on_invalid_platform(platform)
+        if modified_since is not None and not hasattr(self.resource_class, "date_modified"):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"The {self.resource_name_plural} cannot be filtered on modification date.",
+            )
+        query = select(self.resource_class).options(*self._loader_options(schema))
+        if platform is not None:
+            query = query.where(self.resource_class.platform == platform)
+        if modified_since is not None:
+            query = query.where(self.resource_class.date_modified >= modified_since)
+        query = query.order_by(self.resource_class.identifier).limit(batch_size)
+
+        def generate() -> Iterator[bytes]:
+            last_identifier = None
+            while True:
+                with Session(engine) as session:
+                    batch_query = query
+                    if last_identifier is not None:
+                        batch_query = query.where(self.resource_class.identifier > last_identifier)
+                    resources = session.scalars(batch_query).all()
+                    lines = [
+                        content + b"\n" for content in self._encode_all(session, resources, schema)
+                    ]
+                if len(lines) > 0:
+                    yield b"".join(lines)
+                if len(resources) < batch_size:
+                    return
+                last_identifier = resources[-1].identifier
+
+        return generate()
+
+    def search_resources(
+        self,
+        engine: Engine,
+        q: str,
+        schema: str,
+        offset: int = 0,
+        limit: int = 100,
+        platform: str | None = None,
+        keyword: str | None = None,
+    ):
+        """
+        Search the resources using the full-text index, optionally filtering on platform and
+        keyword, and return them in given schema, the most relevant first.
+        """
+        _raise_error_on_invalid_schema(self._possible_schemas, schema)
+        if len(q.strip()) == 0:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="The search query should not be empty.",
+            )
+        if platform is not None:
+            _raise_error_on_invalid_platform(platform)
+        if keyword is not None and not hasattr(self.resource_class, "keywords"):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"The {self.resource_name_plural} cannot be filtered on keyword.",
+            )
+        try:
+            with Session(engine) as session:
+                query = select(self.resource_class).options(*self._loader_options(schema))
+                if platform is not None:
+                    query = query.where(self.resource_class.platform == platform)
+                if keyword is not None:
+                    query = query.where(self.resource_class.keywords.any(Keyword.name == keyword))
+                query = fulltext_search(query, self.resource_class, q, engine.dialect.name)
+                resources = session.scalars(query.offset(offset).limit(limit)).all()
+                return self._list_response(session, resources, schema)
         except Exception as e:
             raise _wrap_as_http_exception(e)
 
     def get_resource(
-        self, engine: Engine, identifier: str, schema: str, platform: str | None = None
+        self,
+        engine: Engine,
+        identifier: str,
+        schema: str,
+        platform: str | None = None,
+        if_none_match: str | None = None,
+        if_modified_since: str | None = None,
     ):
         """
         Get the resource identified by AIoD identifier (if platform is None) or by platform AND
         platform-identifier (if platform is not None), return in given schema.
+
+        If the resource has not been modified according to the If-None-Match or
+        If-Modified-Since header, a 304 Not Modified response is returned, without serializing
+        the resource. Otherwise, the serialized resource is taken from the response cache if
+        possible.
         """
         _raise_error_on_invalid_schema(self._possible_schemas, schema)
         try:
             with Session(engine) as session:
                 resource = self._retrieve_resource(session, identifier, platform=platform)
-                if schema != "aiod":
-                    return self.schema_converters[schema].convert(resource)
-                return self._wrap_with_headers(self.resource_class_read.from_orm(resource))
+                headers: dict[str, str] = {}
+                last_modified = getattr(resource, "aiod_date_modified", None)
+                if last_modified is None:
+                    return self._json_response(self._serialize(resource, schema))
+                headers["ETag"] = _strong_etag(resource.identifier, last_modified, schema)
+                headers["Last-Modified"] = format_date_time(
+                    calendar.timegm(last_modified.utctimetuple())
+                )
+                if _is_not_modified(
+                    if_none_match,
+                    if_modified_since,
+                    etag=headers["ETag"],
+                    last_modified=last_modified,
+                ):
+                    return self._not_modified_response(headers)
+
+                version = f"v{self.version}/{last_modified:%Y%m%d%H%M%S%f}"
+                content = response_cache.get(
+                    self.resource_name, resource.identifier, schema, version
+                )
+                if content is None:
+                    if self._is_materialized(schema):
+                        (content,) = self._encode_all(session, [resource], schema)
+                    else:
+                        content = dumps(self._serialize(resource, schema))
+                    response_cache.set(
+                        self.resource_name, resource.identifier, schema, version, content
+                    )
+                return Response(
+                    content=content,
+                    media_type="application/json",
+                    headers={**self._deprecation_headers(), **headers},
+                )
         except Exception as e:
             raise _wrap_as_http_exception(e)
 
+    def _serialize(self, resource: SQLModel, schema: str):
+        """
+        Convert the resource to given schema, validated in the same way as FastAPI validates the
+        response model. The result can be encoded using `dumps`.
+        """
+        if schema == "aiod":
+            return self.resource_serializer(resource)
+        field = self._response_fields[schema]
+        content = self._convert_schema_func(schema)(resource).dict(by_alias=True)
+        value, errors = field.validate(content, {}, loc=())
+        if errors:
+            raise ValueError(f"Could not serialize {self.resource_name}: {errors}")
+        return value
+
+    def _is_materialized(self, schema: str) -> bool:
+        """Whether the documents in this schema are materialized, see database/schema_documents"""
+        return schema != "aiod" and hasattr(self.resource_class, "aiod_date_modified")
+
+    def _loader_options(self, schema: str) -> list:
+        """
+        The loader options for retrieving resources in this schema. The relationships are not
+        needed for materialized documents, except for rendering outdated documents, in which
+        case they are loaded by the converter.
+        """
+        return [] if self._is_materialized(schema) else self.resource_loader_options
+
+    def _encode_all(self, session: Session, resources: list[SQLModel], schema: str) -> list[bytes]:
+        """The encoded JSON of each resource in given schema."""
+        if self._is_materialized(schema):
+            converter = self.schema_converters[schema]
+            return schema_documents.documents(
+                session, self.resource_name, schema, converter, resources
+            )
+        return [dumps(content) for content in self._convert_all(resources, schema)]
+
+    def _list_response(
+        self,
+        session: Session,
+        resources: list[SQLModel],
+        schema: str,
+        headers: dict[str, str] | None = None,
+    ) -> Response:
+        if not self._is_materialized(schema):
+            return self._json_response(self._convert_all(resources, schema), headers)
+        content = b"[" + b",".join(self._encode_all(session, resources, schema)) + b"]"
+        return Response(
+            content=content,
+            media_type="application/json",
+            headers={**self._deprecation_headers(), **(headers or {})},
+        )
+
+    def _convert_all(self, resources: list[SQLModel], schema: str) -> list:
+        """
+        Convert the resources to given schema. The "aiod" schema results in json-compatible
+        dicts, the other schemas in Pydantic models, both of which can be encoded by `dumps`.
+        """
+        if schema == "aiod":
+            return [self.resource_serializer(resource) for resource in resources]
+        # The resources are instances of the resource_class
+        return self.schema_converters[schema].convert_many(resources)  # type: ignore[arg-type]
+
     def get_resources_func(self, engine: Engine):
         """
         Return a function that can be used to retrieve a list of resources.
@@ -231,18 +585,81 @@ class ResourceRouter(abc.ABC):
         docstring and the variables are dynamic, and used in Swagger.
         """
 
+        clz_filter = self.resource_class_filter
+
         def get_resources(
             pagination: Pagination = Depends(Pagination),
+            filters: clz_filter = Depends(clz_filter),  # type: ignore
             schema: Literal[tuple(self._possible_schemas)] = "aiod",  # type:ignore
+            if_none_match: str | None = Header(default=None),
         ):
             f"""Retrieve all meta-data of the {self.resource_name_plural}."""
             resources = self.get_resources(
-                engine=engine, pagination=pagination, schema=schema, platform=None
+                engine=engine,
+                pagination=pagination,
+                schema=schema,
+                platform=None,
+                filters=filters,
+                if_none_match=if_none_match,
             )
             return resources
 
         return get_resources
 
+    def export_resources_func(self, engine: Engine):
+        """
+        Return a function that can be used to export all resources as newline-delimited json.
+        This function returns a function (instead of being that function directly) because the
+        docstring and the variables are dynamic, and used in Swagger.
+        """
+
+        def export_resources(
+            schema: Literal[tuple(self._possible_schemas)] = "aiod",  # type:ignore
+            platform: str | None = None,
+            modified_since: datetime.datetime | None = None,
+        ):
+            f"""Export all meta-data of the {self.resource_name_plural} as newline-delimited
+            json."""
+            lines = self.export_resources(
+                engine=engine, schema=schema, platform=platform, modified_since=modified_since
+            )
+            headers = self._deprecation_headers()
+            if is_async(engine):
+                return StreamingResponse(
+                    async_iterator(lines), media_type="application/x-ndjson", headers=headers
+                )
+            return StreamingResponse(lines, media_type="application/x-ndjson", headers=headers)
+
+        return export_resources
+
+    def search_resources_func(self, engine: Engine):
+        """
+        Return a function that can be used to search the resources.
+        This function returns a function (instead of being that function directly) because the
+        docstring and the variables are dynamic, and used in Swagger.
+        """
+
+        def search_resources(
+            q: str,
+            schema: Literal[tuple(self._possible_schemas)] = "aiod",  # type:ignore
+            platform: str | None = None,
+            keyword: str | None = None,
+            offset: int = 0,
+            limit: int = 100,
+        ):
+            f"""Search the {self.resource_name_plural}, returning the most relevant first."""
+            return self.search_resources(
+                engine=engine,
+                q=q,
+                schema=schema,
+                offset=offset,
+                limit=limit,
+                platform=platform,
+                keyword=keyword,
+            )
+
+        return search_resources
+
     def get_resource_count_func(self, engine: Engine):
         """
         Gets the total number of resources from the database.
@@ -250,16 +667,24 @@ class ResourceRouter(abc.ABC):
         docstring and the variables are dynamic, and used in Swagger.
         """
 
-        def get_resource_count():
+        def get_resource_count(platform: str | None = None):
             f"""Retrieve the number of {self.resource_name_plural}."""
-            try:
-                with Session(engine) as session:
-                    return session.query(self.resource_class).count()
-            except Exception as e:
-                raise _wrap_as_http_exception(e)
+            return self.count_resources(engine=engine, platform=platform)
 
         return get_resource_count
 
+    def count_resources(self, engine: Engine, platform: str | None = None) -> int:
+        """Return the (cached) number of resources, optionally of a single platform."""
+        if platform is not None and not issubclass(self.resource_class, Resource):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"The {self.resource_name_plural} cannot be counted per platform.",
+            )
+        try:
+            return counts.count_resources(engine, self.resource_class, platform=platform)
+        except Exception as e:
+            raise _wrap_as_http_exception(e)
+
     def get_platform_resources_func(self, engine: Engine):
         """
         Return a function that can be used to retrieve a list of resources for a platform.
@@ -267,14 +692,23 @@ class ResourceRouter(abc.ABC):
         docstring and the variables are dynamic, and used in Swagger.
         """
 
+        clz_filter = self.resource_class_filter
+
         def get_resources(
             platform: str,
             pagination: Pagination = Depends(Pagination),
+            filters: clz_filter = Depends(clz_filter),  # type: ignore
             schema: Literal[tuple(self._possible_schemas)] = "aiod",  # type:ignore
+            if_none_match: str | None = Header(default=None),
         ):
             f"""Retrieve all meta-data of the {self.resource_name_plural} of given platform."""
             resources = self.get_resources(
-                engine=engine, pagination=pagination, schema=schema, platform=platform
+                engine=engine,
+                pagination=pagination,
+                schema=schema,
+                platform=platform,
+                filters=filters,
+                if_none_match=if_none_match,
             )
             return resources
 
@@ -288,15 +722,22 @@ class ResourceRouter(abc.ABC):
         """
 
         def get_resource(
-            identifier: str, schema: Literal[tuple(self._possible_schemas)] = "aiod"  # type:ignore
+            identifier: str,
+            schema: Literal[tuple(self._possible_schemas)] = "aiod",  # type:ignore
+            if_none_match: str | None = Header(default=None),
+            if_modified_since: str | None = Header(default=None),
         ):
             f"""
             Retrieve all meta-data for a {self.resource_name} identified by the AIoD identifier.
             """
-            resource = self.get_resource(
-                engine=engine, identifier=identifier, schema=schema, platform=None
+            return self.get_resource(
+                engine=engine,
+                identifier=identifier,
+                schema=schema,
+                platform=None,
+                if_none_match=if_none_match,
+                if_modified_since=if_modified_since,
             )
-            return self._wrap_with_headers(resource)
 
         return get_resource
 
@@ -311,11 +752,18 @@ class ResourceRouter(abc.ABC):
             identifier: str,
             platform: str,
             schema: Literal[tuple(self._possible_schemas)] = "aiod",  # type:ignore
+            if_none_match: str | None = Header(default=None),
+            if_modified_since: str | None = Header(default=None),
         ):
             f"""Retrieve all meta-data for a {self.resource_name} identified by the
             platform-specific-identifier."""
             return self.get_resource(
-                engine=engine, identifier=identifier, schema=schema, platform=platform
+                engine=engine,
+                identifier=identifier,
+                schema=schema,
+                platform=platform,
+                if_none_match=if_none_match,
+                if_modified_since=if_modified_since,
             )
 
         return get_resource
@@ -342,6 +790,7 @@ class ResourceRouter(abc.ABC):
                 with Session(engine) as session:
                     try:
                         resource = self.create_resource(session, resource_create)
+                        response_cache.invalidate(self.resource_name, resource.identifier)
                         return self._wrap_with_headers({"identifier": resource.identifier})
                     except Exception as e:
                         self._raise_clean_http_exception(e, session, resource_create)
@@ -368,11 +817,10 @@ class ResourceRouter(abc.ABC):
         else:
             resource = self.resource_class.from_orm(resource_create_instance)
 
-        deserialize_resource_relationships(
-            session, self.resource_class, resource, resource_create_instance
-        )
+        self.resource_copy_plan.copy_relationships(session, resource, resource_create_instance)
         session.add(resource)
         session.commit()
+        counts.invalidate(self.resource_class)
         return resource
 
     def put_resource_func(self, engine: Engine):
@@ -398,16 +846,16 @@ class ResourceRouter(abc.ABC):
             try:
                 with Session(engine) as session:
                     resource = self._retrieve_resource(session, identifier)
-                    for attribute_name in resource.schema()["properties"]:
-                        if hasattr(resource_create_instance, attribute_name):
-                            new_value = getattr(resource_create_instance, attribute_name)
-                            setattr(resource, attribute_name, new_value)
-                    deserialize_resource_relationships(
-                        session, self.resource_class, resource, resource_create_instance
-                    )
+                    plan = self.resource_copy_plan
+                    plan.copy_attributes(resource, resource_create_instance)
+                    plan.copy_relationships(session, resource, resource_create_instance)
+                    if hasattr(resource, "aiod_date_modified"):
+                        resource.aiod_date_modified = datetime.datetime.utcnow()
                     try:
                         session.merge(resource)
                         session.commit()
+                        counts.invalidate(self.resource_class)
+                        response_cache.invalidate(self.resource_name, identifier)
                     except Exception as e:
                         self._raise_clean_http_exception(e, session, resource_create_instance)
                 return self._wrap_with_headers(None)
@@ -416,6 +864,185 @@ class ResourceRouter(abc.ABC):
 
         return put_resource
 
+    def patch_resource_func(self, engine: Engine):
+        """
+        Return a function that can be used to partially update a resource.
+        This function returns a function (instead of being that function directly) because the
+        docstring is dynamic and used in Swagger.
+        """
+        clz_patch = self.resource_class_patch
+
+        def patch_resource(
+            identifier: int,
+            resource_patch_instance: clz_patch,  # type: ignore
+            user: dict = Depends(get_current_user),
+        ):
+            f"""Update the given attributes of an existing {self.resource_name}. The attributes
+            that are not given are left untouched."""
+            if "groups" in user and KEYCLOAK_CONFIG.get("role") not in user["groups"]:
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail="You do not have permission to edit Aiod resources.",
+                )
+
+            fields = resource_patch_instance.__fields_set__  # type: ignore[attr-defined]
+            try:
+                with Session(engine) as session:
+                    resource = self._retrieve_resource(session, identifier)
+                    plan = self.resource_copy_plan
+                    plan.copy_attributes(resource, resource_patch_instance, fields)
+                    plan.copy_relationships(session, resource, resource_patch_instance, fields)
+                    if not session.is_modified(resource):
+                        return self._wrap_with_headers(None)
+                    if hasattr(resource, "aiod_date_modified"):
+                        resource.aiod_date_modified = datetime.datetime.utcnow()
+                    try:
+                        session.commit()
+                        counts.invalidate(self.resource_class)
+                        response_cache.invalidate(self.resource_name, identifier)
+                    except Exception as e:
+                        self._raise_clean_http_exception(e, session, resource_patch_instance)
+                return self._wrap_with_headers(None)
+            except Exception as e:
+                raise _wrap_as_http_exception(e)
+
+        return patch_resource
+
+    def register_resources_bulk_func(self, engine: Engine):
+        """
+        Return a function that can be used to register many resources at once.
+        This function returns a function (instead of being that function directly) because the
+        docstring is dynamic and used in Swagger.
+        """
+
+        def register_resources(
+            items: list[Any] = Depends(_bulk_items), user: dict = Depends(get_current_user)
+        ):
+            f"""Register many {self.resource_name_plural} with AIoD, given as a JSON array of
+            {self.resource_name}s, or as newline-delimited JSON (Content-Type:
+            application/x-ndjson). The resources are stored in batches, and the response
+            contains for every resource either its identifier or an error."""
+            if "groups" in user and KEYCLOAK_CONFIG.get("role") not in user["groups"]:
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail="You do not have permission to edit Aiod resources.",
+                )
+            responses: list[dict] = [{} for _ in items]
+            valid = self._parse_bulk_items(items, responses)
+            try:
+                with Session(engine) as session:
+                    inserter = BulkInserter(session, self)
+                    for batch in _chunks(valid, inserter.batch_size):
+                        results = inserter.insert_batch([item for _, item in batch])
+                        for j, ((i, item), (identifier, created)) in enumerate(zip(batch, results)):
+                            if created and identifier is not None:
+                                response_cache.invalidate(self.resource_name, identifier)
+                                responses[i] = {"identifier": identifier}
+                            elif j in inserter.errors:
+                                responses[i] = self._bulk_error(session, inserter.errors[j], item)
+                            else:
+                                responses[i] = _bulk_error(
+                                    status.HTTP_409_CONFLICT,
+                                    f"There already exists a {self.resource_name} with the same "
+                                    f"platform and platform_identifier, with "
+                                    f"identifier={identifier}.",
+                                )
+                return self._wrap_with_headers(responses)
+            except Exception as e:
+                raise _wrap_as_http_exception(e)
+
+        return register_resources
+
+    def put_resources_bulk_func(self, engine: Engine):
+        """
+        Return a function that can be used to update many resources at once.
+        This function returns a function (instead of being that function directly) because the
+        docstring is dynamic and used in Swagger.
+        """
+
+        def put_resources(
+            items: list[Any] = Depends(_bulk_items), user: dict = Depends(get_current_user)
+        ):
+            f"""Update many existing {self.resource_name_plural}, given as a JSON array of
+            {self.resource_name}s including their identifier, or as newline-delimited JSON
+            (Content-Type: application/x-ndjson). The resources are updated in batches, and the
+            response contains for every resource its identifier and possibly an error."""
+            if "groups" in user and KEYCLOAK_CONFIG.get("role") not in user["groups"]:
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail="You do not have permission to edit Aiod resources.",
+                )
+            responses: list[dict] = [{} for _ in items]
+            identifiers: list[Any] = [None] * len(items)
+            for i, item in enumerate(items):
+                if isinstance(item, dict):
+                    identifiers[i] = item.pop("identifier", None)
+                if not isinstance(identifiers[i], int):
+                    responses[i] = _bulk_error(
+                        status.HTTP_422_UNPROCESSABLE_ENTITY,
+                        "An integer identifier is required to update a resource.",
+                    )
+            valid = self._parse_bulk_items(items, responses)
+            try:
+                with Session(engine) as session:
+                    inserter = BulkInserter(session, self)
+                    for batch in _chunks(valid, inserter.batch_size):
+                        inserter.replace_batch([(identifiers[i], item) for i, item in batch])
+                        for j, (i, item) in enumerate(batch):
+                            responses[i] = {"identifier": identifiers[i]}
+                            if j in inserter.errors:
+                                error = self._bulk_error(session, inserter.errors[j], item)
+                                responses[i] |= error
+                return self._wrap_with_headers(responses)
+            except Exception as e:
+                raise _wrap_as_http_exception(e)
+
+        return put_resources
+
+    def _parse_bulk_items(self, items: list[Any], responses: list[dict]) -> list[tuple[int, Any]]:
+        """
+        Validate the items of a bulk request that do not have a response yet. Returns the valid
+        items as resource_class_create instances, with their index.
+        """
+        valid = []
+        for i, item in enumerate(items):
+            if responses[i]:
+                continue
+            try:
+                valid.append((i, self.resource_class_create.parse_obj(item)))
+            except ValidationError as e:
+                responses[i] = _bulk_error(status.HTTP_422_UNPROCESSABLE_ENTITY, e.errors())
+        return valid
+
+    def _bulk_error(self, session: Session, error: Exception, resource_create: SQLModel) -> dict:
+        """The error of a single item of a bulk request, as the single endpoints would raise."""
+        if isinstance(error, HTTPException):
+            http_error = error
+        elif isinstance(error, ValueError):
+            http_error = HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error))
+        else:
+            try:
+                self._raise_clean_http_exception(error, session, resource_create)
+            except HTTPException as e:
+                http_error = e
+        return _bulk_error(http_error.status_code, http_error.detail)
+
+    def _bulk_request_body(self) -> dict:
+        """
+        The OpenAPI description of the body of the bulk endpoints. The schema of the
+        resource_class_create is defined by the POST endpoint.
+        """
+        item = {"$ref": f"#/components/schemas/{self.resource_class_create.__name__}"}
+        return {
+            "requestBody": {
+                "required": True,
+                "content": {
+                    "application/json": {"schema": {"type": "array", "items": item}},
+                    "application/x-ndjson": {"schema": item},
+                },
+            }
+        }
+
     def delete_resource_func(self, engine: Engine):
         """
         Return a function that can be used to delete a resource.
@@ -432,12 +1059,21 @@ class ResourceRouter(abc.ABC):
 
             try:
                 with Session(engine) as session:
-                    self._retrieve_resource(session, identifier)  # Raise error if it does not exist
+                    # Raise error if it does not exist
+                    resource = self._retrieve_resource(session, identifier)
+                    resource_identifier = resource.identifier
+                    touch_related(session, resource)
                     statement = delete(self.resource_class).where(
                         self.resource_class.identifier == identifier
                     )
                     session.execute(statement)
+                    if len(self.schema_converters) > 0:
+                        schema_documents.delete_documents(
+                            session, self.resource_name, resource_identifier
+                        )
                     session.commit()
+                    counts.invalidate(self.resource_class)
+                    response_cache.invalidate(self.resource_name, resource_identifier)
                 return self._wrap_with_headers(None)
             except Exception as e:
                 if "foreign key" in str(e).lower():  # Should work regardless of db technology
@@ -454,11 +1090,7 @@ class ResourceRouter(abc.ABC):
         if platform is None:
             query = select(self.resource_class).where(self.resource_class.identifier == identifier)
         else:
-            if platform not in {n.name for n in PlatformName}:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"platform '{platform}' not recognized.",
-                )
+            _raise_error_on_invalid_platform(platform)
             query = select(self.resource_class).where(
                 and_(
                     self.resource_class.platform_identifier == identifier,
@@ -481,14 +1113,41 @@ class ResourceRouter(abc.ABC):
     def _possible_schemas(self) -> list[str]:
         return ["aiod"] + list(self.schema_converters.keys())
 
-    def _wrap_with_headers(self, resource):
+    def _convert_schema_func(self, schema: str):
+        """Return the function converting an orm resource to the given schema."""
+        if schema != "aiod":
+            return self.schema_converters[schema].convert
+        return self.resource_class_read.from_orm
+
+    def _deprecation_headers(self) -> dict[str, str]:
         if self.deprecated_from is None:
-            return resource
+            return {}
         timestamp = datetime.datetime.combine(
             self.deprecated_from, datetime.time.min, tzinfo=datetime.timezone.utc
         ).timestamp()
-        headers = {"Deprecated": format_date_time(timestamp)}
-        return JSONResponse(content=jsonable_encoder(resource, exclude_none=True), headers=headers)
+        return {"Deprecated": format_date_time(timestamp)}
+
+    def _wrap_with_headers(self, resource, headers: dict[str, str] | None = None):
+        """Add the headers (and the deprecation header) to the response."""
+        headers = {**self._deprecation_headers(), **(headers or {})}
+        if len(headers) == 0:
+            return resource
+        return ORJSONResponse(content=resource, headers=headers)
+
+    def _json_response(self, content: Any, headers: dict[str, str] | None = None) -> Response:
+        """
+        Encode the content directly, bypassing the validation and serialization of the response
+        model by FastAPI.
+        """
+        return ORJSONResponse(
+            content=content, headers={**self._deprecation_headers(), **(headers or {})}
+        )
+
+    def _not_modified_response(self, headers: dict[str, str]) -> Response:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={**self._deprecation_headers(), **headers},
+        )
 
     def _raise_clean_http_exception(
         self, e: Exception, session: Session, resource_create: SQLModel
@@ -576,9 +1235,138 @@ def _wrap_as_http_exception(exception: Exception) -> HTTPException:
     )
 
 
+async def _bulk_items(request: Request) -> list[Any]:
+    """
+    The items of a bulk request, given as a JSON array or as newline-delimited JSON. The
+    newline-delimited JSON is parsed while it is received.
+    """
+    try:
+        if request.headers.get("content-type", "").startswith("application/x-ndjson"):
+            items = []
+            buffer = b""
+            async for chunk in request.stream():
+                *lines, buffer = (buffer + chunk).split(b"\n")
+                items += [json.loads(line) for line in lines if line.strip()]
+            if buffer.strip():
+                items.append(json.loads(buffer))
+            return items
+        items = json.loads(await request.body())
+    except ValueError:
+        items = None
+    if not isinstance(items, list):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="The body should be a JSON array, or newline-delimited JSON with Content-Type "
+            "application/x-ndjson.",
+        )
+    return items
+
+
+def _bulk_error(status_code: int, detail: Any) -> dict:
+    return {"error": {"status_code": status_code, "detail": detail}}
+
+
+def _chunks(items: list, size: int) -> Iterator[list]:
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def _encode_cursor(values: dict[str, Any]) -> str:
+    """Encode the values of the last row of a page as an opaque cursor."""
+    encoded = json.dumps(values, default=datetime.datetime.isoformat)
+    return base64.urlsafe_b64encode(encoded.encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor: str, attribute_types: dict[str, type]) -> dict[str, Any]:
+    """
+    Decode a cursor created by `_encode_cursor`, raising a HTTPException if it is invalid: if it
+    does not contain exactly the given attributes, or if a value does not have the type of its
+    attribute (or null). Datetimes are given as ISO strings.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        if isinstance(values, dict) and set(values.keys()) == set(attribute_types):
+            return {
+                attribute: _cursor_value(value, attribute_types[attribute])
+                for attribute, value in values.items()
+            }
+    except (ValueError, TypeError, binascii.Error):
+        pass
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"Invalid cursor '{cursor}'.",
+    )
+
+
+def _cursor_value(value: Any, type_: type) -> Any:
+    if value is None:
+        return None
+    if issubclass(type_, datetime.datetime) and isinstance(value, str):
+        return datetime.datetime.fromisoformat(value)
+    if type(value) is not type_:
+        raise TypeError(f"Expected a value of type {type_.__name__}, got {value!r}.")
+    return value
+
+
+def _strong_etag(identifier: int, last_modified: datetime.datetime, schema: str) -> str:
+    """The ETag of a single resource, based on its row version."""
+    return f'"{identifier}-{last_modified:%Y%m%d%H%M%S%f}-{schema}"'
+
+
+def _weak_etag(resources: list, schema: str) -> str | None:
+    """
+    The ETag of a page of resources, based on the identifiers and the maximum row version of
+    the resources on the page. It is weak, because a change in a related resource (such as a
+    keyword) can result in a different representation with the same ETag.
+    """
+    last_modified: list[datetime.datetime] = []
+    for resource in resources:
+        row_version = getattr(resource, "aiod_date_modified", None)
+        if row_version is None:
+            return None
+        last_modified.append(row_version)
+    identifiers = ",".join(str(resource.identifier) for resource in resources)
+    version = f"{max(last_modified):%Y%m%d%H%M%S%f}" if len(last_modified) > 0 else ""
+    digest = hashlib.sha1(f"{identifiers}-{version}-{schema}".encode("utf-8")).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _is_not_modified(
+    if_none_match: str | None,
+    if_modified_since: str | None,
+    etag: str,
+    last_modified: datetime.datetime | None = None,
+) -> bool:
+    """
+    Evaluate the preconditions of a conditional GET request (RFC 9110). If-None-Match takes
+    precedence over If-Modified-Since, and uses the weak comparison.
+    """
+    if if_none_match is not None:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or etag.removeprefix("W/") in tags
+    if if_modified_since is not None and last_modified is not None:
+        try:
+            since = email.utils.parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is not None:
+            since = since.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+        return last_modified.replace(microsecond=0) <= since
+    return False
+
+
 def _raise_error_on_invalid_schema(possible_schemas, schema):
     if schema not in possible_schemas:
         raise HTTPException(
             detail=f"Invalid schema {schema}. Expected {' or '.join(possible_schemas)}",
             status_code=status.HTTP_400_BAD_REQUEST,
         )
+
+
+def _raise_error_on_invalid_platform(platform: str):
+    if platform not in {n.name for n in PlatformName}:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"platform '{platform}' not recognized.",
+        )
@@ -0,0 +1,94 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import update
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, select
+
+from authentication import get_current_user
+from config import KEYCLOAK_CONFIG
+from database.model.sync_job import SyncJob, SyncJobCreate, SyncJobStatus
+from database.sync_jobs import create_job
+
+
+def _check_permission(user: dict):
+    if "groups" in user and KEYCLOAK_CONFIG.get("role") not in user["groups"]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have permission to synchronize the connectors.",
+        )
+
+
+class SyncRouter:
+    """
+    Router to administer the synchronization jobs of the connectors. The jobs are run in the
+    background by the JobRunner.
+    """
+
+    def create(self, engine: Engine, url_prefix: str) -> APIRouter:
+        router = APIRouter()
+
+        @router.get(url_prefix + "/sync/jobs", tags=["sync"])
+        def list_jobs(
+            offset: int = 0, limit: int = 100, user: dict = Depends(get_current_user)
+        ) -> list[SyncJob]:
+            """Retrieve the synchronization jobs, the most recent first."""
+            _check_permission(user)
+            with Session(engine) as session:
+                query = select(SyncJob).order_by(SyncJob.identifier.desc())  # type: ignore
+                return session.scalars(query.offset(offset).limit(limit)).all()
+
+        @router.get(url_prefix + "/sync/jobs/{identifier}", tags=["sync"])
+        def get_job(identifier: int, user: dict = Depends(get_current_user)) -> SyncJob:
+            """Retrieve a synchronization job, including its progress."""
+            _check_permission(user)
+            with Session(engine) as session:
+                return _get(session, identifier)
+
+        @router.post(url_prefix + "/sync/jobs", tags=["sync"])
+        def create_sync_job(
+            job_create: SyncJobCreate, user: dict = Depends(get_current_user)
+        ) -> SyncJob:
+            """Queue a synchronization of the given connectors."""
+            _check_permission(user)
+            try:
+                return create_job(engine, job_create.connectors, limit=job_create.limit)
+            except ValueError as e:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        @router.post(url_prefix + "/sync/jobs/{identifier}/cancel", tags=["sync"])
+        def cancel_job(identifier: int, user: dict = Depends(get_current_user)) -> SyncJob:
+            """
+            Cancel a synchronization job. A queued job is cancelled immediately, a running job
+            stops after storing the resources that have already been fetched.
+            """
+            _check_permission(user)
+            with Session(engine) as session:
+                job = _get(session, identifier)
+                # A conditional update, because the job might be started in the meantime
+                cancelled = session.execute(
+                    update(SyncJob)
+                    .where(SyncJob.identifier == identifier, SyncJob.status == SyncJobStatus.queued)
+                    .values(status=SyncJobStatus.cancelled, active_key=None)
+                )
+                session.refresh(job)
+                if cancelled.rowcount == 0:  # type: ignore[attr-defined]  # a CursorResult
+                    if job.status != SyncJobStatus.running:
+                        raise HTTPException(
+                            status_code=status.HTTP_409_CONFLICT,
+                            detail=f"Synchronization job '{identifier}' has already finished.",
+                        )
+                    job.cancel_requested = True
+                session.commit()
+                session.refresh(job)
+                return job
+
+        return router
+
+
+def _get(session: Session, identifier: int) -> SyncJob:
+    job = session.get(SyncJob, identifier)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Synchronization job '{identifier}' not found in the database.",
+        )
+    return job
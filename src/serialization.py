@@ -1,13 +1,21 @@
 import abc
 import dataclasses
-from typing import Any, TypeVar, Generic, Dict, List, Type
+import datetime
+import decimal
+import operator
+from typing import Any, Callable, TypeVar, Generic, Dict, List, Type
 
 from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from pydantic.fields import ModelField, SHAPE_LIST, SHAPE_SINGLETON
+from pydantic.json import decimal_encoder
 from pydantic.utils import GetterDict
 from sqlmodel import SQLModel, Session, select
 from starlette.status import HTTP_404_NOT_FOUND
 
 from database.model.named_relation import NamedRelation
+from database.named_relation_cache import NamedRelationCache
 
 MODEL = TypeVar("MODEL", bound=SQLModel)
 
@@ -70,7 +78,8 @@ class FindByNameDeserializer(DeSerializer[NamedRelation]):
     Deserialization of NamedValues: uniquely identified by their name.
 
     In case of a single name, this deserializer returns the identifier. In case of a list of
-    names, it returns the list of NamedValues.
+    names, it returns the list of NamedValues. The identifiers are cached per session, see
+    NamedRelationCache.
     """
 
     clazz: type[NamedRelation]
@@ -78,24 +87,11 @@ class FindByNameDeserializer(DeSerializer[NamedRelation]):
     def deserialize(
         self, session: Session, name: str | list[str]
     ) -> NamedRelation | list[NamedRelation]:
+        cache = NamedRelationCache.of(session)
         if not isinstance(name, list):
-            query = select(self.clazz.identifier).where(self.clazz.name == name)
-            identifier = session.scalars(query).first()
-            if identifier is None:
-                new_object = self.clazz(name=name)
-                session.add(new_object)
-                session.flush()
-                identifier = new_object.identifier
-            return identifier
-
-        query = select(self.clazz).where(self.clazz.name.in_(name))  # type: ignore[attr-defined]
-        existing = session.scalars(query).all()
-        names_not_found = set(name) - {e.name for e in existing}
-        new_objects = [self.clazz(name=name) for name in names_not_found]
-        if any(names_not_found):
-            session.add_all(new_objects)
-            session.flush()
-        return sorted(existing + new_objects, key=lambda o: o.identifier)
+            return cache.identifiers(session, self.clazz, [name])[name]
+        objects = {o.identifier: o for o in cache.objects(session, self.clazz, name).values()}
+        return [objects[identifier] for identifier in sorted(objects)]
 
 
 @dataclasses.dataclass
@@ -137,6 +133,7 @@ def create_getter_dict(attribute_serializers: Dict[str, Serializer]):
                     return serializer.serialize(attribute)
             return super().get(key, default)
 
+    GetterDictSerializer.attribute_serializers = attribute_serializers  # type: ignore
     return GetterDictSerializer
 
 
@@ -164,3 +161,117 @@ def deserialize_resource_relationships(
                     setattr(resource, relationship.identifier_name, new_value)
                 else:
                     setattr(resource, attribute, new_value)
+
+
+_compiled_serializers: dict[tuple[Type[BaseModel], bool], Callable[[Any], dict]] = {}
+
+
+def compile_serializer(model: Type[BaseModel], exclude_none: bool = True) -> Callable[[Any], dict]:
+    """
+    Compile a function that serializes an ORM object directly into the json-compatible dict that
+    `jsonable_encoder(model.from_orm(orm_object), exclude_none=exclude_none)` would return.
+
+    The Serializers of the model (see `create_getter_dict`) and a converter per field are
+    looked up once, instead of for every attribute of every object, and the values are not
+    validated by Pydantic. It should therefore only be used for trusted data, such as the rows
+    of the database.
+    """
+    if (model, exclude_none) not in _compiled_serializers:
+        attribute_serializers = getattr(model.__config__.getter_dict, "attribute_serializers", {})
+        fields = [
+            (
+                field.alias,
+                name,
+                field.get_default(),
+                _field_converter(field, attribute_serializers.get(name), exclude_none),
+            )
+            for name, field in model.__fields__.items()
+        ]
+
+        def serialize(orm_object: Any) -> dict:
+            result = {}
+            for key, attribute, default, convert in fields:
+                value = getattr(orm_object, attribute, default)
+                if value is not None:
+                    result[key] = value if convert is None else convert(value)
+                elif not exclude_none:
+                    result[key] = None
+            return result
+
+        _compiled_serializers[(model, exclude_none)] = serialize
+    return _compiled_serializers[(model, exclude_none)]
+
+
+def _field_converter(
+    field: ModelField, serializer: Serializer | None, exclude_none: bool
+) -> Callable[[Any], Any] | None:
+    """
+    The function converting an attribute value to a json-compatible value, or None if the value
+    can be used as-is.
+    """
+    if field.shape not in (SHAPE_SINGLETON, SHAPE_LIST):
+        return lambda value: _validate(field, value, exclude_none)
+    item_field = field.sub_fields[0] if field.sub_fields and field.shape == SHAPE_LIST else field
+    convert = _value_converter(item_field, exclude_none)
+    serialize: Callable[[Any], Any] | None = None
+    if isinstance(serializer, AttributeSerializer):
+        serialize = operator.attrgetter(serializer.attribute_name)
+    elif serializer is not None:
+        serialize = serializer.serialize
+
+    if serialize is None:
+        convert_item = convert
+    elif convert is None:
+        convert_item = serialize
+    else:
+        convert_item = _compose(convert, serialize)
+    if field.shape == SHAPE_LIST:
+        if convert_item is None:
+            return list
+        return _convert_each(convert_item)
+    return convert_item
+
+
+def _compose(
+    convert: Callable[[Any], Any], serialize: Callable[[Any], Any]
+) -> Callable[[Any], Any]:
+    return lambda value: convert(serialize(value))
+
+
+def _convert_each(convert: Callable[[Any], Any]) -> Callable[[list], list]:
+    return lambda values: [convert(value) for value in values]
+
+
+_JSON_TYPES = (bool, int, float, str)
+
+
+def _value_converter(field: ModelField, exclude_none: bool) -> Callable[[Any], Any] | None:
+    type_ = field.type_
+    if isinstance(type_, type):
+        if issubclass(type_, BaseModel):
+            return compile_serializer(type_, exclude_none)
+        json_type = next((t for t in _JSON_TYPES if issubclass(type_, t)), None)
+        if json_type is not None:
+            # Values of another type (e.g. an identifier stored as string) are validated, just
+            # like Pydantic would coerce them
+            return lambda value: (
+                value if type(value) is json_type else _validate(field, value, exclude_none)
+            )
+        if issubclass(type_, (datetime.date, datetime.time)):  # including datetime
+            return lambda value: value.isoformat()
+        if issubclass(type_, decimal.Decimal):
+            # Encoded like Pydantic: as int if it has no decimals, as float otherwise
+            return lambda value: (
+                decimal_encoder(value)
+                if isinstance(value, decimal.Decimal)
+                else _validate(field, value, exclude_none)
+            )
+    return lambda value: _validate(field, value, exclude_none)
+
+
+def _validate(field: ModelField, value: Any, exclude_none: bool) -> Any:
+    """The slow path: validating the value using Pydantic, and encoding it as FastAPI would."""
+    validated, errors = field.validate(value, {}, loc=field.alias)
+    if errors:
+        raise ValueError(f"Could not serialize {field.alias}: {errors}")
+    return jsonable_encoder(validated, exclude_none=exclude_none)
@@ -0,0 +1,54 @@
+"""
+Run a synchronization of the connectors in the foreground, without starting the API. The job is
+persisted like the jobs that are run in the background by the API, so that its progress can be
+followed using the /sync/jobs endpoints.
+
+Example, from the src directory:
+
+    python synchronize.py openml/dataset zenodo/dataset --limit 100
+"""
+import argparse
+import logging
+
+from database.model.sync_job import SyncJobStatus
+from database.job_runner import JobRunner
+from database.setup import configured_engine
+from database.sync_jobs import available_connectors, create_job
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "connectors",
+        nargs="+",
+        choices=available_connectors().keys(),
+        help="The connectors to synchronize.",
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=None,
+        help="Limit the number of resources that are fetched per connector.",
+    )
+    parser.add_argument(
+        "--rebuild-db",
+        default="only-if-empty",
+        choices=["no", "only-if-empty", "always"],
+        help="Determines if the database is recreated.",
+    )
+    return parser.parse_args()
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    args = _parse_args()
+    engine = configured_engine(args.rebuild_db)
+    job = create_job(engine, args.connectors, limit=args.limit)
+    status = JobRunner(engine).run_job(job.identifier)
+    if status is None:
+        raise SystemExit(f"Job {job.identifier} is run by another runner, see /sync/jobs.")
+    raise SystemExit(0 if status == SyncJobStatus.succeeded else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark of the serialization of pages of resources into the "aiod" schema, for every router,
+comparing the compiled serializer with the previous path: `from_orm` on the Read class,
+followed by the validation of the response model and the `jsonable_encoder` of FastAPI.
+
+    python -m tests.benchmarks.resource_serialization --resources 1000
+
+Run from the src directory. The resources are copies of the example resources, stored in a
+temporary SQLite database, and loaded with all their relationships before the timing starts.
+"""
+import argparse
+import pathlib
+import tempfile
+import time
+from typing import Callable
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.utils import create_response_field
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlmodel import SQLModel, Session, select
+
+import routers
+from database.bulk_insert import BulkInserter
+from database.setup import add_platforms
+from routers import ResourceRouter
+from tests.testutils.example_instances import example_instances
+
+
+def fill(engine: Engine, router: ResourceRouter, n: int):
+    with Session(engine) as session:
+        BulkInserter(session, router).insert_all(example_instances(router, n))
+
+
+def serialize_from_orm(router: ResourceRouter) -> Callable[[list], list]:
+    """The previous implementation, as FastAPI serialized the response model of a page"""
+    field = create_response_field(
+        name=f"{router.resource_name}_page", type_=list[router.resource_class_read]  # type: ignore
+    )
+
+    def serialize(resources: list) -> list:
+        content = [router.resource_class_read.from_orm(resource) for resource in resources]
+        value, errors = field.validate(content, {}, loc=())
+        assert not errors
+        return jsonable_encoder(value, exclude_none=True)
+
+    return serialize
+
+
+def serialize_compiled(router: ResourceRouter) -> Callable[[list], list]:
+    def serialize(resources: list) -> list:
+        return [router.resource_serializer(resource) for resource in resources]
+
+    return serialize
+
+
+def measure(serialize: Callable[[list], list], resources: list, repeat: int) -> float:
+    """The best duration of `repeat` runs, in seconds"""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        serialize(resources)
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--resources", type=int, default=1000, help="The resources per router")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_engine(f"sqlite:///{pathlib.Path(tmp_dir) / 'benchmark.db'}")
+        SQLModel.metadata.create_all(engine)
+        add_platforms(engine)
+        print(f"{'router':<24} {'from_orm':>12} {'compiled':>12} {'speedup':>8}")
+        for router in routers.resource_routers:
+            fill(engine, router, args.resources)
+            with Session(engine) as session:
+                query = select(router.resource_class).options(*router.resource_loader_options)
+                resources = session.scalars(query).all()
+                from_orm = measure(serialize_from_orm(router), resources, args.repeat)
+                compiled = measure(serialize_compiled(router), resources, args.repeat)
+                assert serialize_from_orm(router)(resources) == serialize_compiled(router)(
+                    resources
+                )
+            print(
+                f"{router.resource_name:<24} {len(resources) / from_orm:>10,.0f}/s "
+                f"{len(resources) / compiled:>10,.0f}/s {from_orm / compiled:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Micro-benchmark of the encoding of large pages of datasets into the bytes of a response,
+comparing the ORJSONResponse with the previous encoding: the `jsonable_encoder` of FastAPI,
+followed by the standard library encoder of Starlette's JSONResponse.
+
+    python -m tests.benchmarks.response_encoding --page-size 1000
+
+Run from the src directory. Both the json-compatible dicts of the "aiod" schema and the
+Pydantic models of the other schemas are encoded.
+"""
+import argparse
+import pathlib
+import tempfile
+from typing import Any, Callable
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import create_engine
+from sqlmodel import SQLModel, Session, select
+from starlette.responses import JSONResponse
+
+import routers
+from tests.benchmarks.resource_serialization import fill, measure
+from database.model.dataset.dataset import Dataset
+from database.setup import add_platforms
+from routers.json_response import ORJSONResponse
+
+
+def encode_baseline(content: Any) -> bytes:
+    return JSONResponse(jsonable_encoder(content, exclude_none=True)).body
+
+
+def encode_orjson(content: Any) -> bytes:
+    return ORJSONResponse(content).body
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    (router,) = [r for r in routers.resource_routers if r.resource_class == Dataset]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_engine(f"sqlite:///{pathlib.Path(tmp_dir) / 'benchmark.db'}")
+        SQLModel.metadata.create_all(engine)
+        add_platforms(engine)
+        fill(engine, router, args.page_size)
+        with Session(engine) as session:
+            query = select(Dataset).options(*router.resource_loader_options)
+            page = session.scalars(query).all()
+            contents = {
+                schema: router._convert_all(page, schema) for schema in router._possible_schemas
+            }
+
+    print(f"{'schema':<12} {'MiB':>6} {'baseline':>12} {'orjson':>12} {'speedup':>8}")
+    for schema, content in contents.items():
+        encoders: dict[str, Callable[[Any], bytes]] = {
+            "baseline": encode_baseline,
+            "orjson": encode_orjson,
+        }
+        durations = {
+            name: measure(lambda _: encode(content), page, args.repeat)
+            for name, encode in encoders.items()
+        }
+        print(
+            f"{schema:<12} {len(encode_orjson(content)) / 2**20:>6.1f} "
+            f"{len(page) / durations['baseline']:>10,.0f}/s "
+            f"{len(page) / durations['orjson']:>10,.0f}/s "
+            f"{durations['baseline'] / durations['orjson']:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Benchmark of the parsing of Zenodo OAI-PMH ListRecords responses, reporting the records per
+second and the peak memory usage.
+
+By default, a dump is generated by replicating the records of the test resources. A recorded
+dump of a ListRecords response can be used instead:
+
+    curl "https://zenodo.org/oai2d?verb=ListRecords&metadataPrefix=oai_datacite" > dump.xml
+    python -m tests.benchmarks.zenodo_oai_pmh --dump dump.xml
+
+Run from the src directory. The previous implementation, which parsed the complete page and
+ran xmltodict on every record, is included as a baseline if xmltodict is installed.
+"""
+import argparse
+import multiprocessing
+import pathlib
+import re
+import resource
+import tempfile
+import time
+from typing import Callable
+
+from lxml import etree
+
+from connectors.zenodo.oai_pmh import OAI_NAMESPACE, ListRecordsPage
+from tests.testutils.paths import path_test_resources
+
+TEST_RESOURCE = path_test_resources() / "connectors" / "zenodo" / "list_records.xml"
+
+
+def generate_dump(path: pathlib.Path, n_records: int):
+    """Write a ListRecords response with n_records, replicating the test records"""
+    content = TEST_RESOURCE.read_text()
+    start = content.index("<record")
+    end = content.rindex("</record>") + len("</record>")
+    records = content[start:end]
+    n_copies = n_records // records.count("<record") + 1
+    with open(path, "w") as f:
+        f.write(content[:start])
+        for i in range(n_copies):
+            f.write(re.sub(r"oai:zenodo.org:(\d+)", rf"oai:zenodo.org:{i}\1", records))
+        f.write(content[end:])
+
+
+def parse_streaming(path: pathlib.Path) -> int:
+    with open(path, "rb") as f:
+        page = ListRecordsPage(f, resource_type="Dataset")
+        for _ in page:
+            pass
+    return page.n_records
+
+
+def parse_baseline(path: pathlib.Path) -> int:
+    """The previous implementation: parsing the page, and running xmltodict on each record"""
+    import xmltodict
+
+    tree = etree.parse(str(path), etree.XMLParser(remove_blank_text=True, recover=True))
+    records = tree.getroot().iter(f"{OAI_NAMESPACE}record")
+    n_records = 0
+    for record in records:
+        n_records += 1
+        raw = etree.tostring(record, encoding="unicode")
+        start = raw.find('<resourceType resourceTypeGeneral="')
+        if start == -1:
+            continue
+        start += len('<resourceType resourceTypeGeneral="')
+        if raw.startswith("Dataset", start):
+            xmltodict.parse(raw)["record"]["metadata"]["oai_datacite"]["payload"]["resource"]
+    return n_records
+
+
+def _run(parse: Callable[[pathlib.Path], int], path: pathlib.Path, results: multiprocessing.Queue):
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    n_records = parse(path)
+    duration = time.perf_counter() - start
+    rss_increase = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before
+    results.put((n_records, duration, rss_increase))
+
+
+def measure(name: str, parse: Callable[[pathlib.Path], int], path: pathlib.Path):
+    """
+    Run the parser in a separate process, so that the peak memory usage (the maximum resident
+    set size, which includes the memory allocated by lxml) of the parsers does not interfere.
+    """
+    context = multiprocessing.get_context("fork")
+    results = context.Queue()
+    process = context.Process(target=_run, args=(parse, path, results))
+    process.start()
+    n_records, duration, rss_increase = results.get()
+    process.join()
+    print(
+        f"{name:<10} {n_records} records in {duration:.2f}s: {n_records / duration:,.0f} "
+        f"records/s, peak memory +{rss_increase / 2**10:.1f} MiB"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--dump", type=pathlib.Path, help="A recorded ListRecords response")
+    parser.add_argument("--records", type=int, default=50000, help="The size of a generated dump")
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = args.dump
+        if path is None:
+            path = pathlib.Path(tmp_dir) / "list_records.xml"
+            generate_dump(path, args.records)
+        print(f"Dump of {path.stat().st_size / 2**20:.1f} MiB")
+        measure("streaming", parse_streaming, path)
+        try:
+            import xmltodict  # noqa: F401
+        except ImportError:
+            print("baseline   skipped: xmltodict is not installed")
+        else:
+            measure("baseline", parse_baseline, path)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,13 @@
 import json
+import pathlib
 
 import responses
 
 import connectors
+from connectors.huggingface.huggingface_dataset_connector import (
+    HuggingFaceDatasetConnector,
+    ParquetInfoCache,
+)
 from connectors.resource_with_relations import ResourceWithRelations
 from database.model.platform.platform_names import PlatformName
 from tests.testutils.paths import path_test_resources
@@ -10,25 +15,20 @@ from tests.testutils.paths import path_test_resources
 HUGGINGFACE_URL = "https://datasets-server.huggingface.co"
 
 
+IDS_EXPECTED = {
+    "0n1xus/codexglue",
+    "04-07-22/wep-probes",
+    "rotten_tomatoes",
+    "acronym_identification",
+    "air_dialogue",
+}
+
+
 def test_fetch_all_happy_path():
-    ids_expected = {
-        "0n1xus/codexglue",
-        "04-07-22/wep-probes",
-        "rotten_tomatoes",
-        "acronym_identification",
-        "air_dialogue",
-    }
+    ids_expected = IDS_EXPECTED
     connector = connectors.dataset_connectors[PlatformName.huggingface]
     with responses.RequestsMock() as mocked_requests:
-        path_data_list = path_test_resources() / "connectors" / "huggingface" / "data_list.json"
-        with open(path_data_list, "r") as f:
-            response = json.load(f)
-        mocked_requests.add(
-            responses.GET,
-            "https://huggingface.co/api/datasets?full=True",
-            json=response,
-            status=200,
-        )
+        mock_list(mocked_requests)
         for dataset_id in ids_expected:
             mock_parquet(mocked_requests, dataset_id)
         resources_with_relations = list(connector.fetch_all(limit=None))
@@ -44,6 +44,58 @@ def test_fetch_all_happy_path():
     assert all(len(r.related_resources["citations"]) == 1 for r in resources_with_relations)
 
 
+def test_fetch_all_unordered_and_cached():
+    connector = HuggingFaceDatasetConnector(concurrency=2, ordered=False)
+    with responses.RequestsMock() as mocked_requests:
+        mock_list(mocked_requests)
+        for dataset_id in IDS_EXPECTED:
+            mock_parquet(mocked_requests, dataset_id)
+        datasets = [r.resource for r in connector.fetch_all(limit=None)]
+        n_parquet_requests = len(mocked_requests.calls) - 1
+    assert {d.platform_identifier for d in datasets} == IDS_EXPECTED
+    assert n_parquet_requests == len(IDS_EXPECTED)
+
+    with responses.RequestsMock() as mocked_requests:
+        mock_list(mocked_requests)
+        mock_parquet(mocked_requests, "04-07-22/wep-probes")  # An error response, not cached
+        datasets_again = [r.resource for r in connector.fetch_all(limit=None)]
+        assert [call.request.url for call in mocked_requests.calls][1:] == [
+            f"{HUGGINGFACE_URL}/parquet?dataset=04-07-22%2Fwep-probes"
+        ]
+    distributions = {d.platform_identifier: d.distributions for d in datasets}
+    assert {d.platform_identifier: d.distributions for d in datasets_again} == distributions
+
+
+def test_fetch_all_persisted_cache(tmp_path: pathlib.Path):
+    path = str(tmp_path / "parquet_cache")
+    connector = HuggingFaceDatasetConnector(parquet_cache=ParquetInfoCache(path))
+    with responses.RequestsMock() as mocked_requests:
+        mock_list(mocked_requests)
+        for dataset_id in IDS_EXPECTED:
+            mock_parquet(mocked_requests, dataset_id)
+        list(connector.fetch_all(limit=None))
+    assert connector.parquet_cache._shelf is None, "The shelf should be closed after fetching"
+
+    connector = HuggingFaceDatasetConnector(parquet_cache=ParquetInfoCache(path))
+    with responses.RequestsMock() as mocked_requests:
+        mock_list(mocked_requests)
+        mock_parquet(mocked_requests, "04-07-22/wep-probes")  # An error response, not cached
+        list(connector.fetch_all(limit=None))
+        assert len(mocked_requests.calls) == 2, "Only the listing and the uncached dataset"
+
+
+def mock_list(mocked_requests: responses.RequestsMock):
+    path_data_list = path_test_resources() / "connectors" / "huggingface" / "data_list.json"
+    with open(path_data_list, "r") as f:
+        response = json.load(f)
+    mocked_requests.add(
+        responses.GET,
+        "https://huggingface.co/api/datasets?full=True",
+        json=response,
+        status=200,
+    )
+
+
 def mock_parquet(mocked_requests: responses.RequestsMock, dataset_id: str):
     filename = f"parquet_{dataset_id.replace('/', '_')}.json"
     path_split = path_test_resources() / "connectors" / "huggingface" / filename
@@ -3,7 +3,10 @@ import json
 import responses
 
 import connectors
+from connectors.http import RateLimitedSession
+from connectors.openml.openml_dataset_connector import OpenMlDatasetConnector
 from database.model.platform.platform_names import PlatformName
+from database.model.sync_state import SyncState
 from tests.testutils.paths import path_test_resources
 
 OPENML_URL = "https://www.openml.org/api/v1/json"
@@ -94,3 +97,37 @@ def mock_openml_responses(mocked_requests: responses.RequestsMock, platform_iden
         json=data_qualities_response,
         status=200,
     )
+
+
+def test_fetch_since_happy_path():
+    connector = connectors.dataset_connectors[PlatformName.openml]
+    state = SyncState(connector="openml/dataset", platform="openml", last_identifiers=["2"])
+    with responses.RequestsMock() as mocked_requests:
+        with open(path_test_resources() / "connectors" / "openml" / "data_list.json", "r") as f:
+            response = json.load(f)
+        mocked_requests.add(
+            responses.GET, f"{OPENML_URL}/data/list/limit/10000/offset/0", json=response
+        )
+        for i in range(3, 5):
+            mock_openml_responses(mocked_requests, str(i))
+        datasets = list(connector.fetch_since(state))
+
+    assert [d.platform_identifier for d in datasets] == ["3", "4"]
+    assert state.last_identifiers == ["4"]
+
+
+def test_fetch_all_concurrently_with_retries():
+    connector = OpenMlDatasetConnector(concurrency=2)
+    connector.session = RateLimitedSession(backoff_factor=0)
+    with responses.RequestsMock() as mocked_requests:
+        with open(path_test_resources() / "connectors" / "openml" / "data_list.json", "r") as f:
+            response = json.load(f)
+        mocked_requests.add(
+            responses.GET, f"{OPENML_URL}/data/list/limit/3", json=response, status=200
+        )
+        mocked_requests.add(responses.GET, f"{OPENML_URL}/data/3", status=503)
+        for i in range(2, 5):
+            mock_openml_responses(mocked_requests, str(i))
+        datasets = list(connector.fetch_all(limit=3))
+
+    assert [d.platform_identifier for d in datasets] == ["2", "3", "4"]
@@ -0,0 +1,87 @@
+import threading
+import time
+from unittest.mock import Mock
+
+import responses
+
+from connectors.http import RateLimitedSession, RateLimiter, map_concurrently
+
+
+def test_retry_on_rate_limit_and_server_errors():
+    session = RateLimitedSession(backoff_factor=0)
+    with responses.RequestsMock() as mocked_requests:
+        mocked_requests.add(responses.GET, "https://example.com/a", status=429)
+        mocked_requests.add(responses.GET, "https://example.com/a", status=503)
+        mocked_requests.add(responses.GET, "https://example.com/a", json={"ok": True})
+        response = session.get("https://example.com/a")
+    assert response.json() == {"ok": True}
+
+
+def test_retry_gives_up():
+    session = RateLimitedSession(retries=1, backoff_factor=0)
+    with responses.RequestsMock() as mocked_requests:
+        mocked_requests.add(responses.GET, "https://example.com/a", status=500)
+        response = session.get("https://example.com/a")
+    assert response.status_code == 500
+
+
+def test_rate_limiter_per_key(monkeypatch):
+    sleep = Mock()
+    monkeypatch.setattr(time, "sleep", sleep)
+    monkeypatch.setattr(time, "monotonic", Mock(return_value=100.0))
+    rate_limiter = RateLimiter(requests_per_second=4)
+    for _ in range(3):
+        rate_limiter.wait("a.org")
+    rate_limiter.wait("b.org")
+    assert [c.args[0] for c in sleep.call_args_list] == [0.25, 0.5]
+
+
+def test_map_concurrently_ordered_and_bounded():
+    lock = threading.Lock()
+    running = []
+    max_running = 0
+    consumed = []
+
+    def func(i: int) -> int:
+        nonlocal max_running
+        with lock:
+            running.append(i)
+            max_running = max(max_running, len(running))
+        time.sleep(0.01 * (i % 3))
+        with lock:
+            running.remove(i)
+        return i * 2
+
+    def items():
+        for i in range(20):
+            consumed.append(i)
+            yield i
+
+    results = map_concurrently(func, items(), concurrency=3)
+    item, future = next(results)
+    assert (item, future.result()) == (0, 0)
+    assert len(consumed) <= 6, "The items should be consumed lazily"
+    assert [future.result() for _, future in results] == [i * 2 for i in range(1, 20)]
+    assert max_running <= 3
+
+
+def test_map_concurrently_exceptions():
+    def func(i: int) -> int:
+        if i == 1:
+            raise ValueError("error")
+        return i
+
+    results = list(map_concurrently(func, range(3), concurrency=2))
+    assert [item for item, _ in results] == [0, 1, 2]
+    assert isinstance(results[1][1].exception(), ValueError)
+    assert results[2][1].result() == 2
+
+
+def test_map_concurrently_unordered():
+    def func(i: int) -> int:
+        time.sleep(0.05 if i == 0 else 0)
+        return i
+
+    results = [item for item, _ in map_concurrently(func, range(4), concurrency=4, ordered=False)]
+    assert sorted(results) == [0, 1, 2, 3]
+    assert results[-1] == 0, "The slow item should not hold back the others"
@@ -2,6 +2,7 @@ from datetime import datetime
 import responses
 import connectors
 from database.model.platform.platform_names import PlatformName
+from database.model.sync_state import SyncState
 from tests.testutils.paths import path_test_resources
 
 
@@ -47,7 +48,88 @@ def mock_zenodo_responses(mocked_requests: responses.RequestsMock):
         records_list = f.read()
     mocked_requests.add(
         responses.GET,
-        "https://zenodo.org/oai2d?metadataPrefix=oai_datacite&from=2000-01-01T12%3A00%3A00&verb=ListRecords",  # noqa E501
+        "https://zenodo.org/oai2d?metadataPrefix=oai_datacite&from=2000-01-01T12%3A00%3A00Z&verb=ListRecords",  # noqa E501
         body=records_list,
         status=200,
     )
+
+
+def test_fetch_since_resumption_token():
+    connector = connectors.dataset_connectors[PlatformName.zenodo]
+    with open(path_test_resources() / "connectors" / "zenodo" / "list_records.xml", "r") as f:
+        records_list = f.read()
+    first_page = records_list.replace(
+        "</ListRecords>", "<resumptionToken>token-2</resumptionToken></ListRecords>"
+    )
+    second_page = records_list.replace("zenodo.org:7961614", "zenodo.org:1")
+    state = SyncState(connector="zenodo/dataset", platform="zenodo")
+    state.watermark = datetime(2023, 5, 1)
+    with responses.RequestsMock() as mocked_requests:
+        mocked_requests.add(
+            responses.GET,
+            "https://zenodo.org/oai2d?metadataPrefix=oai_datacite&from=2023-05-01T00%3A00%3A00Z&verb=ListRecords",  # noqa E501
+            body=first_page,
+        )
+        mocked_requests.add(
+            responses.GET,
+            "https://zenodo.org/oai2d?resumptionToken=token-2&verb=ListRecords",
+            body=second_page,
+        )
+        datasets = connector.fetch_since(state)
+        assert next(datasets).platform_identifier == "zenodo.org:7961614"
+        assert state.resumption_token is None
+        assert next(datasets).platform_identifier == "zenodo.org:1"
+        assert state.resumption_token == "token-2"
+        assert state.last_identifiers == ["zenodo.org:1"]
+        assert next(datasets, None) is None
+
+    # Resuming from the last stored page
+    with responses.RequestsMock() as mocked_requests:
+        mocked_requests.add(
+            responses.GET,
+            "https://zenodo.org/oai2d?resumptionToken=token-2&verb=ListRecords",
+            body=second_page,
+        )
+        assert [d.platform_identifier for d in connector.fetch_since(state)] == ["zenodo.org:1"]
+
+
+def test_fetch_since_expired_resumption_token():
+    connector = connectors.dataset_connectors[PlatformName.zenodo]
+    with open(path_test_resources() / "connectors" / "zenodo" / "list_records.xml", "r") as f:
+        records_list = f.read()
+    expired = (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/">'
+        '<error code="badResumptionToken">The token is expired</error></OAI-PMH>'
+    )
+    state = SyncState(connector="zenodo/dataset", platform="zenodo")
+    state.watermark = datetime(2023, 5, 1)
+    state.resumption_token = "token-2"
+    with responses.RequestsMock() as mocked_requests:
+        mocked_requests.add(
+            responses.GET,
+            "https://zenodo.org/oai2d?resumptionToken=token-2&verb=ListRecords",
+            body=expired,
+        )
+        mocked_requests.add(
+            responses.GET,
+            "https://zenodo.org/oai2d?metadataPrefix=oai_datacite&from=2023-05-01T00%3A00%3A00Z&verb=ListRecords",  # noqa E501
+            body=records_list,
+        )
+        datasets = list(connector.fetch_since(state))
+    assert [d.platform_identifier for d in datasets] == ["zenodo.org:7961614"]
+    assert state.resumption_token is None
+
+
+def test_fetch_since_watermark_with_microseconds():
+    connector = connectors.dataset_connectors[PlatformName.zenodo]
+    with open(path_test_resources() / "connectors" / "zenodo" / "list_records.xml", "r") as f:
+        records_list = f.read()
+    state = SyncState(connector="zenodo/dataset", platform="zenodo")
+    state.watermark = datetime(2023, 5, 1, 13, 14, 15, 161718)
+    with responses.RequestsMock() as mocked_requests:
+        mocked_requests.add(responses.GET, "https://zenodo.org/oai2d", body=records_list)
+        datasets = list(connector.fetch_since(state))
+        (call,) = mocked_requests.calls
+    assert [d.platform_identifier for d in datasets] == ["zenodo.org:7961614"]
+    assert call.request.params["from"] == "2023-05-01T13:14:15Z"
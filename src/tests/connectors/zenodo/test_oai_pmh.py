@@ -0,0 +1,49 @@
+import io
+
+import pytest
+
+from connectors.zenodo.oai_pmh import ListRecordsPage, OaiPmhError
+from tests.testutils.paths import path_test_resources
+
+
+def _page(body: str) -> str:
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/">'
+        f"<ListRecords>{body}</ListRecords></OAI-PMH>"
+    )
+
+
+def test_parse_list_records():
+    with open(path_test_resources() / "connectors" / "zenodo" / "list_records.xml", "rb") as f:
+        page = ListRecordsPage(f, resource_type="Dataset")
+        (record,) = list(page)
+    assert page.n_records == 3
+    assert page.resumption_token is None
+    assert record.identifier == "zenodo.org:7961614"
+    assert record.resource_type == "Dataset"
+    assert record.titles == ["THE FIELD'S MALL MASS SHOOTING: EMERGENCY MEDICAL SERVICES RESPONSE"]
+    assert len(record.creators) == 4
+    assert record.descriptions == [("Abstract", "This is a description paragraph")]
+    assert record.dates == [("Issued", "2023-05-06")]
+    assert record.rights_uris[0] == "https://creativecommons.org/licenses/by/4.0/legalcode"
+
+
+def test_deleted_records_and_resumption_token():
+    body = (
+        '<record><header status="deleted"><identifier>oai:zenodo.org:1</identifier></header>'
+        "</record>"
+        '<resumptionToken cursor="0">token-2</resumptionToken>'
+    )
+    page = ListRecordsPage(io.BytesIO(_page(body).encode()))
+    assert list(page) == []
+    assert page.n_records == 1
+    assert page.resumption_token == "token-2"
+
+
+def test_error():
+    body = '<error code="badResumptionToken">The token is expired</error>'
+    page = ListRecordsPage(io.BytesIO(_page(body).encode()))
+    with pytest.raises(OaiPmhError) as exc_info:
+        list(page)
+    assert exc_info.value.code == "badResumptionToken"
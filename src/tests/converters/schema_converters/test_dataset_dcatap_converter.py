@@ -1,4 +1,5 @@
 from converters.schema_converters import dataset_converter_dcatap_instance
+from converters.schema.dcat import VCardIndividual
 from database.model.dataset.dataset import Dataset
 from tests.testutils.paths import path_test_resources
 
@@ -12,3 +13,13 @@ def test_aiod_to_dcatap_happy_path(dataset: Dataset):
     for i, (row_actual, row_expected) in enumerate(zip(actual.split("\n"), expected.split("\n"))):
         assert row_actual == row_expected, f"Line {i}: {row_actual} != {row_expected}"
     assert actual == expected
+
+
+def test_convert_many_shares_individuals(dataset: Dataset):
+    converter = dataset_converter_dcatap_instance
+    results = converter.convert_many([dataset, dataset])
+    expected = converter.convert(dataset).json(by_alias=True)
+    assert [result.json(by_alias=True) for result in results] == [expected, expected]
+    individuals = [[n for n in r.graph_ if isinstance(n, VCardIndividual)] for r in results]
+    assert [n.fn for n in individuals[0]] == ["contact", "creator"]
+    assert all(a is b for a, b in zip(*individuals))
@@ -12,3 +12,10 @@ def test_aiod_to_schema_dot_org_happy_path(dataset: Dataset):
     for i, (row_actual, row_expected) in enumerate(zip(actual.split("\n"), expected.split("\n"))):
         assert row_actual == row_expected, f"Line {i}: {row_actual} != {row_expected}"
     assert actual == expected
+
+
+def test_convert_many(dataset: Dataset):
+    converter = dataset_converter_schema_dot_org_instance
+    results = converter.convert_many([dataset, dataset])
+    expected = converter.convert(dataset).json(by_alias=True)
+    assert [result.json(by_alias=True) for result in results] == [expected, expected]
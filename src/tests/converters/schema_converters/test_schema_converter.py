@@ -0,0 +1,43 @@
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, select
+
+import routers
+from converters.schema_converters import (
+    dataset_converter_dcatap_instance,
+    dataset_converter_schema_dot_org_instance,
+)
+from converters.schema_converters.schema_converter import SchemaConverter
+from database.model.dataset.dataset import Dataset
+from tests.testutils.example_instances import example_instances
+
+
+def _count_queries(engine: Engine, converter: SchemaConverter, n: int) -> int:
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with Session(engine) as session:
+        # Without the loader options, all relationships are unloaded
+        datasets = session.scalars(select(Dataset).limit(n)).all()
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            results = converter.convert_many(datasets)
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+        assert len(results) == n
+        assert results == [converter.convert(dataset) for dataset in datasets]
+    return len(statements)
+
+
+@pytest.mark.parametrize(
+    "converter", [dataset_converter_dcatap_instance, dataset_converter_schema_dot_org_instance]
+)
+def test_convert_many_constant_number_of_queries(engine: Engine, converter: SchemaConverter):
+    (router,) = [r for r in routers.resource_routers if r.resource_class == Dataset]
+    with Session(engine) as session:
+        for instance in example_instances(router, n=5):
+            router.create_resource(session, instance)
+    assert _count_queries(engine, converter, n=5) == _count_queries(engine, converter, n=1)
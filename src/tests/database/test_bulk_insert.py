@@ -0,0 +1,140 @@
+import logging
+from typing import Iterator
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, select
+
+import routers
+from connectors.resource_with_relations import ResourceWithRelations
+from database.bulk_insert import BulkInserter
+from database.model.ai_asset_table import AIAssetTable
+from database.model.dataset.dataset import Dataset
+from database.model.general.keyword import Keyword
+from database.model.publication.publication import Publication
+from database.model.resource import resource_create
+
+DatasetCreate = resource_create(Dataset)
+PublicationCreate = resource_create(Publication)
+(dataset_router,) = [r for r in routers.resource_routers if r.resource_class == Dataset]
+
+
+def _dataset(platform_identifier: str | None, **kwargs):
+    fields = {
+        "description": "",
+        "alternate_names": [],
+        "citations": [],
+        "distributions": [],
+        "is_part": [],
+        "has_parts": [],
+        "keywords": [],
+        "measured_values": [],
+    }
+    return DatasetCreate(
+        **(
+            fields
+            | {
+                "name": f"dataset {platform_identifier}",
+                "platform": "openml",
+                "platform_identifier": platform_identifier,
+                "same_as": f"https://example.com/{platform_identifier}",
+            }
+            | kwargs
+        )
+    )
+
+
+@pytest.fixture
+def statements(engine: Engine) -> Iterator[list[tuple[str, bool]]]:
+    """The executed statements, with a flag indicating if it was an executemany"""
+    executed = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        executed.append((statement, executemany))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield executed
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def test_insert_all(engine: Engine, statements: list):
+    items = [_dataset(str(i), keywords=["a", f"k{i % 2}"]) for i in range(5)]
+    with Session(engine) as session:
+        n_inserted = BulkInserter(session, dataset_router, batch_size=3).insert_all(items)
+    assert n_inserted == 5
+
+    with Session(engine) as session:
+        datasets = session.scalars(select(Dataset).order_by(Dataset.identifier)).all()
+        assert [d.identifier for d in datasets] == [1, 2, 3, 4, 5]
+        assert [d.platform_identifier for d in datasets] == ["0", "1", "2", "3", "4"]
+        assert sorted(k.name for k in datasets[3].keywords) == ["a", "k1"]
+        assert {k.name for k in session.scalars(select(Keyword))} == {"a", "k0", "k1"}
+        assert {a.type for a in session.scalars(select(AIAssetTable))} == {"dataset"}
+
+    dataset_inserts = [
+        many for statement, many in statements if "INSERT INTO dataset " in statement
+    ]
+    assert dataset_inserts == [True, True], "Expected an executemany per batch"
+
+
+def test_insert_existing_and_duplicates(engine: Engine):
+    with Session(engine) as session:
+        inserter = BulkInserter(session, dataset_router)
+        inserter.insert_all([_dataset("1")])
+        results = inserter.insert_batch([_dataset("1"), _dataset("2"), _dataset("2")])
+    assert results == [(1, False), (2, True), (2, False)]
+    with Session(engine) as session:
+        assert len(session.scalars(select(Dataset)).all()) == 2
+
+
+def test_error_isolation(engine: Engine, caplog):
+    items = [_dataset("1"), _dataset(None), _dataset("3"), _dataset("4", citations=[99])]
+    with Session(engine) as session, caplog.at_level(logging.WARNING):
+        results = BulkInserter(session, dataset_router).insert_batch(items)
+    assert [created for _, created in results] == [True, False, True, False]
+    assert "Nested object with identifiers 99 not found" in caplog.text
+    with Session(engine) as session:
+        datasets = session.scalars(select(Dataset)).all()
+        assert {d.platform_identifier for d in datasets} == {"1", "3"}
+        assert len(session.scalars(select(AIAssetTable)).all()) == 2
+
+
+def test_related_resources(engine: Engine):
+    publication = PublicationCreate(
+        title="paper", platform="openml", platform_identifier="p1", datasets=[]
+    )
+    items = [
+        ResourceWithRelations(
+            resource=_dataset(str(i)),
+            related_resources={"citations": [pub]},  # type: ignore[list-item]
+        )
+        for i, pub in enumerate([publication, publication.copy()])
+    ]
+    with Session(engine) as session:
+        assert BulkInserter(session, dataset_router).insert_all(items) == 2
+
+    with Session(engine) as session:
+        (citation,) = session.scalars(select(Publication)).all()
+        assert {d.platform_identifier for d in citation.datasets} == {"0", "1"}
+
+
+def test_update_existing(engine: Engine):
+    with Session(engine) as session:
+        BulkInserter(session, dataset_router).insert_all([_dataset("1", keywords=["a"])])
+        versions = {d.identifier: d.aiod_date_modified for d in session.scalars(select(Dataset))}
+
+    items = [_dataset("1", keywords=["a"]), _dataset("1", name="new name", keywords=["b"])]
+    with Session(engine) as session:
+        inserter = BulkInserter(session, dataset_router, update_existing=True)
+        inserter.insert_batch(items[:1])
+        assert inserter.n_updated == 0
+        dataset = session.get(Dataset, 1)
+        assert dataset is not None and dataset.aiod_date_modified == versions[1]
+
+        inserter.insert_batch(items[1:])
+        assert inserter.n_updated == 1
+        dataset = session.get(Dataset, 1)
+        assert dataset is not None and dataset.name == "new name"
+        assert [k.name for k in dataset.keywords] == ["b"]
+        assert dataset.aiod_date_modified > versions[1]
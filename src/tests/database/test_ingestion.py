@@ -0,0 +1,106 @@
+import threading
+import time
+from typing import Iterator
+
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, select
+
+from connectors import ResourceConnector
+from database.bulk_insert import BulkInserter
+from database.ingestion import IngestionScheduler
+from database.model.dataset.dataset import Dataset
+from database.model.platform.platform_names import PlatformName
+from database.model.sync_state import SyncState
+from tests.database.test_bulk_insert import _dataset
+
+
+class SlowConnector(ResourceConnector[Dataset]):
+    def __init__(self, platform: PlatformName, n: int, delay: float = 0, fail_after: int = -1):
+        self.platform = platform
+        self.n = n
+        self.delay = delay
+        self.fail_after = fail_after
+        self.n_consumed = 0
+
+    @property
+    def resource_class(self) -> type[Dataset]:
+        return Dataset
+
+    @property
+    def platform_name(self) -> PlatformName:
+        return self.platform
+
+    def fetch_all(self, limit: int | None = None) -> Iterator[Dataset]:
+        for i in range(self.n):
+            if i == self.fail_after:
+                raise RuntimeError("platform unavailable")
+            time.sleep(self.delay)
+            self.n_consumed += 1
+            yield _dataset(f"{self.platform.value}-{i}", platform=self.platform.value)
+
+
+def test_connectors_run_concurrently(engine: Engine):
+    connectors = [SlowConnector(platform, n=5, delay=0.05) for platform in list(PlatformName)[:3]]
+    start = time.monotonic()
+    reports = IngestionScheduler(engine, connectors, batch_size=2).run()
+    assert time.monotonic() - start < 0.5, "Expected the duration of the slowest connector"
+
+    assert [(r.n_fetched, r.n_inserted, r.n_failed) for r in reports] == [(5, 5, 0)] * 3
+    with Session(engine) as session:
+        assert len(session.scalars(select(Dataset)).all()) == 15
+        states = session.scalars(select(SyncState)).all()
+        assert all(state.watermark is not None for state in states)
+
+
+def test_backpressure(engine: Engine, monkeypatch):
+    connector = SlowConnector(PlatformName.openml, n=20)
+    may_write = threading.Event()
+    insert_batch = BulkInserter.insert_batch
+
+    def blocked_insert_batch(self, items):
+        may_write.wait()
+        return insert_batch(self, items)
+
+    monkeypatch.setattr(BulkInserter, "insert_batch", blocked_insert_batch)
+    scheduler = IngestionScheduler(engine, [connector], batch_size=1, queue_size=2)
+    thread = threading.Thread(target=scheduler.run)
+    thread.start()
+    time.sleep(0.2)
+    # One batch is being written, two are in the queue and one is waiting to be queued
+    assert connector.n_consumed <= 4
+    may_write.set()
+    thread.join()
+    assert connector.n_consumed == 20
+
+
+def test_fetch_error(engine: Engine):
+    connector = SlowConnector(PlatformName.openml, n=10, fail_after=5)
+    (report,) = IngestionScheduler(engine, [connector], batch_size=2).run()
+    assert report.fetch_error == "platform unavailable"
+    assert report.n_inserted == 5
+    with Session(engine) as session:
+        assert len(session.scalars(select(Dataset)).all()) == 5
+        state = session.get(SyncState, "openml/dataset")
+        assert state is not None
+        assert state.date_last_run is not None
+        assert state.watermark is None, "Not all changes have been fetched"
+
+
+class InvalidResourceConnector(SlowConnector):
+    """Yields a dataset citing a non-existing publication, which cannot be stored"""
+
+    def fetch_all(self, limit: int | None = None) -> Iterator[Dataset]:
+        for i, dataset in enumerate(super().fetch_all(limit)):
+            yield dataset.copy(update={"citations": [99]}) if i == 3 else dataset
+
+
+def test_failed_resource_keeps_watermark(engine: Engine):
+    connector = InvalidResourceConnector(PlatformName.openml, n=5)
+    (report,) = IngestionScheduler(engine, [connector], batch_size=2).run()
+    assert (report.n_inserted, report.n_failed) == (4, 1)
+    with Session(engine) as session:
+        state = session.get(SyncState, "openml/dataset")
+        assert state is not None
+        assert state.date_last_run is not None
+        assert state.watermark is None, "The failed resource should be fetched again"
+        assert state.resumption_token is None
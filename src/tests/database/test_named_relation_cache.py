@@ -0,0 +1,103 @@
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, select
+
+from database.model.general.keyword import Keyword
+from database.model.general.license import License
+from database import named_relation_cache
+from database.named_relation_cache import NamedRelationCache, _upsert
+from serialization import FindByNameDeserializer
+
+
+def _count_selects(engine: Engine) -> list[str]:
+    selects = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("SELECT"):
+            selects.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    return selects
+
+
+def test_deserialize_cached(engine: Engine):
+    with Session(engine) as session:
+        session.add(Keyword(name="existing"))
+        session.commit()
+
+    selects = _count_selects(engine)
+    with Session(engine) as session:
+        deserializer = FindByNameDeserializer(Keyword)
+        keywords = deserializer.deserialize(session, ["new", "existing", "new"])
+        assert isinstance(keywords, list)
+        assert [k.name for k in keywords] == ["existing", "new"]
+        n_selects = len(selects)
+        existing = deserializer.deserialize(session, ["existing"])
+        assert isinstance(existing, list)
+        assert existing[0] is keywords[0]
+        license_identifier = FindByNameDeserializer(License).deserialize(session, "mit")
+        assert FindByNameDeserializer(License).deserialize(session, "mit") == license_identifier
+        session.commit()
+    assert len(selects) == n_selects + 2, "Only the new license should be looked up"
+
+    with Session(engine) as session:
+        assert {k.name for k in session.scalars(select(Keyword))} == {"existing", "new"}
+        license_ = session.get(License, license_identifier)
+        assert license_ is not None
+        assert license_.name == "mit"
+
+
+def test_preload(engine: Engine):
+    with Session(engine) as session:
+        session.add_all([Keyword(name="a"), Keyword(name="b")])
+        session.commit()
+        cache = NamedRelationCache.of(session)
+        cache.preload(session, Keyword)
+        selects = _count_selects(engine)
+        assert set(cache.identifiers(session, Keyword, ["a", "b"])) == {"a", "b"}
+        assert selects == []
+
+
+def test_rollback_forgets_new_names(engine: Engine):
+    with Session(engine) as session:
+        cache = NamedRelationCache.of(session)
+        identifier = cache.identifiers(session, Keyword, ["a"])["a"]
+        session.rollback()
+        session.add(Keyword(name="b"))
+        session.commit()
+        keyword = session.get(Keyword, identifier)
+        assert keyword is not None
+        assert keyword.name == "b"
+        assert cache.identifiers(session, Keyword, ["a"])["a"] != identifier
+
+
+def test_upsert_existing_name(engine: Engine):
+    """A concurrent writer might insert the same name in the meantime"""
+    with Session(engine) as session:
+        session.add(Keyword(name="a"))
+        session.commit()
+        session.execute(_upsert(session, Keyword, ["a", "b"]))
+        session.commit()
+        assert sorted(session.scalars(select(Keyword.name))) == ["a", "b"]
+
+
+def test_name_inserted_by_other_writer(engine: Engine, monkeypatch):
+    """The first read does not see the name (as in the snapshot of a MySQL transaction)"""
+    with Session(engine) as session:
+        session.add(Keyword(name="a"))
+        session.commit()
+        identifier = session.scalars(select(Keyword.identifier)).one()
+        cache = NamedRelationCache.of(session)
+        select_ = cache._select
+        monkeypatch.setattr(
+            cache, "_select", lambda *args, lock=False: select_(*args) if lock else {}
+        )
+        assert cache.identifiers(session, Keyword, ["a"]) == {"a": identifier}
+
+
+def test_unresolved_name(engine: Engine, monkeypatch):
+    monkeypatch.setattr(named_relation_cache, "_upsert", lambda *args: text("SELECT 1"))
+    with Session(engine) as session:
+        with pytest.raises(ValueError, match="Could not find or insert the Keyword names a."):
+            NamedRelationCache.of(session).identifiers(session, Keyword, ["a"])
@@ -1,13 +1,19 @@
+import json
+
+import responses
 from sqlalchemy import delete
 from sqlalchemy.engine import Engine
 from sqlmodel import Session, select
 
-from connectors import example_connectors
+from connectors import dataset_connectors, example_connectors
 from database.model.dataset.dataset import Dataset
 from database.model.platform.platform import Platform
 from database.model.platform.platform_names import PlatformName
 from database.model.publication.publication import Publication
+from database.model.sync_state import SyncState
 from database.setup import populate_database
+from tests.connectors.openml.test_openml_dataset_connector import mock_openml_responses
+from tests.testutils.paths import path_test_resources
 
 OPENML_URL = "https://www.openml.org/api/v1/json"
 HUGGINGFACE_URL = "https://datasets-server.huggingface.co"
@@ -32,7 +38,94 @@ def test_example_happy_path(engine: Engine):
         assert {len(p.datasets) for p in publications} == {0, 1}
 
         (higgs_dataset,) = [d for d in datasets if d.name == "Higgs"]
-        assert (
-            higgs_dataset.citations[0].title == "Searching for exotic particles in high-energy "
-            "physics with deep learning"
+        # The citation is example publication 2, which is afterwards updated by the publication
+        # connector
+        (citation,) = higgs_dataset.citations
+        assert (citation.platform, citation.platform_identifier) == ("example", "2")
+        assert citation.title == "Quantum Computing Advances"
+
+
+def test_synchronize_incrementally(engine: Engine):
+    connector = dataset_connectors[PlatformName.openml]
+    with open(path_test_resources() / "connectors" / "openml" / "data_list.json", "r") as f:
+        data_list = json.load(f)
+    with responses.RequestsMock() as mocked_requests:
+        mocked_requests.add(
+            responses.GET, f"{OPENML_URL}/data/list/limit/10000/offset/0", json=data_list
         )
+        for i in range(2, 5):
+            mock_openml_responses(mocked_requests, str(i))
+        populate_database(engine, connectors=[connector], only_if_empty=False)
+
+    with Session(engine) as session:
+        state = session.get(SyncState, "openml/dataset")
+        assert state is not None
+        assert state.last_identifiers == ["4"]
+        assert state.watermark is not None
+        assert len(session.scalars(select(Dataset)).all()) == 3
+
+    data_list["data"]["dataset"].append({**data_list["data"]["dataset"][0], "did": 5})
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as mocked_requests:
+        mocked_requests.add(
+            responses.GET, f"{OPENML_URL}/data/list/limit/10000/offset/0", json=data_list
+        )
+        for i in range(2, 5):
+            mock_openml_responses(mocked_requests, str(i))
+        mocked_requests.add(
+            responses.GET,
+            f"{OPENML_URL}/data/5",
+            json={"error": {"message": "Unknown dataset"}},
+            status=412,
+        )
+        populate_database(engine, connectors=[connector], only_if_empty=False)
+        # Only the new dataset has been fetched
+        fetched = [call.request.url for call in mocked_requests.calls]
+        assert fetched[1:] == [f"{OPENML_URL}/data/5"]
+
+    with Session(engine) as session:
+        state = session.get(SyncState, "openml/dataset")
+        assert state is not None
+        assert state.last_identifiers == ["5"]
+        assert state.failed_identifiers == ["5"]
+
+
+def test_synchronize_retries_failed_datasets(engine: Engine):
+    connector = dataset_connectors[PlatformName.openml]
+    with open(path_test_resources() / "connectors" / "openml" / "data_list.json", "r") as f:
+        data_list = json.load(f)
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as mocked_requests:
+        mocked_requests.add(
+            responses.GET, f"{OPENML_URL}/data/list/limit/10000/offset/0", json=data_list
+        )
+        mocked_requests.add(
+            responses.GET, f"{OPENML_URL}/data/3", json={"error": {"message": "Busy"}}, status=503
+        )
+        for i in (2, 4):
+            mock_openml_responses(mocked_requests, str(i))
+        (report,) = populate_database(engine, connectors=[connector], only_if_empty=False)
+    assert report.n_fetch_failed == 1
+
+    with Session(engine) as session:
+        state = session.get(SyncState, "openml/dataset")
+        assert state is not None
+        assert state.last_identifiers == ["4"]
+        assert state.failed_identifiers == ["3"]
+        assert state.watermark is None
+        assert len(session.scalars(select(Dataset)).all()) == 2
+
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as mocked_requests:
+        mocked_requests.add(
+            responses.GET, f"{OPENML_URL}/data/list/limit/10000/offset/0", json=data_list
+        )
+        mock_openml_responses(mocked_requests, "3")
+        populate_database(engine, connectors=[connector], only_if_empty=False)
+        fetched = [call.request.url for call in mocked_requests.calls]
+        assert fetched[0] == f"{OPENML_URL}/data/3", "The failed dataset should be fetched again"
+
+    with Session(engine) as session:
+        state = session.get(SyncState, "openml/dataset")
+        assert state is not None
+        assert state.failed_identifiers == []
+        assert state.watermark is not None
+        datasets = session.scalars(select(Dataset)).all()
+        assert sorted(d.platform_identifier for d in datasets) == ["2", "3", "4"]
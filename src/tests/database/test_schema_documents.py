@@ -0,0 +1,168 @@
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from sqlalchemy import delete, event, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlmodel import Session, select
+from starlette.testclient import TestClient
+
+from authentication import keycloak_openid
+from database import schema_documents
+from database.model.dataset.dataset import Dataset
+from database.model.schema_document import SchemaDocument
+from tests.database.test_bulk_insert import _dataset, dataset_router
+from tests.testutils.example_instances import example_instances
+
+URL = "/datasets/v0"
+
+
+def _fill(engine: Engine, n: int):
+    with Session(engine) as session:
+        for instance in example_instances(dataset_router, n=n):
+            dataset_router.create_resource(session, instance)
+
+
+def _documents(engine: Engine) -> dict[tuple[str, int], str]:
+    with Session(engine) as session:
+        return {
+            (d.schema_name, d.identifier): d.content
+            for d in session.scalars(select(SchemaDocument))
+        }
+
+
+def _tamper(engine: Engine, schema: str, identifier: int):
+    with Session(engine) as session:
+        session.execute(
+            update(SchemaDocument)
+            .where(SchemaDocument.schema_name == schema, SchemaDocument.identifier == identifier)
+            .values(content='{"tampered": true}')
+        )
+        session.commit()
+
+
+def test_documents_are_materialized_on_read(client: TestClient, engine: Engine):
+    _fill(engine, n=3)
+    expected = client.get(f"{URL}?schema=dcat-ap").json()
+    assert len(expected) == 3
+    documents = _documents(engine)
+    assert sorted(documents) == [("dcat-ap", 1), ("dcat-ap", 2), ("dcat-ap", 3)]
+    assert json.loads(documents[("dcat-ap", 2)]) == expected[1]
+
+    _tamper(engine, "dcat-ap", 2)
+    response = client.get(f"{URL}?schema=dcat-ap")
+    assert response.json()[1] == {"tampered": True}, "The document should be read from the table"
+    assert client.get(f"{URL}/2?schema=dcat-ap").json() == {"tampered": True}
+    assert (
+        client.get(f"{URL}?schema=schema.org").json()[1]["name"]
+        == expected[1]["@graph"][0]["dct:title"]
+    )
+
+
+def test_documents_of_updated_resource_are_rendered_again(
+    client: TestClient, engine: Engine, mocked_privileged_token: Mock
+):
+    keycloak_openid.userinfo = mocked_privileged_token
+    body = json.loads(_dataset("1").json(exclude_none=True))
+    client.post(URL, json=body, headers={"Authorization": "Fake token"})
+    client.get(f"{URL}?schema=dcat-ap")
+    _tamper(engine, "dcat-ap", 1)
+
+    response = client.patch(
+        f"{URL}/1", json={"name": "new name"}, headers={"Authorization": "Fake token"}
+    )
+    assert response.status_code == 200, response.json()
+    (document,) = client.get(f"{URL}?schema=dcat-ap").json()
+    assert document["@graph"][0]["dct:title"] == "new name"
+
+    response = client.delete(f"{URL}/1", headers={"Authorization": "Fake token"})
+    assert response.status_code == 200, response.json()
+    assert _documents(engine) == {}
+
+
+def test_documents_without_row_version_are_materialized(client: TestClient, engine: Engine):
+    _fill(engine, n=2)
+    with Session(engine) as session:
+        session.execute(update(Dataset).values(aiod_date_modified=None))
+        session.commit()
+    expected = client.get(f"{URL}?schema=dcat-ap").json()
+    _tamper(engine, "dcat-ap", 2)
+    response = client.get(f"{URL}?schema=dcat-ap")
+    assert response.json()[0] == expected[0]
+    assert response.json()[1] == {"tampered": True}, "The document should not be rendered again"
+
+
+def test_failing_store_does_not_fail_read(
+    client: TestClient, engine: Engine, monkeypatch: pytest.MonkeyPatch
+):
+    _fill(engine, n=2)
+    expected = client.get(f"{URL}?schema=dcat-ap").json()
+    with Session(engine) as session:
+        session.execute(delete(SchemaDocument))
+        session.commit()
+
+    def fail(self):
+        raise OperationalError("INSERT", {}, Exception("database is read-only"))
+
+    monkeypatch.setattr(schema_documents.Session, "commit", fail)
+    response = client.get(f"{URL}?schema=dcat-ap")
+    monkeypatch.undo()
+    assert response.status_code == 200, response.json()
+    assert response.json() == expected
+    assert _documents(engine) == {}
+
+
+def test_materialized_documents_single_query(client: TestClient, engine: Engine):
+    _fill(engine, n=5)
+    client.get(f"{URL}?schema=schema.org")
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        response = client.get(f"{URL}?schema=schema.org")
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+    assert len(response.json()) == 5
+    assert len(statements) == 2, "One query for the datasets, one for the documents"
+
+
+def test_documents_stored_using_single_connection(client: TestClient, engine: Engine):
+    _fill(engine, n=2)
+    checkouts = []
+
+    def checkout(dbapi_connection, connection_record, connection_proxy):
+        checkouts.append(dbapi_connection)
+
+    event.listen(engine, "checkout", checkout)
+    try:
+        response = client.get(f"{URL}?schema=dcat-ap")
+    finally:
+        event.remove(engine, "checkout", checkout)
+    assert len(response.json()) == 2
+    assert len(_documents(engine)) == 2
+    assert len(checkouts) == 1, "Storing the documents should not need a second connection"
+
+
+def test_rebuild(engine: Engine):
+    _fill(engine, n=3)
+    with Session(engine) as session:
+        session.add(
+            SchemaDocument(
+                resource_type="dataset", schema_name="dcat-ap", identifier=99, content="{}"
+            )
+        )
+        session.commit()
+    assert schema_documents.rebuild(engine, dataset_router, batch_size=2) == 3
+    documents = _documents(engine)
+    assert len(documents) == 6
+    _tamper(engine, "dcat-ap", 1)
+    assert schema_documents.rebuild(engine, dataset_router, schemas=["dcat-ap"]) == 3
+    assert _documents(engine) == documents
+    with Session(engine) as session:
+        (dataset,) = session.scalars(select(Dataset).where(Dataset.identifier == 1)).all()
+        assert json.loads(documents[("schema.org", 1)])["name"] == dataset.name
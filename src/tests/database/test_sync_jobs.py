@@ -0,0 +1,129 @@
+import datetime
+import time
+
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, select
+
+import database.sync_jobs
+from database.model.dataset.dataset import Dataset
+from database.model.platform.platform_names import PlatformName
+from database.model.sync_job import SyncJob, SyncJobStatus
+from database.model.sync_state import SyncState
+from database.job_runner import JobRunner
+from database.sync_jobs import create_job, create_job_once
+from tests.database.test_ingestion import SlowConnector
+
+
+def _create_job(engine: Engine, connectors: list[str]) -> int:
+    job = create_job(engine, connectors)
+    assert job.identifier is not None
+    return job.identifier
+
+
+def _wait_for(engine: Engine, job_id: int, statuses: set[SyncJobStatus]) -> SyncJob:
+    for _ in range(100):
+        with Session(engine) as session:
+            job = session.get(SyncJob, job_id)
+            if job is not None and job.status in statuses:
+                return job
+        time.sleep(0.05)
+    raise TimeoutError(f"Job {job_id} did not reach {statuses}")
+
+
+def test_run_job_in_background(engine: Engine):
+    runner = JobRunner(engine, poll_interval_seconds=0.05)
+    runner.start()
+    try:
+        job_id = _create_job(engine, ["example/dataset", "example/publication"])
+        job = _wait_for(engine, job_id, {SyncJobStatus.succeeded, SyncJobStatus.failed})
+    finally:
+        runner.stop()
+    assert job.status == SyncJobStatus.succeeded
+    assert job.date_finished is not None
+    assert [p["connector"] for p in job.progress] == ["example/dataset", "example/publication"]
+    assert job.progress[0]["inserted"] == 2
+    with Session(engine) as session:
+        assert len(session.scalars(select(Dataset)).all()) == 2
+
+
+def test_cancel_running_job(engine: Engine, monkeypatch):
+    connector = SlowConnector(PlatformName.openml, n=1000, delay=0.01)
+    monkeypatch.setattr(
+        database.sync_jobs, "available_connectors", lambda: {"openml/dataset": connector}
+    )
+    runner = JobRunner(engine, poll_interval_seconds=0.05)
+    runner.start()
+    try:
+        job_id = _create_job(engine, ["openml/dataset"])
+        _wait_for(engine, job_id, {SyncJobStatus.running})
+        with Session(engine) as session:
+            job = session.get(SyncJob, job_id)
+            assert job is not None
+            job.cancel_requested = True
+            session.commit()
+        _wait_for(engine, job_id, {SyncJobStatus.cancelled})
+    finally:
+        runner.stop()
+    assert 0 < connector.n_consumed < 1000
+    with Session(engine) as session:
+        n_stored = len(session.scalars(select(Dataset)).all())
+        assert n_stored == connector.n_consumed, "The fetched resources should be stored"
+        state = session.get(SyncState, "openml/dataset")
+        assert state is not None
+        assert state.last_identifiers is not None
+        assert state.watermark is None
+
+
+def test_requeue_interrupted_job(engine: Engine):
+    heartbeat = datetime.datetime.utcnow() - datetime.timedelta(minutes=10)
+    with Session(engine) as session:
+        session.add(
+            SyncJob(
+                connectors=["example/dataset"],
+                status=SyncJobStatus.running,
+                date_heartbeat=heartbeat,
+            )
+        )
+        session.add(
+            SyncJob(
+                connectors=["example/dataset"],
+                status=SyncJobStatus.running,
+                date_heartbeat=datetime.datetime.utcnow(),
+            )
+        )
+        session.commit()
+    JobRunner(engine, stale_after_seconds=60)._requeue_stale_jobs()
+    with Session(engine) as session:
+        statuses = [job.status for job in session.scalars(select(SyncJob))]
+    assert statuses == [SyncJobStatus.queued, SyncJobStatus.running]
+
+
+def test_run_job_in_foreground(engine: Engine):
+    job_id = _create_job(engine, ["example/dataset"])
+    assert JobRunner(engine).run_job(job_id) == SyncJobStatus.succeeded
+    with Session(engine) as session:
+        job = session.get(SyncJob, job_id)
+        assert job is not None
+        assert job.status == SyncJobStatus.succeeded
+        assert len(session.scalars(select(Dataset)).all()) == 2
+
+
+def test_run_job_claimed_by_other_runner(engine: Engine):
+    job_id = _create_job(engine, ["example/dataset"])
+    assert JobRunner(engine)._claim_next_job() == job_id
+    assert JobRunner(engine).run_job(job_id) is None
+    with Session(engine) as session:
+        job = session.get(SyncJob, job_id)
+        assert job is not None
+        assert job.status == SyncJobStatus.running
+        assert len(session.scalars(select(Dataset)).all()) == 0
+
+
+def test_create_job_once(engine: Engine):
+    job = create_job_once(engine, "populate", ["example/dataset"])
+    assert job is not None and job.identifier is not None
+    assert create_job_once(engine, "populate", ["example/dataset"]) is None
+    assert create_job_once(engine, "other", ["example/dataset"]) is not None
+
+    assert JobRunner(engine).run_job(job.identifier) == SyncJobStatus.succeeded
+    assert create_job_once(engine, "populate", ["example/dataset"]) is not None
@@ -0,0 +1,156 @@
+import asyncio
+import inspect
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+from starlette.testclient import TestClient
+
+from authentication import keycloak_openid
+from database.model import AIAssetTable
+from database.model.dataset.dataset import Dataset
+from response_cache import RedisCacheBackend, response_cache
+from tests.testutils.fake_redis import FakeRedis
+from tests.testutils.test_resource import TestResource
+
+
+def test_endpoints_are_coroutines(client_test_resource_async: TestClient):
+    app = client_test_resource_async.app
+    routes = [r for r in app.routes if hasattr(r, "endpoint")]  # type: ignore[attr-defined]
+    assert len(routes) > 0
+    assert all(inspect.iscoroutinefunction(route.endpoint) for route in routes)
+
+
+def test_get(client_test_resource_async: TestClient, engine_test_resource_filled: Engine):
+    response = client_test_resource_async.get("/test_resources/v0/1")
+    assert response.status_code == 200, response.json()
+    assert response.json()["title"] == "A title"
+
+    response = client_test_resource_async.get("/test_resources/v0")
+    assert response.status_code == 200, response.json()
+    assert [r["title"] for r in response.json()] == ["A title"]
+
+    response = client_test_resource_async.get("/test_resources/v0/2")
+    assert response.status_code == 404
+
+
+def test_post_put_delete(
+    client_test_resource_async: TestClient,
+    engine_test_resource_filled: Engine,
+    mocked_privileged_token: Mock,
+):
+    keycloak_openid.userinfo = mocked_privileged_token
+    headers = {"Authorization": "Fake token"}
+
+    response = client_test_resource_async.post(
+        "/test_resources/v0", json={"title": "new"}, headers=headers
+    )
+    assert response.status_code == 200, response.json()
+    assert response.json() == {"identifier": 2}
+
+    response = client_test_resource_async.put(
+        "/test_resources/v0/2", json={"title": "changed"}, headers=headers
+    )
+    assert response.status_code == 200, response.json()
+    assert client_test_resource_async.get("/test_resources/v0/2").json()["title"] == "changed"
+
+    response = client_test_resource_async.delete("/test_resources/v0/2", headers=headers)
+    assert response.status_code == 200, response.json()
+    with Session(engine_test_resource_filled) as session:
+        assert session.get(TestResource, 2) is None
+
+
+def test_export(client_test_resource_async: TestClient, engine_test_resource: Engine):
+    with Session(engine_test_resource) as session:
+        session.add_all([AIAssetTable(type="test_resource") for _ in range(3)])
+        session.add_all([TestResource(title=f"title {i}") for i in range(3)])
+        session.commit()
+    response = client_test_resource_async.get("/test_resources/v0/export")
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["title"] for line in lines] == ["title 0", "title 1", "title 2"]
+
+
+def test_relationships_and_counts(client_async: TestClient, engine: Engine):
+    with Session(engine) as session:
+        session.add(AIAssetTable(type="dataset"))
+        session.add(
+            Dataset(
+                identifier=1,
+                name="Iris",
+                platform="openml",
+                platform_identifier="61",
+                description="Measurements of flowers.",
+                same_as="61",
+            )
+        )
+        session.commit()
+    response = client_async.get("/datasets/v0/1")
+    assert response.status_code == 200, response.json()
+    assert response.json()["name"] == "Iris"
+
+    response = client_async.get("/counts/v0")
+    assert response.status_code == 200, response.json()
+    assert response.json()["datasets"] == 1
+
+
+def test_bulk(
+    client_test_resource_async: TestClient,
+    engine_test_resource_filled: Engine,
+    mocked_privileged_token: Mock,
+):
+    keycloak_openid.userinfo = mocked_privileged_token
+    headers = {"Authorization": "Fake token"}
+    body: list[dict] = [{"title": "title", "platform": "example", "platform_identifier": "2"}]
+    response = client_test_resource_async.post(
+        "/test_resources/v0/bulk", json=body, headers=headers
+    )
+    assert response.status_code == 200, response.json()
+    assert response.json() == [{"identifier": 2}]
+
+    body = [{"identifier": 2, "title": "new", "platform": "example", "platform_identifier": "2"}]
+    response = client_test_resource_async.put("/test_resources/v0/bulk", json=body, headers=headers)
+    assert response.status_code == 200, response.json()
+    assert response.json() == [{"identifier": 2}]
+    assert client_test_resource_async.get("/test_resources/v0/2").json()["title"] == "new"
+
+
+class _LoopRecordingRedis(FakeRedis):
+    """Records for every request whether it was performed on the event loop"""
+
+    def __init__(self):
+        super().__init__()
+        self.on_event_loop: list[bool] = []
+
+    def hget(self, name: str, key: str) -> bytes | None:
+        self.on_event_loop.append(_on_event_loop())
+        return super().hget(name, key)
+
+    def hset(self, name: str, key: str, value: bytes) -> int:
+        self.on_event_loop.append(_on_event_loop())
+        return super().hset(name, key, value)
+
+
+def _on_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
+
+def test_redis_cache_not_on_event_loop(
+    client_test_resource_async: TestClient,
+    engine_test_resource_filled: Engine,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    redis = _LoopRecordingRedis()
+    monkeypatch.setattr(response_cache, "backend", RedisCacheBackend(redis))
+    for _ in range(2):
+        response = client_test_resource_async.get("/test_resources/v0/1")
+        assert response.status_code == 200, response.json()
+    assert response_cache.statistics()["hits"] == 1
+    assert redis.on_event_loop == [False, False, False]
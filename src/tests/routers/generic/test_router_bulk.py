@@ -0,0 +1,126 @@
+import json
+from unittest.mock import Mock
+
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, select
+from starlette.testclient import TestClient
+
+from authentication import keycloak_openid
+from database.model.dataset.dataset import Dataset
+from database.model.general.keyword import Keyword
+from tests.database.test_bulk_insert import _dataset
+
+HEADERS = {"Authorization": "Fake token"}
+
+
+def test_post_bulk(client_test_resource: TestClient, mocked_privileged_token: Mock):
+    keycloak_openid.userinfo = mocked_privileged_token
+    body = [
+        {"title": "title1", "platform": "example", "platform_identifier": "1"},
+        {"platform": "example", "platform_identifier": "2"},
+        {"title": "title1", "platform": "example", "platform_identifier": "3"},
+        {"title": "title4", "platform": "example", "platform_identifier": "1"},
+        {"title": "title5", "platform": "example", "platform_identifier": "5"},
+    ]
+    response = client_test_resource.post("/test_resources/v0/bulk", json=body, headers=HEADERS)
+    assert response.status_code == 200, response.json()
+    (first, missing_title, same_title, same_platform_identifier, last) = response.json()
+    assert first == {"identifier": 1}
+    assert missing_title["error"]["status_code"] == 422
+    assert missing_title["error"]["detail"][0]["loc"] == ["title"]
+    assert same_title == {
+        "error": {
+            "status_code": 409,
+            "detail": "There already exists a test_resource with the same title, with "
+            "identifier=1.",
+        }
+    }
+    assert same_platform_identifier["error"]["status_code"] == 409
+    assert last == {"identifier": 2}
+
+    response = client_test_resource.get("/test_resources/v0")
+    assert {r["title"] for r in response.json()} == {"title1", "title5"}
+
+
+def test_post_bulk_ndjson(client_test_resource: TestClient, mocked_privileged_token: Mock):
+    keycloak_openid.userinfo = mocked_privileged_token
+    body = "\n".join(
+        json.dumps({"title": f"title{i}", "platform": "example", "platform_identifier": str(i)})
+        for i in range(3)
+    )
+    response = client_test_resource.post(
+        "/test_resources/v0/bulk",
+        content=body,
+        headers={**HEADERS, "Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200, response.json()
+    assert response.json() == [{"identifier": 1}, {"identifier": 2}, {"identifier": 3}]
+
+
+def test_post_bulk_invalid_body(client_test_resource: TestClient, mocked_privileged_token: Mock):
+    keycloak_openid.userinfo = mocked_privileged_token
+    response = client_test_resource.post(
+        "/test_resources/v0/bulk", json={"title": "title"}, headers=HEADERS
+    )
+    assert response.status_code == 400
+    assert "JSON array" in response.json()["detail"]
+
+
+def test_post_bulk_unauthorized(client_test_resource: TestClient, mocked_token: Mock):
+    keycloak_openid.userinfo = mocked_token
+    body = [{"title": "title", "platform": "example", "platform_identifier": "1"}]
+    response = client_test_resource.post("/test_resources/v0/bulk", json=body, headers=HEADERS)
+    assert response.status_code == 403
+
+
+def test_post_bulk_relations(client: TestClient, engine: Engine, mocked_privileged_token: Mock):
+    keycloak_openid.userinfo = mocked_privileged_token
+    body = [
+        json.loads(
+            _dataset(
+                str(i), keywords=["vision", f"keyword{i}"], citations=[99] if i == 2 else []
+            ).json(exclude_none=True)
+        )
+        for i in range(3)
+    ]
+    response = client.post("/datasets/v0/bulk", json=body, headers=HEADERS)
+    assert response.status_code == 200, response.json()
+    assert response.json()[:2] == [{"identifier": 1}, {"identifier": 2}]
+    assert response.json()[2] == {
+        "error": {"status_code": 400, "detail": "Nested object with identifiers 99 not found"}
+    }
+    with Session(engine) as session:
+        datasets = session.scalars(select(Dataset)).all()
+        assert {d.name: {k.name for k in d.keywords} for d in datasets} == {
+            "dataset 0": {"vision", "keyword0"},
+            "dataset 1": {"vision", "keyword1"},
+        }
+        assert len(session.scalars(select(Keyword)).all()) == 4
+
+
+def test_put_bulk(
+    client_test_resource: TestClient,
+    engine_test_resource_filled: Engine,
+    mocked_privileged_token: Mock,
+):
+    keycloak_openid.userinfo = mocked_privileged_token
+    body = [
+        {"identifier": 1, "title": "new title", "platform": "example", "platform_identifier": "1"},
+        {"identifier": 2, "title": "title", "platform": "example", "platform_identifier": "2"},
+        {"title": "title", "platform": "example", "platform_identifier": "3"},
+    ]
+    response = client_test_resource.put("/test_resources/v0/bulk", json=body, headers=HEADERS)
+    assert response.status_code == 200, response.json()
+    updated, not_found, without_identifier = response.json()
+    assert updated == {"identifier": 1}
+    assert not_found == {
+        "identifier": 2,
+        "error": {
+            "status_code": 404,
+            "detail": "Test_resource '2' not found in the database.",
+        },
+    }
+    assert without_identifier["error"]["status_code"] == 422
+
+    response = client_test_resource.get("/test_resources/v0/1")
+    assert response.json()["title"] == "new title"
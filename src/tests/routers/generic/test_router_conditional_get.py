@@ -0,0 +1,107 @@
+import datetime
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy.dialects import mysql, sqlite
+from sqlalchemy.engine import Dialect, Engine
+from sqlalchemy.schema import CreateColumn
+from sqlmodel import Session
+from starlette.testclient import TestClient
+
+from authentication import keycloak_openid
+from tests.testutils.test_resource import TestResource
+
+
+def test_etag_and_last_modified(
+    client_test_resource: TestClient, engine_test_resource_filled: Engine
+):
+    response = client_test_resource.get("/test_resources/v0/1")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert etag.startswith('"1-')
+    last_modified = response.headers["last-modified"]
+
+    response = client_test_resource.get(
+        "/test_resources/v0/1", headers={"If-None-Match": f'"other", {etag}'}
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+    response = client_test_resource.get(
+        "/test_resources/v0/1", headers={"If-Modified-Since": last_modified}
+    )
+    assert response.status_code == 304
+
+    response = client_test_resource.get(
+        "/platforms/example/test_resources/v0/1", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+
+
+def test_modified(
+    client_test_resource: TestClient,
+    engine_test_resource_filled: Engine,
+    mocked_privileged_token: Mock,
+):
+    keycloak_openid.userinfo = mocked_privileged_token
+    etag = client_test_resource.get("/test_resources/v0/1").headers["etag"]
+
+    response = client_test_resource.put(
+        "/test_resources/v0/1",
+        json={"title": "new title", "platform": "example", "platform_identifier": "1"},
+        headers={"Authorization": "Fake token"},
+    )
+    assert response.status_code == 200, response.json()
+
+    response = client_test_resource.get("/test_resources/v0/1", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["title"] == "new title"
+    assert response.headers["etag"] != etag
+
+
+def test_modified_since(client_test_resource: TestClient, engine_test_resource_filled: Engine):
+    with Session(engine_test_resource_filled) as session:
+        resource = session.get(TestResource, 1)
+        assert resource is not None
+        resource.aiod_date_modified = datetime.datetime(2023, 5, 1, 12)
+        session.commit()
+
+    response = client_test_resource.get("/test_resources/v0/1")
+    assert response.headers["last-modified"] == "Mon, 01 May 2023 12:00:00 GMT"
+    for if_modified_since, expected_status in [
+        ("Mon, 01 May 2023 11:59:59 GMT", 200),
+        ("Mon, 01 May 2023 12:00:00 GMT", 304),
+        ("invalid", 200),
+    ]:
+        response = client_test_resource.get(
+            "/test_resources/v0/1", headers={"If-Modified-Since": if_modified_since}
+        )
+        assert response.status_code == expected_status
+
+
+def test_list_weak_etag(client_test_resource: TestClient, engine_test_resource_filled: Engine):
+    response = client_test_resource.get("/test_resources/v0")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert etag.startswith('W/"')
+
+    response = client_test_resource.get("/test_resources/v0", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    with Session(engine_test_resource_filled) as session:
+        session.add(TestResource(title="another", platform="example", platform_identifier="2"))
+        session.commit()
+    response = client_test_resource.get("/test_resources/v0", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+    assert response.headers["etag"] != etag
+
+
+@pytest.mark.parametrize(
+    "dialect,expected",
+    [(mysql.dialect(), "DATETIME(6)"), (sqlite.dialect(), "DATETIME")],
+)
+def test_row_version_column_type(dialect: Dialect, expected: str):
+    column = TestResource.__table__.c.aiod_date_modified  # type: ignore[attr-defined]
+    assert str(CreateColumn(column).compile(dialect=dialect)) == f"aiod_date_modified {expected}"
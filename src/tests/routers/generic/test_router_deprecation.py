@@ -6,7 +6,7 @@ from fastapi import FastAPI
 from sqlalchemy.engine import Engine
 from starlette.testclient import TestClient
 
-from tests.testutils.test_resource import TestResource, RouterTestResource
+from tests.testutils.test_resource import TestResourceBase, RouterTestResource
 from authentication import keycloak_openid
 
 
@@ -26,6 +26,7 @@ class DeprecatedRouter(RouterTestResource):
     "verb,url",
     [
         ("get", "/test_resources/v1/"),
+        ("get", "/test_resources/v1/export"),
         ("get", "/platforms/example/test_resources/v1"),
         ("get", "/test_resources/v1/1"),
         ("get", "/platforms/example/test_resources/v1/1"),
@@ -44,7 +45,7 @@ def test_deprecated_router(
 
     kwargs = {}
     if verb in ("post", "put"):
-        kwargs["json"] = TestResource(
+        kwargs["json"] = TestResourceBase(
             title="Another title", platform="example", platform_identifier="2"
         ).dict()
 
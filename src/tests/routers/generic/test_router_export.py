@@ -0,0 +1,59 @@
+import json
+
+from sqlalchemy.future import Engine
+from sqlmodel import Session
+from starlette.testclient import TestClient
+
+from database.model import AIAssetTable
+from tests.testutils.test_resource import TestResource, RouterTestResource
+
+
+def test_export_happy_path(client_test_resource: TestClient, engine_test_resource: Engine):
+    with Session(engine_test_resource) as session:
+        session.add_all([AIAssetTable(type="test_resource") for _ in range(3)])
+        session.add_all(
+            [
+                TestResource(title="title 1", platform="example", platform_identifier="1"),
+                TestResource(title="title 2", platform="openml", platform_identifier="1"),
+                TestResource(title="title 3", platform="example", platform_identifier="2"),
+            ]
+        )
+        session.commit()
+    response = client_test_resource.get("/test_resources/v0/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["title"] for line in lines] == ["title 1", "title 2", "title 3"]
+    assert "deprecated" not in response.headers
+
+    response = client_test_resource.get("/test_resources/v0/export", params={"platform": "example"})
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["identifier"] for line in lines] == [1, 3]
+
+
+def test_export_multiple_batches(engine_test_resource: Engine):
+    with Session(engine_test_resource) as session:
+        session.add_all([AIAssetTable(type="test_resource") for _ in range(5)])
+        session.add_all([TestResource(title=f"title {i}") for i in range(5)])
+        session.commit()
+    lines = RouterTestResource().export_resources(
+        engine=engine_test_resource, schema="aiod", batch_size=2
+    )
+    assert [json.loads(line)["title"] for line in b"".join(lines).splitlines()] == [
+        f"title {i}" for i in range(5)
+    ]
+
+
+def test_export_invalid_filters(client_test_resource: TestClient, engine_test_resource: Engine):
+    response = client_test_resource.get("/test_resources/v0/export", params={"platform": "other"})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "platform 'other' not recognized."
+
+    response = client_test_resource.get(
+        "/test_resources/v0/export", params={"modified_since": "2023-01-01T00:00:00"}
+    )
+    assert response.status_code == 400
+    assert (
+        response.json()["detail"] == "The test_resources cannot be filtered on modification date."
+    )
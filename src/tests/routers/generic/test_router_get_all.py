@@ -1,3 +1,7 @@
+import base64
+import json
+
+import pytest
 from sqlalchemy.future import Engine
 from sqlmodel import Session
 from starlette.testclient import TestClient
@@ -28,3 +32,82 @@ def test_get_all_happy_path(client_test_resource: TestClient, engine_test_resour
     assert response_2["identifier"] == 2
     assert response_2["title"] == "My second test resource"
     assert "deprecated" not in response.headers
+
+
+def test_get_all_cursor(client_test_resource: TestClient, engine_test_resource: Engine):
+    with Session(engine_test_resource) as session:
+        session.add_all([AIAssetTable(type="test_resource") for _ in range(5)])
+        session.add_all([TestResource(title=f"title {i}") for i in range(5)])
+        session.commit()
+
+    response = client_test_resource.get("/test_resources/v0", params={"limit": 2})
+    assert response.status_code == 200
+    assert [r["identifier"] for r in response.json()] == [1, 2]
+    cursor = response.headers["next-cursor"]
+
+    response = client_test_resource.get("/test_resources/v0", params={"limit": 2, "cursor": cursor})
+    assert response.status_code == 200
+    assert [r["identifier"] for r in response.json()] == [3, 4]
+    cursor = response.headers["next-cursor"]
+
+    response = client_test_resource.get("/test_resources/v0", params={"limit": 2, "cursor": cursor})
+    assert response.status_code == 200
+    assert [r["identifier"] for r in response.json()] == [5]
+    assert "next-cursor" not in response.headers
+
+
+def test_get_all_invalid_cursor(client_test_resource: TestClient, engine_test_resource: Engine):
+    response = client_test_resource.get("/test_resources/v0", params={"cursor": "invalid"})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor 'invalid'."
+
+    response = client_test_resource.get(
+        "/test_resources/v0", params={"cursor": "eyJpZGVudGlmaWVyIjogMX0=", "offset": 1}
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Use either an offset or a cursor, not both."
+
+
+@pytest.mark.parametrize("values", [{"identifier": "1"}, {"identifier": 1.5}, {"identifier": True}])
+def test_get_all_cursor_invalid_value(
+    client_test_resource: TestClient, engine_test_resource: Engine, values: dict
+):
+    cursor = base64.urlsafe_b64encode(json.dumps(values).encode("utf-8")).decode("ascii")
+    response = client_test_resource.get("/test_resources/v0", params={"cursor": cursor})
+    assert response.status_code == 400, response.json()
+    assert response.json()["detail"] == f"Invalid cursor '{cursor}'."
+
+
+def test_get_all_filter_and_sort(client_test_resource: TestClient, engine_test_resource: Engine):
+    with Session(engine_test_resource) as session:
+        session.add_all([AIAssetTable(type="test_resource") for _ in range(3)])
+        session.add_all([TestResource(title=title) for title in ("b", "c", "a")])
+        session.commit()
+
+    response = client_test_resource.get("/test_resources/v0", params={"title": "c"})
+    assert response.status_code == 200, response.json()
+    assert [r["identifier"] for r in response.json()] == [2]
+
+    response = client_test_resource.get("/test_resources/v0", params={"sort": "title"})
+    assert response.status_code == 200, response.json()
+    assert [r["title"] for r in response.json()] == ["a", "b", "c"]
+
+    response = client_test_resource.get("/test_resources/v0", params={"sort": "-title", "limit": 2})
+    assert response.status_code == 200, response.json()
+    assert [r["title"] for r in response.json()] == ["c", "b"]
+    assert "next-cursor" not in response.headers
+
+
+def test_get_all_invalid_sort(client_test_resource: TestClient, engine_test_resource: Engine):
+    response = client_test_resource.get("/test_resources/v0", params={"sort": "platform"})
+    assert response.status_code == 400
+    assert response.json()["detail"] == (
+        "Invalid sort 'platform'. The test_resources can be sorted on identifier, title, "
+        "optionally prefixed by '-' for descending order."
+    )
+
+    response = client_test_resource.get(
+        "/test_resources/v0", params={"sort": "title", "cursor": "eyJpZGVudGlmaWVyIjogMX0="}
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Sorting is not supported in combination with a cursor."
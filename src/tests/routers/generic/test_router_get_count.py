@@ -2,7 +2,10 @@ from sqlalchemy.future import Engine
 from sqlmodel import Session
 from starlette.testclient import TestClient
 
+from authentication import keycloak_openid
 from database.model import AIAssetTable
+from database.model.dataset.dataset import Dataset
+from database.model.platform.platform_names import PlatformName
 from tests.testutils.test_resource import TestResource
 
 
@@ -23,3 +26,71 @@ def test_get_count_happy_path(client_test_resource: TestClient, engine_test_reso
 
     assert response_json == 2
     assert "deprecated" not in response.headers
+
+
+def test_get_count_platform(client_test_resource: TestClient, engine_test_resource: Engine):
+    with Session(engine_test_resource) as session:
+        session.add_all(
+            [
+                AIAssetTable(type="test_resource"),
+                AIAssetTable(type="test_resource"),
+                TestResource(title="title 1", platform="example", platform_identifier="1"),
+                TestResource(title="title 2", platform="openml", platform_identifier="1"),
+            ]
+        )
+        session.commit()
+    response = client_test_resource.get("/counts/test_resources/v0", params={"platform": "openml"})
+    assert response.status_code == 200
+    assert response.json() == 1
+
+
+def test_get_count_invalidated(
+    client_test_resource: TestClient, engine_test_resource_filled: Engine, mocked_privileged_token
+):
+    keycloak_openid.userinfo = mocked_privileged_token
+    response = client_test_resource.get("/counts/test_resources/v0")
+    assert response.json() == 1
+
+    response = client_test_resource.post(
+        "/test_resources/v0", json={"title": "title 2"}, headers={"Authorization": "Fake token"}
+    )
+    assert response.status_code == 200
+    response = client_test_resource.get("/counts/test_resources/v0")
+    assert response.json() == 2
+
+    response = client_test_resource.delete(
+        "/test_resources/v0/1", headers={"Authorization": "Fake token"}
+    )
+    assert response.status_code == 200
+    response = client_test_resource.get("/counts/test_resources/v0")
+    assert response.json() == 1
+
+
+def test_get_all_counts(client: TestClient, engine: Engine):
+    with Session(engine) as session:
+        session.add_all(
+            [
+                AIAssetTable(type="dataset"),
+                Dataset(
+                    identifier=1,
+                    name="dataset",
+                    platform="example",
+                    platform_identifier="1",
+                    description="description",
+                    same_as="1",
+                ),
+            ]
+        )
+        session.commit()
+    response = client.get("/counts/v0")
+    assert response.status_code == 200
+    response_json = response.json()
+    assert response_json["datasets"] == 1
+    assert response_json["publications"] == 0
+    assert response_json["platforms"] == len(PlatformName)
+
+    response = client.get("/counts/v0", params={"platform": "openml"})
+    assert response.status_code == 200
+    response_json = response.json()
+    assert response_json["datasets"] == 0
+    assert "platforms" not in response_json
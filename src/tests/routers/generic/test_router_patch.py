@@ -0,0 +1,93 @@
+import json
+from unittest.mock import Mock
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+from starlette.testclient import TestClient
+
+from authentication import keycloak_openid
+from database.model.dataset.dataset import Dataset
+from tests.database.test_bulk_insert import _dataset
+
+HEADERS = {"Authorization": "Fake token"}
+
+
+def test_patch(
+    client_test_resource: TestClient,
+    engine_test_resource_filled: Engine,
+    mocked_privileged_token: Mock,
+):
+    keycloak_openid.userinfo = mocked_privileged_token
+    etag = client_test_resource.get("/test_resources/v0/1").headers["ETag"]
+    response = client_test_resource.patch(
+        "/test_resources/v0/1", json={"title": "new title"}, headers=HEADERS
+    )
+    assert response.status_code == 200, response.json()
+    response = client_test_resource.get("/test_resources/v0/1")
+    assert response.json()["title"] == "new title"
+    assert response.json()["platform_identifier"] == "1"
+    assert response.headers["ETag"] != etag
+
+
+def test_patch_unchanged(
+    client_test_resource: TestClient,
+    engine_test_resource_filled: Engine,
+    mocked_privileged_token: Mock,
+):
+    keycloak_openid.userinfo = mocked_privileged_token
+    etag = client_test_resource.get("/test_resources/v0/1").headers["ETag"]
+    response = client_test_resource.patch(
+        "/test_resources/v0/1", json={"title": "A title"}, headers=HEADERS
+    )
+    assert response.status_code == 200, response.json()
+    assert client_test_resource.get("/test_resources/v0/1").headers["ETag"] == etag
+
+
+def test_patch_invalid(
+    client_test_resource: TestClient,
+    engine_test_resource_filled: Engine,
+    mocked_privileged_token: Mock,
+):
+    keycloak_openid.userinfo = mocked_privileged_token
+    response = client_test_resource.patch(
+        "/test_resources/v0/1", json={"title": "a" * 251}, headers=HEADERS
+    )
+    assert response.status_code == 422
+    response = client_test_resource.patch(
+        "/test_resources/v0/2", json={"title": "title"}, headers=HEADERS
+    )
+    assert response.status_code == 404
+
+
+def test_patch_relationships(client: TestClient, engine: Engine, mocked_privileged_token: Mock):
+    keycloak_openid.userinfo = mocked_privileged_token
+    body = json.loads(_dataset("1", keywords=["a", "b"]).json(exclude_none=True))
+    response = client.post("/datasets/v0", json=body, headers=HEADERS)
+    assert response.status_code == 200, response.json()
+
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        response = client.patch(
+            "/datasets/v0/1", json={"name": "new name", "keywords": ["b", "c"]}, headers=HEADERS
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+    assert response.status_code == 200, response.json()
+    link_table_inserts = [s for s in statements if s.startswith("INSERT INTO dataset_keyword")]
+    link_table_deletes = [s for s in statements if s.startswith("DELETE FROM dataset_keyword")]
+    assert len(link_table_inserts) == 1, "Only the new keyword should be linked"
+    assert len(link_table_deletes) == 1, "Only the removed keyword should be unlinked"
+    assert not any("dataset_distribution" in s for s in statements if not s.startswith("SELECT"))
+
+    with Session(engine) as session:
+        dataset = session.get(Dataset, 1)
+        assert dataset is not None
+        assert dataset.name == "new name"
+        assert dataset.same_as == "https://example.com/1"
+        assert sorted(k.name for k in dataset.keywords) == ["b", "c"]
@@ -1,3 +1,6 @@
+import base64
+import json
+
 from sqlalchemy.future import Engine
 from sqlmodel import Session
 from starlette.testclient import TestClient
@@ -32,3 +35,52 @@ def test_get_all_happy_path(client_test_resource: TestClient, engine_test_resour
     assert response_2["identifier"] == 2
     assert response_2["title"] == "My second test resource"
     assert "deprecated" not in response.headers
+
+
+def test_get_all_cursor(client_test_resource: TestClient, engine_test_resource: Engine):
+    with Session(engine_test_resource) as session:
+        session.add_all([AIAssetTable(type="test_resource") for _ in range(4)])
+        session.add_all(
+            [
+                TestResource(title=f"title {i}", platform="example", platform_identifier=str(i))
+                for i in range(3)
+            ]
+            + [TestResource(title="title openml", platform="openml", platform_identifier="0")]
+        )
+        session.commit()
+
+    response = client_test_resource.get("/platforms/example/test_resources/v0?limit=2")
+    assert response.status_code == 200
+    assert [r["platform_identifier"] for r in response.json()] == ["0", "1"]
+    cursor = response.headers["next-cursor"]
+
+    response = client_test_resource.get(
+        "/platforms/example/test_resources/v0", params={"limit": 2, "cursor": cursor}
+    )
+    assert response.status_code == 200
+    assert [r["platform_identifier"] for r in response.json()] == ["2"]
+    assert "next-cursor" not in response.headers
+
+    response = client_test_resource.get(
+        "/platforms/openml/test_resources/v0", params={"limit": 2, "cursor": cursor}
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "This cursor belongs to a different platform."
+
+
+def test_get_all_cursor_invalid_value(
+    client_test_resource: TestClient, engine_test_resource: Engine
+):
+    values = {"platform": "example", "platform_identifier": 1}
+    cursor = base64.urlsafe_b64encode(json.dumps(values).encode("utf-8")).decode("ascii")
+    response = client_test_resource.get(
+        "/platforms/example/test_resources/v0", params={"cursor": cursor}
+    )
+    assert response.status_code == 400, response.json()
+    assert response.json()["detail"] == f"Invalid cursor '{cursor}'."
+
+
+def test_get_all_unknown_platform(client_test_resource: TestClient, engine_test_resource: Engine):
+    response = client_test_resource.get("/platforms/unknown/test_resources/v0")
+    assert response.status_code == 400, response.json()
+    assert response.json()["detail"] == "platform 'unknown' not recognized."
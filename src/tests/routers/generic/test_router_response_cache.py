@@ -0,0 +1,79 @@
+from unittest.mock import Mock
+
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+from starlette.testclient import TestClient
+
+from authentication import keycloak_openid
+from database.model.ai_asset_table import AIAssetTable
+from database.model.dataset.dataset import Dataset
+from response_cache import response_cache
+
+
+def test_cached(client_test_resource: TestClient, engine_test_resource_filled: Engine):
+    response = client_test_resource.get("/test_resources/v0/1")
+    assert response.status_code == 200
+    assert response.json()["title"] == "A title"
+    assert response_cache.statistics()["misses"] == 1
+
+    cached_response = client_test_resource.get("/test_resources/v0/1")
+    assert cached_response.status_code == 200
+    assert cached_response.content == response.content
+    assert cached_response.headers["etag"] == response.headers["etag"]
+    assert response_cache.statistics()["hits"] == 1
+
+    client_test_resource.get("/platforms/example/test_resources/v0/1")
+    assert response_cache.statistics()["hits"] == 2
+
+
+def test_statistics(client: TestClient):
+    response_cache.get("dataset", 1, "aiod", "v0/1")
+    response = client.get("/monitoring/cache/v0")
+    assert response.status_code == 200
+    assert response.json() == {"backend": "LRUCacheBackend", "hits": 0, "misses": 1}
+
+
+def test_invalidated_on_change(
+    client_test_resource: TestClient,
+    engine_test_resource_filled: Engine,
+    mocked_privileged_token: Mock,
+):
+    keycloak_openid.userinfo = mocked_privileged_token
+    client_test_resource.get("/test_resources/v0/1")
+
+    response = client_test_resource.put(
+        "/test_resources/v0/1",
+        json={"title": "new title", "platform": "example", "platform_identifier": "1"},
+        headers={"Authorization": "Fake token"},
+    )
+    assert response.status_code == 200, response.json()
+    response = client_test_resource.get("/test_resources/v0/1")
+    assert response.json()["title"] == "new title"
+    assert response_cache.statistics()["hits"] == 0
+
+    response = client_test_resource.delete(
+        "/test_resources/v0/1", headers={"Authorization": "Fake token"}
+    )
+    assert response.status_code == 200, response.json()
+    response = client_test_resource.get("/test_resources/v0/1")
+    assert response.status_code == 404
+
+
+def test_invalidated_on_related_change(
+    client: TestClient, engine: Engine, mocked_privileged_token: Mock
+):
+    keycloak_openid.userinfo = mocked_privileged_token
+    with Session(engine) as session:
+        dataset = Dataset(identifier=1, name="Cited", description="", same_as="")
+        session.add_all([AIAssetTable(type="dataset"), dataset])
+        session.commit()
+    client.get("/datasets/v0/1")
+    client.get("/datasets/v0/1")
+    assert response_cache.statistics()["hits"] == 1
+
+    body = {"title": "A publication", "datasets": [1]}
+    response = client.post("/publications/v0", json=body, headers={"Authorization": "Fake token"})
+    assert response.status_code == 200, response.json()
+    response = client.get("/datasets/v0/1")
+    assert response.json()["citations"] == [2]
+    assert response_cache.statistics()["hits"] == 1
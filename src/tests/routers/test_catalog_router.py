@@ -0,0 +1,76 @@
+import json
+
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+from starlette.testclient import TestClient
+
+import routers
+from tests.database.test_bulk_insert import _dataset, dataset_router
+
+
+def _fill(engine: Engine, n: int):
+    with Session(engine) as session:
+        for i in range(n):
+            dataset = _dataset(str(i), creator="Jane Doe", spatial_coverage="Europe")
+            dataset_router.create_resource(session, dataset)
+
+
+def _nodes(graph: list[dict], type_: str) -> list[dict]:
+    return [node for node in graph if node["@type"] == type_]
+
+
+def test_catalog_dcat_ap(client: TestClient, engine: Engine):
+    _fill(engine, n=5)
+    response = client.get("/catalog/dcat-ap")
+    assert response.status_code == 200, response.json()
+    assert response.headers["Content-Type"] == "application/ld+json"
+    document = response.json()
+    assert set(document.keys()) == {"@context", "@graph"}
+    graph = document["@graph"]
+    (catalog,) = _nodes(graph, "dcat:Catalog")
+    assert catalog["dcat:dataset"] == [{"@id": str(i)} for i in range(1, 6)]
+    assert [node["@id"] for node in _nodes(graph, "dcat:Dataset")] == ["1", "2", "3", "4", "5"]
+    (creator,) = _nodes(graph, "vcard:Individual")
+    assert creator["vcard:fn"] == "Jane Doe"
+    assert len(_nodes(graph, "dct:Location")) == 1
+    for dataset in _nodes(graph, "dcat:Dataset"):
+        assert "@context" not in dataset
+        assert dataset["dcat:creator"] == [{"@id": creator["@id"]}]
+
+
+def test_catalog_dcat_ap_in_batches(engine: Engine):
+    _fill(engine, n=5)
+    chunks = list(routers.catalog_router.catalog_dcat_ap(engine, batch_size=2))
+    assert len(chunks) == 10, "Opening, catalog, 3 batches of ids, catalog end, 3 batches, end"
+    graph = json.loads(b"".join(chunks))["@graph"]
+    (catalog,) = _nodes(graph, "dcat:Catalog")
+    assert graph[0] == catalog, "The catalog should be written before the datasets"
+    assert [ref["@id"] for ref in catalog["dcat:dataset"]] == ["1", "2", "3", "4", "5"]
+    assert [node["@id"] for node in _nodes(graph, "dcat:Dataset")] == ["1", "2", "3", "4", "5"]
+    assert len(_nodes(graph, "vcard:Individual")) == 1
+
+
+def test_catalog_dcat_ap_bounded_deduplication(engine: Engine):
+    with Session(engine) as session:
+        for i, creator in enumerate(["Jane Doe", "John Doe", "Jane Doe"]):
+            dataset_router.create_resource(session, _dataset(str(i), creator=creator))
+
+    def n_creators(**kwargs) -> int:
+        chunks = routers.catalog_router.catalog_dcat_ap(engine, **kwargs)
+        return len(_nodes(json.loads(b"".join(chunks))["@graph"], "vcard:Individual"))
+
+    assert n_creators() == 2
+    assert n_creators(max_shared_ids=1) == 3, "Jane Doe should be forgotten and written again"
+
+
+def test_catalog_dcat_ap_empty(client: TestClient, engine: Engine):
+    document = client.get("/catalog/dcat-ap").json()
+    assert document["@graph"] == [
+        {
+            "@id": "catalog",
+            "@type": "dcat:Catalog",
+            "dct:title": "AIoD Metadata Catalogue",
+            "dcat:dataset": [],
+        }
+    ]
+    assert client.get("/catalog/dcat-ap?platform=unknown").status_code == 400
@@ -0,0 +1,55 @@
+import datetime
+import decimal
+import enum
+import json
+
+from pydantic import BaseModel, Field
+
+from routers.json_response import ORJSONResponse, dumps
+
+
+class Color(str, enum.Enum):
+    red = "red"
+
+
+class Nested(BaseModel):
+    at: datetime.datetime
+    color: Color
+    comment: str | None = None
+
+
+class Model(BaseModel):
+    identifier: int = Field(alias="@id")
+    price: decimal.Decimal
+    nested: list[Nested]
+    comment: str | None = None
+
+
+def _model() -> Model:
+    nested = Nested(at=datetime.datetime(2023, 1, 2, 3, 4, 5, 6), color=Color.red)
+    return Model(**{"@id": 1}, price=decimal.Decimal("2.5"), nested=[nested])
+
+
+def test_dumps():
+    assert json.loads(dumps([_model(), {"key": None}])) == [
+        {
+            "@id": 1,
+            "price": 2.5,
+            "nested": [{"at": "2023-01-02T03:04:05.000006", "color": "red"}],
+        },
+        {"key": None},
+    ]
+
+
+def test_dumps_decimal_like_pydantic():
+    values = [decimal.Decimal("5"), decimal.Decimal("5.0"), decimal.Decimal("1E+2")]
+    assert dumps(values) == b"[5,5.0,100]"
+
+
+def test_response_including_none():
+    response = ORJSONResponse(_model(), exclude_none=False, headers={"ETag": "W/1"})
+    assert response.headers["ETag"] == "W/1"
+    assert response.headers["Content-Type"] == "application/json"
+    content = json.loads(response.body)
+    assert content["comment"] is None
+    assert content["nested"][0]["comment"] is None
@@ -1,7 +1,8 @@
 """
 Dataset is a complex resource, so they are tested separately.
 """
-
+import datetime
+import json
 from unittest.mock import Mock
 
 from sqlalchemy.engine import Engine
@@ -17,6 +18,8 @@ from database.model.dataset.checksum_algorithm import ChecksumAlgorithm
 from database.model.dataset.data_download import DataDownloadORM
 from database.model.dataset.dataset import Dataset
 from database.model.dataset.measured_value import MeasuredValueORM
+from database.model.general.keyword import Keyword
+from database.model.general.license import License
 from database.model.publication.publication import Publication
 
 
@@ -189,3 +192,104 @@ def test_delete(client: TestClient, engine: Engine, mocked_privileged_token: Moc
             assert len(instances) == n_expected, (
                 f"Number of {clz.__name__} should have been " f"{n_expected}"
             )
+
+
+def test_export_dcat_ap(client: TestClient, engine: Engine):
+    with Session(engine) as session:
+        session.add_all(
+            [
+                AIAssetTable(type="dataset"),
+                AIAssetTable(type="dataset"),
+                Dataset(
+                    identifier=1,
+                    name="1",
+                    platform="example",
+                    platform_identifier="1",
+                    description="description text",
+                    same_as="1",
+                    date_modified=datetime.datetime(2023, 1, 1),
+                ),
+                Dataset(
+                    identifier=2,
+                    name="2",
+                    platform="example",
+                    platform_identifier="2",
+                    description="description text",
+                    same_as="2",
+                    date_modified=datetime.datetime(2023, 2, 1),
+                ),
+            ]
+        )
+        session.commit()
+    response = client.get(
+        "/datasets/v0/export",
+        params={"schema": "dcat-ap", "modified_since": "2023-01-15T00:00:00"},
+    )
+    assert response.status_code == 200
+    (line,) = response.text.splitlines()
+    graph = json.loads(line)["@graph"]
+    assert graph[0]["@type"] == "dcat:Dataset"
+    assert graph[0]["@id"] == "2"
+
+
+def test_get_all_filters(client: TestClient, engine: Engine):
+    keyword = Keyword(name="vision")
+    with Session(engine) as session:
+        session.add_all(
+            [
+                AIAssetTable(type="dataset"),
+                AIAssetTable(type="dataset"),
+                AIAssetTable(type="dataset"),
+                Dataset(
+                    identifier=1,
+                    name="1",
+                    platform="example",
+                    platform_identifier="1",
+                    description="description text",
+                    same_as="1",
+                    date_modified=datetime.datetime(2023, 1, 1),
+                    keywords=[keyword],
+                    license=License(name="MIT"),
+                ),
+                Dataset(
+                    identifier=2,
+                    name="2",
+                    platform="example",
+                    platform_identifier="2",
+                    description="description text",
+                    same_as="2",
+                    date_modified=datetime.datetime(2023, 2, 1),
+                    keywords=[keyword],
+                ),
+                Dataset(
+                    identifier=3,
+                    name="3",
+                    platform="openml",
+                    platform_identifier="3",
+                    description="description text",
+                    same_as="3",
+                    date_modified=datetime.datetime(2023, 3, 1),
+                ),
+            ]
+        )
+        session.commit()
+
+    def identifiers(url: str, **params) -> list[int]:
+        response = client.get(url, params=params)
+        assert response.status_code == 200, response.json()
+        return [dataset["identifier"] for dataset in response.json()]
+
+    assert identifiers("/datasets/v0", keywords="vision") == [1, 2]
+    assert identifiers("/datasets/v0", keywords="unknown") == []
+    assert identifiers("/datasets/v0", license="MIT") == [1]
+    assert identifiers("/datasets/v0", name="2") == [2]
+    assert identifiers("/datasets/v0", date_modified_after="2023-02-01T00:00:00") == [2, 3]
+    assert identifiers(
+        "/datasets/v0",
+        date_modified_after="2023-01-01T00:00:00",
+        date_modified_before="2023-03-01T00:00:00",
+        keywords="vision",
+    ) == [1, 2]
+    assert identifiers("/datasets/v0", sort="-date_modified") == [3, 2, 1]
+    assert identifiers("/platforms/example/datasets/v0", sort="-date_modified") == [2, 1]
+    assert identifiers("/platforms/openml/datasets/v0", keywords="vision") == []
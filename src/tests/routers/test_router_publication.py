@@ -56,3 +56,28 @@ def test_happy_path(client: TestClient, engine: Engine, mocked_privileged_token:
 
     response = client.delete("/publications/v0/2", headers={"Authorization": "Fake token"})
     assert response.status_code == 200
+
+
+def test_citing_publication_modifies_dataset(
+    client: TestClient, engine: Engine, mocked_privileged_token: Mock
+):
+    keycloak_openid.userinfo = mocked_privileged_token
+    with Session(engine) as session:
+        dataset = Dataset(identifier=1, name="Cited", description="", same_as="")
+        session.add_all([AIAssetTable(type="dataset"), dataset])
+        session.commit()
+    etag = client.get("/datasets/v0/1").headers["etag"]
+
+    body = {"title": "A publication", "datasets": [1]}
+    response = client.post("/publications/v0", json=body, headers={"Authorization": "Fake token"})
+    assert response.status_code == 200, response.json()
+    response = client.get("/datasets/v0/1", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["citations"] == [2]
+    etag = response.headers["etag"]
+
+    response = client.delete("/publications/v0/2", headers={"Authorization": "Fake token"})
+    assert response.status_code == 200
+    response = client.get("/datasets/v0/1", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["citations"] == []
@@ -0,0 +1,45 @@
+"""
+The number of queries needed to retrieve a list of resources should not depend on the number of
+resources on the page: all relationships should be eagerly loaded.
+"""
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+from starlette.testclient import TestClient
+
+import routers
+from routers import ResourceRouter
+from tests.testutils.example_instances import example_instances
+
+
+def _count_queries(client: TestClient, engine: Engine, url: str) -> int:
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        response = client.get(url)
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+    assert response.status_code == 200, response.json()
+    return len(statements)
+
+
+@pytest.mark.parametrize(
+    "router", routers.resource_routers, ids=[r.resource_name for r in routers.resource_routers]
+)
+def test_get_all_constant_number_of_queries(
+    client: TestClient, engine: Engine, router: ResourceRouter
+):
+    with Session(engine) as session:
+        for instance in example_instances(router, n=5):
+            router.create_resource(session, instance)
+
+    url = f"/{router.resource_name_plural}/v{router.version}"
+    n_queries_single = _count_queries(client, engine, f"{url}?limit=1")
+    n_queries_page = _count_queries(client, engine, f"{url}?limit=5")
+    assert n_queries_page == n_queries_single
@@ -0,0 +1,134 @@
+import pytest
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+from starlette.testclient import TestClient
+
+from database.model.ai_asset_table import AIAssetTable
+from database.model.dataset.dataset import Dataset
+from database.model.general.keyword import Keyword
+
+
+@pytest.fixture
+def datasets(engine: Engine):
+    keyword = Keyword(name="vision")
+    with Session(engine) as session:
+        session.add_all(
+            [
+                AIAssetTable(type="dataset"),
+                AIAssetTable(type="dataset"),
+                AIAssetTable(type="dataset"),
+                Dataset(
+                    identifier=1,
+                    name="Traffic signs",
+                    platform="example",
+                    platform_identifier="1",
+                    description="Images of traffic signs.",
+                    same_as="1",
+                    keywords=[keyword],
+                ),
+                Dataset(
+                    identifier=2,
+                    name="Traffic",
+                    platform="openml",
+                    platform_identifier="2",
+                    description="Number of cars per hour.",
+                    same_as="2",
+                ),
+                Dataset(
+                    identifier=3,
+                    name="Iris",
+                    platform="openml",
+                    platform_identifier="3",
+                    description="Measurements of flowers.",
+                    same_as="3",
+                    keywords=[keyword],
+                ),
+            ]
+        )
+        session.commit()
+
+
+def test_search(client: TestClient, datasets):
+    response = client.get("/search/datasets/v0", params={"q": "traffic signs"})
+    assert response.status_code == 200, response.json()
+    assert [d["identifier"] for d in response.json()] == [1, 2]
+
+    response = client.get("/search/datasets/v0", params={"q": "flowers"})
+    assert [d["name"] for d in response.json()] == ["Iris"]
+
+
+def test_search_updated_resource(client: TestClient, engine: Engine, datasets):
+    with Session(engine) as session:
+        dataset = session.get(Dataset, 3)
+        assert dataset is not None
+        dataset.description = "Measurements of traffic."
+        session.commit()
+    response = client.get("/search/datasets/v0", params={"q": "flowers"})
+    assert response.json() == []
+    response = client.get("/search/datasets/v0", params={"q": "traffic"})
+    assert {d["identifier"] for d in response.json()} == {1, 2, 3}
+
+
+def test_search_special_characters(client: TestClient, datasets):
+    response = client.get("/search/datasets/v0", params={"q": 'traffic" OR (NEAR'})
+    assert response.status_code == 200, response.json()
+    assert {d["identifier"] for d in response.json()} == {1, 2}
+
+
+def test_search_filters(client: TestClient, datasets):
+    response = client.get("/search/datasets/v0", params={"q": "traffic", "platform": "openml"})
+    assert [d["identifier"] for d in response.json()] == [2]
+    response = client.get("/search/datasets/v0", params={"q": "traffic", "keyword": "vision"})
+    assert [d["identifier"] for d in response.json()] == [1]
+
+
+def test_search_pagination(client: TestClient, datasets):
+    response = client.get("/search/datasets/v0", params={"q": "traffic", "offset": 1, "limit": 1})
+    assert [d["identifier"] for d in response.json()] == [2]
+
+
+def test_search_schema(client: TestClient, datasets):
+    response = client.get("/search/datasets/v0", params={"q": "flowers", "schema": "schema.org"})
+    assert response.status_code == 200, response.json()
+    (dataset,) = response.json()
+    assert dataset["@type"] == "Dataset"
+    assert dataset["name"] == "Iris"
+
+
+@pytest.mark.parametrize(
+    "params,detail",
+    [
+        ({"q": " "}, "The search query should not be empty."),
+        ({"q": "traffic", "platform": "unknown"}, "platform 'unknown' not recognized."),
+        ({"q": "traffic", "schema": "unknown"}, None),
+    ],
+)
+def test_search_invalid(client: TestClient, datasets, params: dict, detail: str | None):
+    response = client.get("/search/datasets/v0", params=params)
+    assert response.status_code in (400, 422), response.json()
+    if detail is not None:
+        assert response.json()["detail"] == detail
+
+
+def test_search_keyword_unsupported(client: TestClient, engine: Engine):
+    response = client.get("/search/events/v0", params={"q": "conference", "keyword": "ai"})
+    assert response.status_code == 400, response.json()
+    assert response.json()["detail"] == "The events cannot be filtered on keyword."
+
+
+@pytest.mark.parametrize(
+    "resource",
+    [
+        "datasets",
+        "publications",
+        "news",
+        "educational_resources",
+        "events",
+        "projects",
+        "case_studies",
+    ],
+)
+def test_search_available(client: TestClient, engine: Engine, resource: str):
+    response = client.get(f"/search/{resource}/v0", params={"q": "example"})
+    assert response.status_code == 200, response.json()
+    assert response.json() == []
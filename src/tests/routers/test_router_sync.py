@@ -0,0 +1,53 @@
+from unittest.mock import Mock
+
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+from starlette.testclient import TestClient
+
+from authentication import keycloak_openid
+from database.model.sync_job import SyncJob, SyncJobStatus
+
+HEADERS = {"Authorization": "Fake token"}
+
+
+def test_create_and_cancel(client: TestClient, engine: Engine, mocked_privileged_token: Mock):
+    keycloak_openid.userinfo = mocked_privileged_token
+    body = {"connectors": ["openml/dataset", "zenodo/dataset"], "limit": 10}
+    response = client.post("/sync/jobs", json=body, headers=HEADERS)
+    assert response.status_code == 200, response.json()
+    job = response.json()
+    assert job["status"] == "queued"
+    assert job["connectors"] == ["openml/dataset", "zenodo/dataset"]
+
+    response = client.get("/sync/jobs", headers=HEADERS)
+    assert [j["identifier"] for j in response.json()] == [job["identifier"]]
+
+    response = client.post(f"/sync/jobs/{job['identifier']}/cancel", headers=HEADERS)
+    assert response.json()["status"] == "cancelled"
+    response = client.post(f"/sync/jobs/{job['identifier']}/cancel", headers=HEADERS)
+    assert response.status_code == 409, response.json()
+
+
+def test_cancel_running(client: TestClient, engine: Engine, mocked_privileged_token: Mock):
+    keycloak_openid.userinfo = mocked_privileged_token
+    with Session(engine) as session:
+        session.add(SyncJob(connectors=["openml/dataset"], status=SyncJobStatus.running))
+        session.commit()
+    response = client.post("/sync/jobs/1/cancel", headers=HEADERS)
+    assert response.json()["status"] == "running"
+    assert response.json()["cancel_requested"]
+
+
+def test_unauthorized(client: TestClient, engine: Engine, mocked_token: Mock):
+    keycloak_openid.userinfo = mocked_token
+    response = client.post("/sync/jobs", json={"connectors": ["openml/dataset"]}, headers=HEADERS)
+    assert response.status_code == 403, response.json()
+
+
+def test_errors(client: TestClient, engine: Engine, mocked_privileged_token: Mock):
+    keycloak_openid.userinfo = mocked_privileged_token
+    response = client.post("/sync/jobs", json={"connectors": ["unknown/x"]}, headers=HEADERS)
+    assert response.status_code == 400, response.json()
+    assert response.json()["detail"].startswith("Unknown connector(s) unknown/x")
+    response = client.get("/sync/jobs/42", headers=HEADERS)
+    assert response.status_code == 404, response.json()
@@ -0,0 +1,105 @@
+import time
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy.engine import Engine
+from starlette.testclient import TestClient
+
+from authentication import keycloak_openid, token_validator
+from tests.testutils.stub_issuer import StubIssuer
+
+
+@pytest.fixture
+def issuer(monkeypatch) -> StubIssuer:
+    issuer = StubIssuer(token_validator.issuer)
+    monkeypatch.setattr(keycloak_openid, "certs", Mock(side_effect=issuer.jwks))
+    return issuer
+
+
+def _delete(client: TestClient, token: str):
+    return client.delete("/test_resources/v0/1", headers={"Authorization": f"Bearer {token}"})
+
+
+def test_userinfo_cached_per_token(
+    client_test_resource: TestClient,
+    engine_test_resource_filled: Engine,
+    issuer: StubIssuer,
+    mocked_privileged_token: Mock,
+):
+    keycloak_openid.userinfo = mocked_privileged_token
+    token = issuer.token()
+    assert _delete(client_test_resource, token).status_code == 200
+    assert _delete(client_test_resource, token).status_code == 404
+    assert mocked_privileged_token.call_count == 1
+    assert keycloak_openid.certs.call_count == 1
+
+    assert _delete(client_test_resource, issuer.token(sub="other-user")).status_code == 404
+    assert mocked_privileged_token.call_count == 2
+    assert keycloak_openid.certs.call_count == 1
+
+
+def test_invalid_signature(
+    client_test_resource: TestClient, issuer: StubIssuer, mocked_privileged_token: Mock
+):
+    keycloak_openid.userinfo = mocked_privileged_token
+    forged = StubIssuer(token_validator.issuer)
+    forged.kid = issuer.kid
+    response = _delete(client_test_resource, forged.token())
+    assert response.status_code == 401, response.json()
+    assert response.json()["detail"].startswith("Invalid authentication token")
+    mocked_privileged_token.assert_not_called()
+
+
+def test_other_issuer(
+    client_test_resource: TestClient, issuer: StubIssuer, mocked_privileged_token: Mock
+):
+    keycloak_openid.userinfo = mocked_privileged_token
+    other_realm = issuer.token(iss="https://test.openml.org/aiod-auth/realms/other")
+    response = _delete(client_test_resource, other_realm)
+    assert response.status_code == 401, response.json()
+    mocked_privileged_token.assert_not_called()
+
+
+def test_expired_token(
+    client_test_resource: TestClient, issuer: StubIssuer, mocked_privileged_token: Mock
+):
+    keycloak_openid.userinfo = mocked_privileged_token
+    response = _delete(client_test_resource, issuer.token(expires_in=-10))
+    assert response.status_code == 401, response.json()
+    mocked_privileged_token.assert_not_called()
+
+
+def test_cache_bounded_by_expiry(
+    client_test_resource: TestClient,
+    engine_test_resource_filled: Engine,
+    issuer: StubIssuer,
+    mocked_privileged_token: Mock,
+    monkeypatch,
+):
+    keycloak_openid.userinfo = mocked_privileged_token
+    token = issuer.token(expires_in=10)
+    assert _delete(client_test_resource, token).status_code == 200
+    assert _delete(client_test_resource, token).status_code == 404
+    assert mocked_privileged_token.call_count == 1
+
+    # The cached userinfo expires with the token, even though the cache TTL is longer
+    monkeypatch.setattr(time, "time", Mock(return_value=time.time() + 11))
+    _delete(client_test_resource, token)
+    assert mocked_privileged_token.call_count == 2
+
+
+def test_key_rotation(
+    client_test_resource: TestClient,
+    engine_test_resource_filled: Engine,
+    issuer: StubIssuer,
+    mocked_privileged_token: Mock,
+    monkeypatch,
+):
+    keycloak_openid.userinfo = mocked_privileged_token
+    assert _delete(client_test_resource, issuer.token()).status_code == 200
+
+    rotated = StubIssuer(token_validator.issuer)
+    monkeypatch.setattr(keycloak_openid, "certs", Mock(side_effect=rotated.jwks))
+    monkeypatch.setattr(token_validator, "jwks_refresh_interval_seconds", 0)
+    assert _delete(client_test_resource, rotated.token()).status_code == 404
+    assert keycloak_openid.certs.call_count == 1
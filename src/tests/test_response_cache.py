@@ -0,0 +1,71 @@
+import time
+
+import pytest
+
+from response_cache import LRUCacheBackend, RedisCacheBackend, ResponseCache
+from tests.testutils.fake_redis import FakeRedis
+
+
+@pytest.fixture(params=["memory", "redis"])
+def cache(request) -> ResponseCache:
+    if request.param == "memory":
+        return ResponseCache(LRUCacheBackend(max_size=10, ttl_seconds=60))
+    return ResponseCache(RedisCacheBackend(FakeRedis(), ttl_seconds=60))
+
+
+def test_get_set(cache: ResponseCache):
+    assert cache.get("dataset", 1, "aiod", "v0/1") is None
+    cache.set("dataset", 1, "aiod", "v0/1", b'{"identifier": 1}')
+    cache.set("dataset", 1, "dcat-ap", "v0/1", b'{"@graph": []}')
+
+    assert cache.get("dataset", 1, "aiod", "v0/1") == b'{"identifier": 1}'
+    assert cache.get("dataset", 1, "dcat-ap", "v0/1") == b'{"@graph": []}'
+    assert cache.get("dataset", 1, "aiod", "v0/2") is None
+    assert cache.get("dataset", 2, "aiod", "v0/1") is None
+    assert cache.get("publication", 1, "aiod", "v0/1") is None
+    assert cache.statistics()["hits"] == 2
+    assert cache.statistics()["misses"] == 4
+
+
+def test_invalidate(cache: ResponseCache):
+    cache.set("dataset", 1, "aiod", "v0/1", b"1")
+    cache.set("dataset", 1, "dcat-ap", "v0/1", b"1")
+    cache.set("dataset", 11, "aiod", "v0/1", b"11")
+    cache.invalidate("dataset", 1)
+    assert cache.get("dataset", 1, "aiod", "v0/1") is None
+    assert cache.get("dataset", 1, "dcat-ap", "v0/1") is None
+    assert cache.get("dataset", 11, "aiod", "v0/1") == b"11"
+
+    cache.clear()
+    assert cache.get("dataset", 11, "aiod", "v0/1") is None
+    assert cache.statistics()["hits"] == 0
+    assert cache.statistics()["misses"] == 1
+
+
+def test_lru_max_size():
+    cache = ResponseCache(LRUCacheBackend(max_size=2, ttl_seconds=60))
+    cache.set("dataset", 1, "aiod", "v0/1", b"1")
+    cache.set("dataset", 2, "aiod", "v0/1", b"2")
+    cache.get("dataset", 1, "aiod", "v0/1")
+    cache.set("dataset", 3, "aiod", "v0/1", b"3")
+    assert cache.get("dataset", 1, "aiod", "v0/1") == b"1"
+    assert cache.get("dataset", 2, "aiod", "v0/1") is None
+    assert cache.get("dataset", 3, "aiod", "v0/1") == b"3"
+    assert len(cache.backend) == 2
+
+
+def test_ttl(cache: ResponseCache, monkeypatch: pytest.MonkeyPatch):
+    cache.set("dataset", 1, "aiod", "v0/1", b"1")
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 61)
+    assert cache.get("dataset", 1, "aiod", "v0/1") is None
+
+
+def test_ttl_not_extended(cache: ResponseCache, monkeypatch: pytest.MonkeyPatch):
+    now = time.monotonic()
+    cache.set("dataset", 1, "aiod", "v0/1", b"1")
+    monkeypatch.setattr(time, "monotonic", lambda: now + 40)
+    cache.set("dataset", 1, "dcat-ap", "v0/1", b"1")
+    monkeypatch.setattr(time, "monotonic", lambda: now + 61)
+    assert cache.get("dataset", 1, "aiod", "v0/1") is None
+    assert cache.get("dataset", 1, "dcat-ap", "v0/1") is None
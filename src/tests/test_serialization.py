@@ -0,0 +1,118 @@
+import datetime
+import decimal
+from typing import List
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, SQLModel, select
+
+import routers
+from database.model.dataset.dataset import Dataset
+from routers import ResourceRouter
+from serialization import AttributeSerializer, compile_serializer, create_getter_dict
+from tests.testutils.example_instances import example_instances
+
+
+def _from_orm(model, orm_object) -> dict:
+    return jsonable_encoder(model.from_orm(orm_object), exclude_none=True)
+
+
+@pytest.mark.parametrize(
+    "router", routers.resource_routers, ids=[r.resource_name for r in routers.resource_routers]
+)
+def test_compiled_serializer_equals_from_orm(engine: Engine, router: ResourceRouter):
+    with Session(engine) as session:
+        for instance in example_instances(router, n=2):
+            router.create_resource(session, instance)
+
+    with Session(engine) as session:
+        query = select(router.resource_class).options(*router.resource_loader_options)
+        resources = session.scalars(query).all()
+        assert len(resources) > 0
+        for resource in resources:
+            expected = _from_orm(router.resource_class_read, resource)
+            assert router.resource_serializer(resource) == expected
+
+
+def test_compiled_serializer_dataset(dataset: Dataset):
+    (router,) = [r for r in routers.resource_routers if r.resource_class == Dataset]
+    serialized = router.resource_serializer(dataset)
+    assert serialized == _from_orm(router.resource_class_read, dataset)
+    assert serialized["license"] == "license.name"
+    assert serialized["distributions"][0]["checksum"] == [{"algorithm": "md5", "value": "md5hash"}]
+    assert serialized["date_published"] == "2001-01-01T08:00:00"
+
+
+class Named(SQLModel):
+    name: str
+
+
+class Model(SQLModel):
+    identifier: int
+    amount: decimal.Decimal | None = None
+    moment: datetime.datetime | None = None
+    names: List[str] = []
+    owner: str | None = None
+
+    class Config:
+        orm_mode = True
+        getter_dict = create_getter_dict(
+            {"names": AttributeSerializer("name"), "owner": AttributeSerializer("name")}
+        )
+
+
+class OrmObject:
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+def test_compiled_serializer_coerces_like_pydantic():
+    orm_object = OrmObject(
+        identifier="5",
+        amount=decimal.Decimal("1.5"),
+        moment=datetime.datetime(2023, 1, 2, 3, 4, 5),
+        names=[Named(name="a"), Named(name="b")],
+        owner=None,
+    )
+    serialize = compile_serializer(Model)
+    assert serialize(orm_object) == _from_orm(Model, orm_object)
+    assert serialize(orm_object) == {
+        "identifier": 5,
+        "amount": 1.5,
+        "moment": "2023-01-02T03:04:05",
+        "names": ["a", "b"],
+    }
+
+
+def test_compiled_serializer_including_none():
+    orm_object = OrmObject(identifier=1, amount=None, moment=None, names=[], owner=None)
+    serialize = compile_serializer(Model, exclude_none=False)
+    assert serialize(orm_object) == jsonable_encoder(Model.from_orm(orm_object))
+    assert serialize(orm_object)["owner"] is None
+
+
+class Amounts(SQLModel):
+    whole: decimal.Decimal
+    fraction: decimal.Decimal
+    exponent: decimal.Decimal
+    trailing_zero: decimal.Decimal
+    amounts: List[decimal.Decimal] = []
+
+    class Config:
+        orm_mode = True
+
+
+def test_compiled_serializer_decimal_like_pydantic():
+    orm_object = OrmObject(
+        whole=decimal.Decimal("5"),
+        fraction=decimal.Decimal("0.25"),
+        exponent=decimal.Decimal("1E+2"),
+        trailing_zero=decimal.Decimal("5.0"),
+        amounts=[decimal.Decimal("3"), decimal.Decimal("3.5"), 4],
+    )
+    serialized = compile_serializer(Amounts)(orm_object)
+    assert serialized == _from_orm(Amounts, orm_object)
+    types = {key: type(value) for key, value in serialized.items() if key != "amounts"}
+    assert types == {"whole": int, "fraction": float, "exponent": int, "trailing_zero": float}
+    assert serialized["amounts"] == [3, 3.5, 4]
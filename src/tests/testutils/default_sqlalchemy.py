@@ -5,14 +5,19 @@ from typing import Iterator
 import pytest
 from fastapi import FastAPI
 from sqlalchemy import event, text
+from sqlalchemy.dialects.sqlite.aiosqlite import AsyncAdapt_aiosqlite_connection
 from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlmodel import create_engine, SQLModel, Session
 from starlette.testclient import TestClient
 
+from authentication import token_validator
+from database import counts
 from database.model import AIAssetTable
 from database.model.platform.platform import Platform
 from database.model.platform.platform_names import PlatformName
 from main import add_routes
+from response_cache import response_cache
 from tests.testutils.test_resource import RouterTestResource, TestResource
 from unittest.mock import Mock
 
@@ -35,6 +40,9 @@ def clear_db(request):
     This fixture will be used by every test and checks if the test uses an engine.
     If it does, it deletes the content of the database, so the test has a fresh db to work with.
     """
+    counts.clear()
+    response_cache.clear()
+    token_validator.clear()
 
     for engine_name in ("engine", "engine_test_resource", "engine_test_resource_filled"):
         if engine_name in request.fixturenames:
@@ -68,7 +76,7 @@ def sqlite_enable_foreign_key_constraints(dbapi_connection, connection_record):
     """
     On default, sqlite disables foreign key constraints
     """
-    if isinstance(dbapi_connection, sqlite3.Connection):
+    if isinstance(dbapi_connection, (sqlite3.Connection, AsyncAdapt_aiosqlite_connection)):
         cursor = dbapi_connection.cursor()
         cursor.execute("PRAGMA foreign_keys=ON")
         cursor.close()
@@ -109,6 +117,27 @@ def client_test_resource(engine_test_resource) -> TestClient:
     return TestClient(app)
 
 
+def _async_engine(engine: Engine) -> AsyncEngine:
+    """An AsyncEngine (using aiosqlite) on the same temporary sqlite file as the engine"""
+    return create_async_engine(f"sqlite+aiosqlite:///{engine.url.database}")
+
+
+@pytest.fixture(scope="session")
+def client_async(engine: Engine) -> TestClient:
+    """A TestClient of the application, serving the resource endpoints asynchronously"""
+    app = FastAPI()
+    add_routes(app, engine, async_engine=_async_engine(engine))
+    return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def client_test_resource_async(engine_test_resource: Engine) -> TestClient:
+    """A TestClient including asynchronous routes to the TestResource"""
+    app = FastAPI()
+    app.include_router(RouterTestResource().create(_async_engine(engine_test_resource), ""))
+    return TestClient(app)
+
+
 @pytest.fixture()
 def mocked_token() -> Mock:
     default_user = {
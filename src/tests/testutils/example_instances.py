@@ -0,0 +1,47 @@
+"""
+Instances of the resource_class_create of a router, based on the example data, to fill a
+database with any number of resources of every router.
+"""
+
+from sqlalchemy import UniqueConstraint
+from sqlmodel import SQLModel
+
+import connectors
+from connectors.resource_with_relations import ResourceWithRelations
+from database.model.platform.platform import Platform
+from routers import ResourceRouter
+
+
+def example_instance(router: ResourceRouter) -> SQLModel:
+    """An instance of the resource_class_create of this router, based on the example data"""
+    if router.resource_class == Platform:
+        return router.resource_class_create(name="example_platform")
+    (connector,) = [
+        c
+        for c in connectors.example_connectors.values()
+        if c.resource_class == router.resource_class
+    ]
+    item = next(iter(connector.fetch_all(limit=1)))
+    return item.resource if isinstance(item, ResourceWithRelations) else item
+
+
+def example_instances(router: ResourceRouter, n: int) -> list[SQLModel]:
+    """n copies of the example instance of this router, with unique values where needed"""
+    table = router.resource_class.__table__
+    unique_columns = {c.name for c in table.columns if c.unique} | {
+        column.name
+        for constraint in table.constraints
+        if isinstance(constraint, UniqueConstraint)
+        for column in constraint.columns
+    }
+    instance = example_instance(router)
+    return [
+        instance.copy(
+            update={
+                name: f"{getattr(instance, name)}_{i}"
+                for name in unique_columns - {"platform"}
+                if isinstance(getattr(instance, name, None), str)
+            }
+        )
+        for i in range(n)
+    ]
@@ -0,0 +1,56 @@
+"""
+In-memory stand-in for a Redis client, implementing only the commands used by the
+RedisCacheBackend.
+"""
+import fnmatch
+import time
+
+
+class FakeRedis:
+    def __init__(self):
+        self._hashes: dict[str, dict[str, bytes]] = {}
+        self._expiry: dict[str, float] = {}
+
+    def hget(self, name: str, key: str) -> bytes | None:
+        self._expire_if_needed(name)
+        return self._hashes.get(name, {}).get(key)
+
+    def hset(self, name: str, key: str, value: bytes) -> int:
+        self._expire_if_needed(name)
+        hash_ = self._hashes.setdefault(name, {})
+        is_new = key not in hash_
+        hash_[key] = value
+        return int(is_new)
+
+    def expire(self, name: str, seconds: int) -> bool:
+        if name not in self._hashes:
+            return False
+        self._expiry[name] = time.monotonic() + seconds
+        return True
+
+    def ttl(self, name: str) -> int:
+        """-2 if the key does not exist, -1 if it does not expire"""
+        self._expire_if_needed(name)
+        if name not in self._hashes:
+            return -2
+        if name not in self._expiry:
+            return -1
+        return int(self._expiry[name] - time.monotonic())
+
+    def delete(self, *names: str) -> int:
+        deleted = 0
+        for name in names:
+            self._expiry.pop(name, None)
+            deleted += int(self._hashes.pop(name, None) is not None)
+        return deleted
+
+    def scan_iter(self, match: str = "*"):
+        for name in list(self._hashes):
+            self._expire_if_needed(name)
+            if name in self._hashes and fnmatch.fnmatchcase(name, match):
+                yield name
+
+    def _expire_if_needed(self, name: str):
+        expiry = self._expiry.get(name)
+        if expiry is not None and time.monotonic() >= expiry:
+            self.delete(name)
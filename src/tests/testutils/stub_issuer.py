@@ -0,0 +1,39 @@
+import time
+import uuid
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jwt
+
+
+class StubIssuer:
+    """
+    A local stand-in for the Keycloak realm, issuing signed JWTs and publishing the public keys
+    as JWKS (the response of `keycloak_openid.certs()`).
+    """
+
+    def __init__(self, issuer: str):
+        self.issuer = issuer
+        self.kid = str(uuid.uuid4())
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        self._private_key = private_key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.TraditionalOpenSSL,
+            encryption_algorithm=serialization.NoEncryption(),
+        ).decode("utf-8")
+
+    def jwks(self) -> dict:
+        key = jwk.construct(self._private_key, "RS256")
+        public_key = key.public_key().to_dict()  # type: ignore[attr-defined]  # an RSAKey
+        return {"keys": [{**public_key, "kid": self.kid, "use": "sig", "alg": "RS256"}]}
+
+    def token(self, expires_in: float = 300, **claims) -> str:
+        now = int(time.time())
+        payload = {
+            "iss": self.issuer,
+            "iat": now,
+            "exp": now + int(expires_in),
+            "sub": "test-user",
+            **claims,
+        }
+        return jwt.encode(payload, self._private_key, algorithm="RS256", headers={"kid": self.kid})
@@ -7,6 +7,7 @@ from typing import Type
 from sqlmodel import Field
 
 from database.model.resource import Resource
+from database.model.row_version import RowVersion
 from routers import ResourceRouter
 
 
@@ -14,7 +15,7 @@ class TestResourceBase(Resource):
     title: str = Field(max_length=250, nullable=False, unique=True)
 
 
-class TestResource(TestResourceBase, table=True):  # type: ignore [call-arg]
+class TestResource(TestResourceBase, RowVersion, table=True):  # type: ignore [call-arg]
     identifier: int = Field(default=None, primary_key=True)
 
 